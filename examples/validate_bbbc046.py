@@ -20,11 +20,12 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from fluotrack import BrightnessTracker, DataLogger, BrightnessAnalyzer
+from fluotrack.sources import TiffSource
 
 
 def load_tiff_sequence(filepath):
     """
-    Load a TIFF sequence file.
+    Open a TIFF sequence file for lazy, frame-by-frame reading.
     
     Parameters
     ----------
@@ -33,12 +34,12 @@ def load_tiff_sequence(filepath):
         
     Returns
     -------
-    np.ndarray
-        Image stack with shape (frames, height, width) or (frames, z, height, width)
+    TiffSource
+        Memory-mapped source yielding frames of shape (height, width);
+        z-stacks are max-projected per frame
     """
     try:
-        import tifffile
-        return tifffile.imread(filepath)
+        return TiffSource(filepath)
     except ImportError:
         print("Error: tifffile not installed. Install with: pip install tifffile")
         return None
@@ -56,20 +57,13 @@ def preprocess_frame(frame):
     Returns
     -------
     np.ndarray
-        Preprocessed 2D frame in uint8
+        Preprocessed 2D frame in its original dtype. The trackers work on
+        uint16 directly, so the full camera dynamic range is kept.
     """
     # If 3D (z-stack), take max projection
     if len(frame.shape) == 3:
         frame = np.max(frame, axis=0)
     
-    # Normalize to 8-bit
-    if frame.dtype != np.uint8:
-        if frame.max() > 0:
-            frame = ((frame - frame.min()) / (frame.max() - frame.min()) * 255)
-        else:
-            frame = np.zeros_like(frame)
-        frame = frame.astype(np.uint8)
-    
     return frame
 
 
@@ -94,18 +88,15 @@ def process_sequence(sequence_path, output_dir, sequence_id):
     print(f"\nProcessing: {sequence_path.name}")
     print("=" * 60)
     
-    # Load sequence
-    stack = load_tiff_sequence(sequence_path)
-    if stack is None:
+    # Open sequence (frames are read lazily)
+    source = load_tiff_sequence(sequence_path)
+    if source is None:
         return None, None
     
-    print(f"Loaded stack shape: {stack.shape}")
-    print(f"Data type: {stack.dtype}")
-    print(f"Value range: [{stack.min()}, {stack.max()}]")
+    print(f"Stack shape: {source.shape}")
+    print(f"Data type: {source.dtype}")
     
-    # Get first frame to determine dimensions
-    first_frame = preprocess_frame(stack[0])
-    height, width = first_frame.shape
+    height, width = source.shape[-2:]
     
     # Initialize tracker
     bbox = (0, 0, width, height)
@@ -117,11 +108,11 @@ def process_sequence(sequence_path, output_dir, sequence_id):
     logger = DataLogger(seq_output_dir, prefix=f'validation_{sequence_id}')
     
     # Process frames
-    n_frames = stack.shape[0]
+    n_frames = len(source)
     results = []
     
-    for i in range(n_frames):
-        frame = preprocess_frame(stack[i])
+    for i, item in enumerate(source):
+        frame = preprocess_frame(item.data)
         
         # Track brightest point
         result = tracker.find_brightest_point(frame)
@@ -133,12 +124,13 @@ def process_sequence(sequence_path, output_dir, sequence_id):
                   f"Position ({result['location'][0]}, {result['location'][1]}), "
                   f"Brightness {result['intensity']:.1f}")
     
+    source.close()
     print(f"✓ Completed {n_frames} frames")
     print(f"  Data saved to: {logger.filename}")
     
     return logger.filename, {
         'n_frames': n_frames,
-        'shape': stack.shape,
+        'shape': source.shape,
         'results': results
     }
 
@@ -12,11 +12,28 @@ import numpy as np
 import pandas as pd
 from pathlib import Path
 import matplotlib.pyplot as plt
-from scipy.optimize import curve_fit
 from fluotrack import BrightnessTracker, DataLogger, BrightnessAnalyzer
+from fluotrack.analysis import fit_photobleaching
+from fluotrack.sources import Frame, FrameSource, ImageDirectorySource, PrefetchingSource
 import time
 
 
+class SkipUnreadable(FrameSource):
+    """Yield frames without data instead of failing on unreadable files"""
+
+    def __init__(self, source):
+        self.source = source
+
+    def __len__(self):
+        return len(self.source)
+
+    def read(self, index):
+        try:
+            return self.source.read(index)
+        except IOError:
+            return Frame(index=index, timestamp=float('nan'), data=None)
+
+
 class FluoTrackValidator:
     """Validate FluoTrack on public datasets"""
     
@@ -35,8 +52,8 @@ class FluoTrackValidator:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Load frames
-        self.frames = sorted(self.dataset_path.glob("*.tif"))
+        # Frames are decoded lazily, one at a time
+        self.frames = ImageDirectorySource(self.dataset_path, pattern="*.tif")
         print(f"Found {len(self.frames)} frames in {dataset_path}")
         
     def run_tracking(self):
@@ -48,16 +65,21 @@ class FluoTrackValidator:
         results = []
         processing_times = []
         
-        for i, frame_path in enumerate(self.frames):
-            start_time = time.time()
-            
-            # Load frame
-            frame = cv2.imread(str(frame_path), cv2.IMREAD_GRAYSCALE)
+        # Decode upcoming frames in the background while tracking, so
+        # processing times below no longer include decoding
+        loop_start = time.time()
+        frames = PrefetchingSource(SkipUnreadable(self.frames), n_workers=4)
+        for item in frames:
+            i = item.index
+            frame_path = self.frames.paths[i]
+            frame = item.data
             
             if frame is None:
                 print(f"Warning: Could not read {frame_path}")
                 continue
             
+            start_time = time.time()
+            
             # Apply Gaussian blur (matching FluoTrack preprocessing)
             denoised = cv2.GaussianBlur(frame, (5, 5), 0)
             
@@ -79,6 +101,7 @@ class FluoTrackValidator:
             if (i + 1) % 10 == 0:
                 print(f"Processed {i+1}/{len(self.frames)} frames...")
         
+        elapsed = time.time() - loop_start
         self.results_df = pd.DataFrame(results)
         
         # Calculate FPS
@@ -86,8 +109,11 @@ class FluoTrackValidator:
         fps = 1.0 / avg_time if avg_time > 0 else 0
         
         print(f"\n✓ Tracking complete!")
-        print(f"  Average processing time: {avg_time*1000:.2f} ms/frame")
+        print(f"  Average processing time: {avg_time*1000:.2f} ms/frame "
+              f"(excluding background decoding)")
         print(f"  Average FPS: {fps:.1f}")
+        print(f"  End-to-end rate: {len(results) / elapsed:.1f} frames/s "
+              f"(including decoding)")
         
         return self.results_df
     
@@ -107,25 +133,13 @@ class FluoTrackValidator:
             print("  Photobleaching detected!")
             
             # Fit exponential decay: I(t) = A * exp(-k*t) + C
-            def exp_decay(t, A, k, C):
-                return A * np.exp(-k * t) + C
+            fit = fit_photobleaching(brightness, frames)
             
-            try:
-                # Initial guess
-                p0 = [brightness[0] - brightness[-1], 0.01, brightness[-1]]
-                
-                # Fit
-                popt, pcov = curve_fit(exp_decay, frames, brightness, p0=p0)
-                A, k, C = popt
-                
-                # Calculate half-life
-                half_life = np.log(2) / k if k > 0 else np.inf
-                
-                # Calculate R²
-                fitted = exp_decay(frames, *popt)
-                ss_res = np.sum((brightness - fitted) ** 2)
-                ss_tot = np.sum((brightness - np.mean(brightness)) ** 2)
-                r_squared = 1 - (ss_res / ss_tot)
+            if fit['converged'][0]:
+                A, k, C = fit['amplitude'][0], fit['rate'][0], fit['plateau'][0]
+                half_life = fit['half_life'][0]
+                r_squared = fit['r_squared'][0]
+                fitted = A * np.exp(-k * (frames - frames[0])) + C
                 
                 print(f"  Exponential decay fit:")
                 print(f"    Half-life: {half_life:.1f} frames")
@@ -140,8 +154,8 @@ class FluoTrackValidator:
                     'fitted_curve': fitted
                 }
                 
-            except Exception as e:
-                print(f"  Could not fit exponential decay: {e}")
+            else:
+                print("  Could not fit exponential decay")
                 return {'detected': True, 'half_life': None}
         else:
             print("  No significant photobleaching detected")
@@ -3,20 +3,67 @@ FluoTrack: Fluorescence Brightness Tracking for Microscopy
 
 A Python package for real-time tracking and analysis of fluorescent protein
 brightness in microscopy images.
+
+Public names and submodules are imported on first access, so
+``import fluotrack`` is cheap and a worker that only needs, say,
+``fluotrack.enhanced_tracker`` never loads the GUI (tkinter) or the
+plotting and table libraries.
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 __version__ = "0.1.0"
 __author__ = "Dongqi Liu"
 __email__ = "dongql@unc.edu"
 
-from .tracker import BrightnessTracker, RegionSelector
-from .analysis import DataLogger, BrightnessAnalyzer
-from .app import FluoTrackApp
-
-__all__ = [
-    "BrightnessTracker",
-    "RegionSelector",
-    "DataLogger",
-    "BrightnessAnalyzer",
-    "FluoTrackApp",
-]
+# Public name -> submodule defining it
+_LAZY_ATTRIBUTES = {
+    "BrightnessTracker": "tracker",
+    "RegionSelector": "tracker",
+    "DataLogger": "analysis",
+    "BrightnessAnalyzer": "analysis",
+    "FluoTrackApp": "app",
+}
+
+_SUBMODULES = (
+    "analysis",
+    "app",
+    "batch",
+    "bleaching",
+    "capture",
+    "cli",
+    "clock",
+    "enhanced_tracker",
+    "matching",
+    "pipeline",
+    "sources",
+    "track_store",
+    "tracker",
+    "tracker_enhanced",
+)
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+if TYPE_CHECKING:
+    from .analysis import BrightnessAnalyzer, DataLogger
+    from .app import FluoTrackApp
+    from .tracker import BrightnessTracker, RegionSelector
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__)
+        value = getattr(module, name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Cache, so __getattr__ runs once per name
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | set(_SUBMODULES))
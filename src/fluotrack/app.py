@@ -9,6 +9,7 @@ import tkinter as tk
 from typing import Optional
 from .tracker import BrightnessTracker, RegionSelector
 from .analysis import DataLogger
+from .pipeline import AcquisitionPipeline
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +22,9 @@ class FluoTrackApp:
     and running real-time brightness analysis.
     """
 
+    # Maximum refresh rate of the live view; tracking runs at its own pace
+    DISPLAY_FPS = 30.0
+
     def __init__(self):
         """Initialize the application"""
         self.root = tk.Tk()
@@ -28,7 +32,7 @@ class FluoTrackApp:
 
         # Center window
         window_width = 350
-        window_height = 250
+        window_height = 280
         screen_width = self.root.winfo_screenwidth()
         screen_height = self.root.winfo_screenheight()
         center_x = int(screen_width / 2 - window_width / 2)
@@ -41,6 +45,9 @@ class FluoTrackApp:
         # Output directory
         self.output_dir = tk.StringVar(value=".")
 
+        # Auto-stop once brightness bleaches below this percentage (blank = off)
+        self.bleach_stop = tk.StringVar(value="")
+
         self._setup_gui()
 
         # Initialize components
@@ -88,6 +95,15 @@ class FluoTrackApp:
             side="left"
         )
 
+        # Photobleaching auto-stop
+        stop_frame = tk.Frame(self.root)
+        stop_frame.pack(pady=5, padx=20, fill="x")
+
+        tk.Label(stop_frame, text="Stop below brightness (%):").pack(side="left")
+        tk.Entry(stop_frame, textvariable=self.bleach_stop, width=6).pack(
+            side="left", padx=5
+        )
+
         # Buttons
         button_frame = tk.Frame(self.root)
         button_frame.pack(pady=15)
@@ -116,6 +132,21 @@ class FluoTrackApp:
 
     def _start_tracking(self):
         """Start the tracking process"""
+        from tkinter import messagebox
+
+        bleach_stop = self.bleach_stop.get().strip()
+        try:
+            bleach_stop_fraction = float(bleach_stop) / 100.0 if bleach_stop else None
+        except ValueError:
+            bleach_stop_fraction = float("nan")
+        if bleach_stop_fraction is not None and not 0.0 < bleach_stop_fraction < 1.0:
+            messagebox.showerror(
+                "Invalid bleach stop",
+                "Stop below brightness must be a percentage between 0 and 100, "
+                "or blank to disable it.",
+            )
+            return
+
         # Select region
         selector = RegionSelector()
         self.bbox = selector.select()
@@ -125,22 +156,64 @@ class FluoTrackApp:
             return
 
         # Initialize tracker and logger
-        self.tracker = BrightnessTracker(self.bbox)
-        self.logger = DataLogger(output_dir=self.output_dir.get())
+        self.tracker = BrightnessTracker(
+            self.bbox, bleach_stop_fraction=bleach_stop_fraction
+        )
+        # Rows are written on a background thread so disk stalls do not
+        # slow down acquisition; overflow spills to a side file
+        self.logger = DataLogger(
+            output_dir=self.output_dir.get(), mode="async", backpressure="spill"
+        )
 
         # Hide main window
         self.root.withdraw()
 
         # Run tracking based on mode
+        tracked = saved = False
         try:
+            # Frames are grabbed on their own thread into a ring buffer, so
+            # capture keeps its pace and skipped frames are counted
+            self.tracker.start_capture()
+        except Exception as e:
+            logger.error(f"Could not start screen capture: {e}")
+            messagebox.showerror(
+                "Capture failed", f"Could not start screen capture:\n{e}"
+            )
+        else:
             if self.mode.get() == "brightest_point":
                 self._track_brightest_point()
             else:
                 self._analyze_bright_regions()
+            tracked = True
         finally:
+            # Write out the whole log before reporting where it was saved
+            try:
+                self.logger.close()
+                saved = True
+            except Exception as e:
+                logger.error(f"Could not save data: {e}")
+                messagebox.showerror(
+                    "Save failed",
+                    f"Could not save data to:\n{self.logger.filename}\n\n{e}",
+                )
             # Show main window again
             self.root.deiconify()
 
+        if tracked and saved:
+            self._show_results()
+
+    def _stop_capture(self):
+        """Stop the capture thread and report its frame accounting"""
+        self.tracker.stop_capture()
+        stats = self.tracker.capture_stats()
+        if not stats:
+            return
+        logger.info(
+            f"Captured {stats['captured']} frames at {stats['capture_fps']:.1f} fps "
+            f"(jitter {stats['jitter_ms']:.1f} ms), dropped {stats['dropped']}, "
+            f"mean latency {stats['latency_ms']:.1f} ms"
+        )
+
     def _track_brightest_point(self):
         """Track single brightest point in real-time"""
         logger.info("Starting brightest point tracking")
@@ -149,112 +222,132 @@ class FluoTrackApp:
         frame_count = 0
         start_time = time.time()
 
-        try:
-            while True:
-                # Capture and process
-                frame = self.tracker.capture_frame()
-                gray = self.tracker.preprocess_frame(frame)
-
-                # Find brightest point
-                result = self.tracker.find_brightest_point(gray)
-
-                # Log data
-                self.logger.log_point(result)
-
-                # Update FPS
-                frame_count += 1
-                if frame_count % fps_update_interval == 0:
-                    elapsed = time.time() - start_time
-                    fps = self.tracker.calculate_fps(elapsed, fps_update_interval)
-                    frame_count = 0
-                    start_time = time.time()
-
-                # Visualization
-                loc = result["location"]
-                cv2.circle(frame, loc, 10, (0, 255, 0), 2)
-                cv2.putText(
-                    frame,
-                    f"FPS: {self.tracker.fps:.1f}",
-                    (10, 30),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    1,
-                    (0, 255, 0),
-                    2,
-                )
-                cv2.putText(
-                    frame,
-                    f"Brightness: {result['intensity']:.0f}",
-                    (10, 70),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    1,
-                    (0, 255, 0),
-                    2,
-                )
-
-                # Display
-                cv2.imshow("Fluorescence Brightness Tracking", frame)
-
-                # Check for exit
-                if cv2.waitKey(1) & 0xFF == ord("q"):
-                    break
+        def process(frame):
+            nonlocal frame_count, start_time
+            gray = self.tracker.preprocess_frame(frame)
+            result = self.tracker.find_brightest_point(gray)
+
+            # Update FPS
+            frame_count += 1
+            if frame_count % fps_update_interval == 0:
+                elapsed = time.time() - start_time
+                self.tracker.calculate_fps(elapsed, fps_update_interval)
+                frame_count = 0
+                start_time = time.time()
+            return result
+
+        def bleached(result):
+            if not self.tracker.should_stop():
+                return False
+            status = self.tracker.bleaching_status()
+            logger.info(
+                f"Brightness bleached to "
+                f"{status['remaining_fraction']:.0%} of its initial "
+                f"value, stopping acquisition"
+            )
+            return True
+
+        def display(frame, result):
+            loc = result["location"]
+            cv2.circle(frame, loc, 10, (0, 255, 0), 2)
+            cv2.putText(
+                frame,
+                f"FPS: {self.tracker.fps:.1f}",
+                (10, 30),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                1,
+                (0, 255, 0),
+                2,
+            )
+            cv2.putText(
+                frame,
+                f"Brightness: {result['intensity']:.0f}",
+                (10, 70),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                1,
+                (0, 255, 0),
+                2,
+            )
+            cv2.imshow("Fluorescence Brightness Tracking", frame)
+
+            # Check for exit
+            return cv2.waitKey(1) & 0xFF != ord("q")
+
+        # Capture, tracking and logging run on their own threads; the
+        # display refreshes here at a capped rate and never blocks them
+        pipeline = AcquisitionPipeline(
+            self.tracker.capture_frame,
+            process,
+            self.logger.log_point,
+            display_fps=self.DISPLAY_FPS,
+            stop_when=bleached,
+        )
 
+        try:
+            pipeline.run(display)
         except Exception as e:
             logger.error(f"Error during tracking: {e}")
         finally:
+            self._stop_capture()
             cv2.destroyAllWindows()
-            logger.info("Tracking stopped")
-            self._show_results()
+            logger.info(f"Tracking stopped after {pipeline.processed} frames")
 
     def _analyze_bright_regions(self):
         """Analyze multiple bright regions"""
         logger.info("Starting bright regions analysis")
 
-        try:
-            while True:
-                # Capture and process
-                frame = self.tracker.capture_frame()
-                gray = self.tracker.preprocess_frame(frame)
-
-                # Find bright regions
-                regions = self.tracker.find_bright_regions(gray)
-
-                # Log data
-                self.logger.log_regions(regions, self.tracker.frame_count)
-
-                # Visualization
-                for i, region in enumerate(regions[:5]):  # Show top 5
-                    # Draw bounding box
-                    x, y, w, h = region["bbox"]
-                    cv2.rectangle(frame, (x, y), (x + w, y + h), (0, 255, 0), 2)
-
-                    # Mark brightest point
-                    loc = region["location"]
-                    cv2.circle(frame, loc, 5, (0, 255, 255), -1)
-
-                    # Label
-                    cv2.putText(
-                        frame,
-                        f"#{i+1}: {region['intensity']:.0f}",
-                        (x, y - 5),
-                        cv2.FONT_HERSHEY_SIMPLEX,
-                        0.5,
-                        (0, 255, 0),
-                        1,
-                    )
-
-                # Display
-                cv2.imshow("Bright Regions Analysis", frame)
-
-                # Check for exit
-                if cv2.waitKey(1) & 0xFF == ord("q"):
-                    break
+        # find_bright_regions does not advance the tracker's frame count,
+        # so frames are numbered here, on the processing thread
+        frame_number = 0
+
+        def process(frame):
+            nonlocal frame_number
+            gray = self.tracker.preprocess_frame(frame)
+            regions = self.tracker.find_bright_regions(gray)
+            frame_number += 1
+            return regions, frame_number
+
+        def log(result):
+            self.logger.log_regions(*result)
+
+        def display(frame, result):
+            regions, _ = result
+            for i, region in enumerate(regions[:5]):  # Show top 5
+                # Draw bounding box
+                x, y, w, h = region["bbox"]
+                cv2.rectangle(frame, (x, y), (x + w, y + h), (0, 255, 0), 2)
 
+                # Mark brightest point
+                loc = region["location"]
+                cv2.circle(frame, loc, 5, (0, 255, 255), -1)
+
+                # Label
+                cv2.putText(
+                    frame,
+                    f"#{i+1}: {region['intensity']:.0f}",
+                    (x, y - 5),
+                    cv2.FONT_HERSHEY_SIMPLEX,
+                    0.5,
+                    (0, 255, 0),
+                    1,
+                )
+            cv2.imshow("Bright Regions Analysis", frame)
+
+            # Check for exit
+            return cv2.waitKey(1) & 0xFF != ord("q")
+
+        pipeline = AcquisitionPipeline(
+            self.tracker.capture_frame, process, log, display_fps=self.DISPLAY_FPS
+        )
+
+        try:
+            pipeline.run(display)
         except Exception as e:
             logger.error(f"Error during analysis: {e}")
         finally:
+            self._stop_capture()
             cv2.destroyAllWindows()
-            logger.info("Analysis stopped")
-            self._show_results()
+            logger.info(f"Analysis stopped after {pipeline.processed} frames")
 
     def _show_results(self):
         """Show results summary"""
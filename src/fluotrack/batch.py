@@ -0,0 +1,320 @@
+"""
+Batch analysis of many brightness log files.
+
+Runs the BrightnessAnalyzer statistics, photobleaching and trajectory
+analyses for every log in a directory or glob on a process pool, and
+collects one summary row per file in a single table. Files whose size and
+modification time match their row in an existing summary are not analyzed
+again.
+"""
+
+import argparse
+import glob
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Union
+
+from .analysis import BrightnessAnalyzer, StreamingBrightnessAnalyzer
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+LOG_SUFFIXES = (".csv", ".parquet")
+
+SUMMARY_COLUMNS = [
+    "file",
+    "size",
+    "mtime_ns",
+    "status",
+    "error",
+    "n_records",
+    "total_frames",
+    "duration_seconds",
+    "average_fps",
+    "mean_brightness",
+    "std_brightness",
+    "min_brightness",
+    "max_brightness",
+    "median_brightness",
+    "bleaching_slope",
+    "is_bleaching",
+    "half_life_frames",
+    "mean_displacement",
+    "std_displacement",
+    "total_distance",
+    "confinement_radius",
+    "center_x",
+    "center_y",
+]
+
+
+def find_logs(
+    inputs: Union[str, Path, Iterable[Union[str, Path]]],
+    pattern: str = "brightness_log_*",
+) -> List[Path]:
+    """
+    Collect log files from directories, glob patterns or file paths.
+
+    Parameters
+    ----------
+    inputs : str, Path or iterable of these
+        Directories (searched for ``pattern``), glob patterns or files
+    pattern : str, default='brightness_log_*'
+        File name pattern used inside directories
+
+    Returns
+    -------
+    list of Path
+        Sorted, de-duplicated CSV and Parquet log files
+    """
+    if isinstance(inputs, (str, Path)):
+        inputs = [inputs]
+
+    files = set()
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            candidates = path.glob(pattern)
+        else:
+            candidates = (Path(p) for p in glob.glob(str(item)))
+        files.update(
+            p.resolve() for p in candidates if p.is_file() and p.suffix in LOG_SUFFIXES
+        )
+
+    return sorted(files)
+
+
+def analyze_file(
+    path: Union[str, Path],
+    window_size: int = 100,
+    chunksize: Optional[int] = None,
+) -> Dict:
+    """
+    Analyze one log file into a summary row.
+
+    Parameters
+    ----------
+    path : str or Path
+        Log file
+    window_size : int, default=100
+        Moving-average window for photobleaching detection
+    chunksize : int, optional
+        Analyze with StreamingBrightnessAnalyzer in chunks of this many
+        rows instead of loading the whole file
+
+    Returns
+    -------
+    dict
+        One value per SUMMARY_COLUMNS entry. Failures are reported with
+        status 'error' and the message in 'error' instead of raising.
+    """
+    path = Path(path)
+    row = {name: None for name in SUMMARY_COLUMNS}
+    row["file"] = str(path)
+
+    try:
+        stat = path.stat()
+        row.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+        if chunksize is None:
+            analyzer = BrightnessAnalyzer(path)
+            row["n_records"] = len(analyzer.data)
+        else:
+            analyzer = StreamingBrightnessAnalyzer(path, chunksize=chunksize)
+
+        stats = analyzer.compute_statistics()
+        bleaching = analyzer.detect_photobleaching(window_size)
+        trajectory = analyzer.analyze_trajectory()
+        if chunksize is not None:
+            row["n_records"] = analyzer.n_records
+    except Exception as e:
+        row.update(status="error", error=f"{type(e).__name__}: {e}")
+        return row
+
+    row.update(stats)
+    if bleaching:
+        row["bleaching_slope"] = bleaching["slope"]
+        row["is_bleaching"] = bleaching["is_bleaching"]
+        row["half_life_frames"] = bleaching["half_life_frames"]
+    if trajectory:
+        center = trajectory.pop("center")
+        row.update(trajectory, center_x=center[0], center_y=center[1])
+    row["status"] = "ok"
+
+    return {name: row[name] for name in SUMMARY_COLUMNS}
+
+
+def _log_progress(done: int, total: int, row: Dict):
+    """Default progress callback: one log line per finished file"""
+    name = Path(row["file"]).name
+    if row["status"] == "ok":
+        logger.info(f"[{done}/{total}] {name}")
+    else:
+        logger.warning(f"[{done}/{total}] {name} failed: {row['error']}")
+
+
+def analyze_batch(
+    inputs: Union[str, Path, Iterable[Union[str, Path]]],
+    summary_file: Union[str, Path] = "brightness_summary.csv",
+    n_workers: Optional[int] = None,
+    pattern: str = "brightness_log_*",
+    window_size: int = 100,
+    chunksize: Optional[int] = None,
+    force: bool = False,
+    progress: Optional[Callable[[int, int, Dict], None]] = _log_progress,
+) -> "pd.DataFrame":
+    """
+    Analyze many log files in parallel into one summary table.
+
+    Parameters
+    ----------
+    inputs : str, Path or iterable of these
+        Directories, glob patterns or files (see ``find_logs``)
+    summary_file : str or Path, default='brightness_summary.csv'
+        Summary CSV, one row per file. Rows already in it are kept, and
+        files whose size and modification time match their row are
+        skipped.
+    n_workers : int, optional
+        Worker processes; defaults to the CPU count. 1 analyzes in the
+        calling process.
+    pattern : str, default='brightness_log_*'
+        File name pattern used inside directories
+    window_size : int, default=100
+        Moving-average window for photobleaching detection
+    chunksize : int, optional
+        Stream each file in chunks of this many rows (for logs too large
+        to load at once)
+    force : bool, default=False
+        Re-analyze every file, even if unchanged
+    progress : callable, optional
+        Called as ``progress(done, total, row)`` after each analyzed file;
+        defaults to logging. None disables progress reporting.
+
+    Returns
+    -------
+    pd.DataFrame
+        The summary table, sorted by file
+    """
+    import pandas as pd
+
+    if n_workers is not None and n_workers < 1:
+        raise ValueError("n_workers must be at least 1")
+
+    summary_file = Path(summary_file)
+    files = find_logs(inputs, pattern)
+
+    previous = {}
+    if summary_file.exists():
+        for row in pd.read_csv(summary_file).to_dict("records"):
+            previous[row["file"]] = row
+
+    rows = dict(previous)
+    pending = []
+    for path in files:
+        row = previous.get(str(path))
+        try:
+            stat = path.stat()
+        except OSError:
+            row = None  # gone since it was found; analyze_file reports it
+        unchanged = (
+            not force
+            and row is not None
+            and row["status"] == "ok"
+            and row["size"] == stat.st_size
+            and row["mtime_ns"] == stat.st_mtime_ns
+        )
+        if not unchanged:
+            pending.append(path)
+
+    logger.info(
+        f"Analyzing {len(pending)} of {len(files)} log files "
+        f"({len(files) - len(pending)} unchanged)"
+    )
+
+    if n_workers == 1:
+        results = (analyze_file(path, window_size, chunksize) for path in pending)
+        for done, row in enumerate(results, start=1):
+            rows[row["file"]] = row
+            if progress is not None:
+                progress(done, len(pending), row)
+    elif pending:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = [
+                executor.submit(analyze_file, path, window_size, chunksize)
+                for path in pending
+            ]
+            for done, future in enumerate(as_completed(futures), start=1):
+                row = future.result()
+                rows[row["file"]] = row
+                if progress is not None:
+                    progress(done, len(pending), row)
+
+    summary = pd.DataFrame(list(rows.values()), columns=SUMMARY_COLUMNS)
+    summary = summary.sort_values("file", ignore_index=True)
+
+    # Replace the summary atomically, so an interrupted run keeps the old one
+    summary_file.parent.mkdir(parents=True, exist_ok=True)
+    temp_file = summary_file.with_name(summary_file.name + ".tmp")
+    summary.to_csv(temp_file, index=False)
+    os.replace(temp_file, summary_file)
+
+    logger.info(f"Summary written to: {summary_file}")
+    return summary
+
+
+def main(argv: Optional[List[str]] = None, prog: str = "python -m fluotrack.batch"):
+    """Command-line entry point: python -m fluotrack.batch (fluotrack analyze)"""
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description="Analyze brightness log files in parallel",
+    )
+    parser.add_argument(
+        "inputs", nargs="+", help="directories, glob patterns or log files"
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="brightness_summary.csv",
+        help="summary CSV (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-j", "--workers", type=int, default=None, help="worker processes"
+    )
+    parser.add_argument(
+        "--pattern",
+        default="brightness_log_*",
+        help="file pattern inside directories (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--window",
+        type=int,
+        default=100,
+        help="photobleaching moving-average window (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--chunksize", type=int, default=None, help="stream files in chunks"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="re-analyze unchanged files"
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    summary = analyze_batch(
+        args.inputs,
+        summary_file=args.output,
+        n_workers=args.workers,
+        pattern=args.pattern,
+        window_size=args.window,
+        chunksize=args.chunksize,
+        force=args.force,
+    )
+    failed = int((summary["status"] != "ok").sum())
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
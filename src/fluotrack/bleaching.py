@@ -0,0 +1,277 @@
+"""
+Online photobleaching estimation.
+
+Keeps running sufficient statistics of intensity versus time for many
+objects (tracks or ROIs) at once, so the bleaching slope, rate and half-life
+of every object can be queried at any frame in O(1) without rescanning its
+history.
+
+Two fits are maintained per object:
+
+- a linear fit ``I(t) = a + b t``, whose slope matches ``np.polyfit`` over
+  the same observations, and
+- a log-linear fit ``log I(t) = log I0 - k t`` of the mono-exponential decay
+  ``I(t) = I0 exp(-k t)``, which gives the bleaching rate ``k`` and the
+  half-life ``ln 2 / k``.
+
+Both use weighted Welford updates of the means and co-moments instead of raw
+power sums, which keeps long acquisitions numerically stable. An optional
+forgetting factor discounts old observations so the estimates follow a
+bleaching rate that changes over time.
+"""
+
+import numpy as np
+from typing import Dict, Optional
+
+
+class OnlineBleachingEstimator:
+    """
+    Incremental linear and exponential bleaching fits for many objects.
+
+    Parameters
+    ----------
+    forgetting_factor : float, default=1.0
+        Weight applied to all previous observations at every update of an
+        object. 1.0 weighs the whole history equally (ordinary least
+        squares); values below 1 give an effective memory of about
+        ``1 / (1 - forgetting_factor)`` observations.
+    min_observations : int, default=10
+        Number of observations an object needs before ``is_bleached``
+        reports it
+
+    Attributes
+    ----------
+    count : np.ndarray
+        Number of observations per object
+    """
+
+    # Per-object arrays, kept in the same row order
+    _FIELDS = (
+        "count",
+        "first_time",
+        "last_time",
+        "_weight",
+        "_mean_t",
+        "_mean_y",
+        "_ctt",
+        "_cty",
+        "_log_weight",
+        "_log_mean_t",
+        "_log_mean_y",
+        "_log_ctt",
+        "_log_cty",
+    )
+
+    def __init__(self, forgetting_factor: float = 1.0, min_observations: int = 10):
+        if not 0.0 < forgetting_factor <= 1.0:
+            raise ValueError("forgetting_factor must be in (0, 1]")
+        if min_observations < 2:
+            raise ValueError("min_observations must be at least 2")
+
+        self.forgetting_factor = forgetting_factor
+        self.min_observations = min_observations
+
+        self.count = np.empty(0, dtype=np.int64)
+        self.first_time = np.empty(0, dtype=np.float64)
+        self.last_time = np.empty(0, dtype=np.float64)
+        # Linear fit: weight, means and co-moments of (t, I)
+        self._weight = np.empty(0, dtype=np.float64)
+        self._mean_t = np.empty(0, dtype=np.float64)
+        self._mean_y = np.empty(0, dtype=np.float64)
+        self._ctt = np.empty(0, dtype=np.float64)
+        self._cty = np.empty(0, dtype=np.float64)
+        # Log-linear fit over the positive observations: (t, log I)
+        self._log_weight = np.empty(0, dtype=np.float64)
+        self._log_mean_t = np.empty(0, dtype=np.float64)
+        self._log_mean_y = np.empty(0, dtype=np.float64)
+        self._log_ctt = np.empty(0, dtype=np.float64)
+        self._log_cty = np.empty(0, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.count)
+
+    def add(self, n: int = 1) -> np.ndarray:
+        """
+        Start estimating ``n`` new objects with no observations.
+
+        Returns
+        -------
+        np.ndarray
+            Row indices of the new objects
+        """
+        start = len(self.count)
+        for name in self._FIELDS:
+            column = getattr(self, name)
+            setattr(self, name, np.concatenate([column, np.zeros(n, column.dtype)]))
+        return np.arange(start, start + n)
+
+    def remove(self, indices: np.ndarray):
+        """Stop estimating the objects at the given row indices"""
+        for name in self._FIELDS:
+            setattr(self, name, np.delete(getattr(self, name), indices))
+
+    def update(
+        self,
+        indices: np.ndarray,
+        intensities: np.ndarray,
+        times: Optional[np.ndarray] = None,
+    ):
+        """
+        Add one observation to each of a subset of objects.
+
+        Parameters
+        ----------
+        indices : np.ndarray
+            Row indices of the observed objects (without duplicates)
+        intensities : np.ndarray
+            Observed intensity of each object
+        times : np.ndarray, optional
+            Observation time of each object, e.g. frame numbers or seconds.
+            Defaults to the per-object observation index (0, 1, 2, ...).
+        """
+        indices = np.asarray(indices, dtype=np.intp)
+        if len(indices) == 0:
+            return
+        y = np.asarray(intensities, dtype=np.float64)
+        if times is None:
+            t = self.count[indices].astype(np.float64)
+        else:
+            t = np.broadcast_to(np.asarray(times, dtype=np.float64), y.shape)
+
+        self.first_time[indices] = np.where(
+            self.count[indices] == 0, t, self.first_time[indices]
+        )
+        self.last_time[indices] = t
+        self.count[indices] += 1
+
+        self._accumulate(
+            indices,
+            t,
+            y,
+            self._weight,
+            self._mean_t,
+            self._mean_y,
+            self._ctt,
+            self._cty,
+        )
+
+        positive = y > 0
+        self._accumulate(
+            indices[positive],
+            t[positive],
+            np.log(y[positive]),
+            self._log_weight,
+            self._log_mean_t,
+            self._log_mean_y,
+            self._log_ctt,
+            self._log_cty,
+        )
+
+    def _accumulate(self, indices, t, y, weight, mean_t, mean_y, ctt, cty):
+        """Weighted Welford update of means and co-moments, in place"""
+        decay = self.forgetting_factor
+        w = decay * weight[indices] + 1.0
+        dt = t - mean_t[indices]
+        dy = y - mean_y[indices]
+        new_mean_t = mean_t[indices] + dt / w
+        new_mean_y = mean_y[indices] + dy / w
+
+        ctt[indices] = decay * ctt[indices] + dt * (t - new_mean_t)
+        cty[indices] = decay * cty[indices] + dt * (y - new_mean_y)
+        weight[indices] = w
+        mean_t[indices] = new_mean_t
+        mean_y[indices] = new_mean_y
+
+    @staticmethod
+    def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+        """numerator / denominator, NaN where the fit is undetermined"""
+        out = np.full(numerator.shape, np.nan)
+        np.divide(numerator, denominator, out=out, where=denominator > 0)
+        return out
+
+    @property
+    def mean_intensity(self) -> np.ndarray:
+        """(Weighted) mean intensity per object"""
+        return np.where(self.count > 0, self._mean_y, np.nan)
+
+    @property
+    def slope(self) -> np.ndarray:
+        """Linear intensity trend per unit time; NaN below two time points"""
+        return self._ratio(self._cty, self._ctt)
+
+    @property
+    def rate(self) -> np.ndarray:
+        """Exponential bleaching rate ``k`` per unit time (> 0 when dimming)"""
+        return -self._ratio(self._log_cty, self._log_ctt)
+
+    @property
+    def half_life(self) -> np.ndarray:
+        """
+        Time for the intensity to halve, ``ln 2 / k``.
+
+        Infinite for objects that are not dimming, NaN while undetermined.
+        """
+        rate = self.rate
+        out = np.full(rate.shape, np.inf)
+        np.divide(np.log(2.0), rate, out=out, where=rate > 0)
+        out[np.isnan(rate)] = np.nan
+        return out
+
+    @property
+    def remaining_fraction(self) -> np.ndarray:
+        """
+        Fitted intensity at the latest observation relative to the first,
+        ``exp(-k (t_last - t_first))``
+        """
+        return np.exp(-self.rate * (self.last_time - self.first_time))
+
+    def is_bleached(self, min_fraction: float) -> np.ndarray:
+        """
+        Objects whose fitted intensity has dropped below a fraction of its
+        initial value.
+
+        Parameters
+        ----------
+        min_fraction : float
+            Remaining-brightness threshold in (0, 1), e.g. 0.5 once half of
+            the signal has bleached
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array, False for objects with fewer than
+            ``min_observations`` observations
+        """
+        remaining = self.remaining_fraction
+        enough = self.count >= self.min_observations
+        return enough & (np.nan_to_num(remaining, nan=1.0) < min_fraction)
+
+    def summary(self, index: int) -> Dict:
+        """
+        Current estimates for one object.
+
+        Returns
+        -------
+        dict
+            observations, mean_intensity, slope, rate, half_life and
+            remaining_fraction
+        """
+        rows = np.array([index])
+        ratio = self._ratio
+        rate = -ratio(self._log_cty[rows], self._log_ctt[rows])[0]
+        if rate > 0:
+            half_life = float(np.log(2.0) / rate)
+        else:
+            half_life = float("nan") if np.isnan(rate) else float("inf")
+
+        count = int(self.count[index])
+        return {
+            "observations": count,
+            "mean_intensity": float(self._mean_y[index]) if count else float("nan"),
+            "slope": float(ratio(self._cty[rows], self._ctt[rows])[0]),
+            "rate": float(rate),
+            "half_life": half_life,
+            "remaining_fraction": float(
+                np.exp(-rate * (self.last_time[index] - self.first_time[index]))
+            ),
+        }
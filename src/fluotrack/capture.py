@@ -0,0 +1,630 @@
+"""
+Screen capture backends.
+
+Each backend grabs a screen region and converts it in a single pass
+straight into a preallocated frame buffer, BGR or grayscale. This replaces
+the old path of grabbing a PIL image, copying it into an array, converting
+RGB to BGR and converting BGR to gray.
+
+Backends:
+
+- ``'mss'``: MSS, which grabs through shared memory (XShm) on X11 and
+  through native APIs on Windows and macOS. Requires ``pip install mss``.
+- ``'pil'``: ``PIL.ImageGrab``, the portable fallback.
+
+New backends subclass :class:`ScreenCapture` and are registered in
+``CAPTURE_BACKENDS``.
+
+:class:`CaptureRing` captures continuously on a background thread into a
+ring of preallocated buffers, so acquisition keeps its own pace while frames
+are processed. It counts dropped frames and measures latency and capture
+jitter.
+"""
+
+import math
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple, Type
+
+import cv2
+import numpy as np
+
+from .clock import AcquisitionClock
+
+
+def _import_mss():
+    """Import the MSS screen grabber"""
+    try:
+        import mss
+    except ImportError as err:
+        raise ImportError(
+            "The mss capture backend requires mss. "
+            "Install with: pip install fluotrack[capture]"
+        ) from err
+    return mss
+
+
+class ScreenCapture:
+    """
+    Grab a screen region into a reused frame buffer.
+
+    Parameters
+    ----------
+    bbox : tuple of int
+        Screen region (x1, y1, x2, y2)
+    grayscale : bool, default=False
+        Deliver single-channel grayscale frames instead of BGR
+
+    Attributes
+    ----------
+    shape : tuple of int
+        Frame shape, (height, width) or (height, width, 3)
+    buffer : np.ndarray
+        Preallocated uint8 frame that ``grab`` writes into by default
+    """
+
+    name = None
+
+    def __init__(self, bbox: Tuple[int, int, int, int], grayscale: bool = False):
+        x1, y1, x2, y2 = bbox
+        if x2 <= x1 or y2 <= y1:
+            raise ValueError("bbox must have positive width and height")
+
+        self.bbox = tuple(int(v) for v in bbox)
+        self.grayscale = grayscale
+        self.width = x2 - x1
+        self.height = y2 - y1
+        if grayscale:
+            self.shape = (self.height, self.width)
+        else:
+            self.shape = (self.height, self.width, 3)
+        self.buffer = self.allocate()
+
+    def allocate(self) -> np.ndarray:
+        """A new, uninitialized frame buffer of the right shape"""
+        return np.empty(self.shape, dtype=np.uint8)
+
+    def grab(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Capture one frame.
+
+        Parameters
+        ----------
+        out : np.ndarray, optional
+            Buffer to write into (see ``allocate``). Defaults to the reused
+            ``buffer``, which the next grab overwrites.
+
+        Returns
+        -------
+        np.ndarray
+            ``out``, holding the captured frame
+        """
+        if out is None:
+            out = self.buffer
+        elif out.shape != self.shape or out.dtype != np.uint8:
+            raise ValueError(f"out must be a uint8 array of shape {self.shape}")
+        self._grab_into(out)
+        return out
+
+    def _grab_into(self, out: np.ndarray):
+        """Capture into ``out`` (implemented by backends)"""
+        raise NotImplementedError
+
+    def close(self):
+        """Release any capture resources"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class MssCapture(ScreenCapture):
+    """
+    Capture with MSS (shared-memory XShm grabs on X11).
+
+    The BGRA screenshot is viewed in place and converted once into the
+    output buffer.
+    """
+
+    name = "mss"
+
+    def __init__(self, bbox: Tuple[int, int, int, int], grayscale: bool = False):
+        self._mss = _import_mss()
+        super().__init__(bbox, grayscale)
+        self._monitor = {
+            "left": self.bbox[0],
+            "top": self.bbox[1],
+            "width": self.width,
+            "height": self.height,
+        }
+        self._code = cv2.COLOR_BGRA2GRAY if grayscale else cv2.COLOR_BGRA2BGR
+        # MSS handles are bound to the thread that opened them
+        self._local = threading.local()
+        self._handles = []
+
+    def _grabber(self):
+        grabber = getattr(self._local, "grabber", None)
+        if grabber is None:
+            grabber = self._local.grabber = self._mss.mss()
+            self._handles.append(grabber)
+        return grabber
+
+    def _grab_into(self, out: np.ndarray):
+        shot = self._grabber().grab(self._monitor)
+        bgra = np.frombuffer(shot.raw, dtype=np.uint8)
+        bgra = bgra.reshape(shot.height, shot.width, 4)
+        cv2.cvtColor(bgra, self._code, dst=out)
+
+    def close(self):
+        for grabber in self._handles:
+            grabber.close()
+        self._handles = []
+        self._local = threading.local()
+
+
+class PILCapture(ScreenCapture):
+    """Capture with ``PIL.ImageGrab``, the portable fallback"""
+
+    name = "pil"
+
+    # (image mode, grayscale) -> OpenCV conversion into the output buffer
+    _CONVERSIONS = {
+        ("RGB", False): cv2.COLOR_RGB2BGR,
+        ("RGB", True): cv2.COLOR_RGB2GRAY,
+        ("RGBA", False): cv2.COLOR_RGBA2BGR,
+        ("RGBA", True): cv2.COLOR_RGBA2GRAY,
+    }
+
+    def __init__(self, bbox: Tuple[int, int, int, int], grayscale: bool = False):
+        from PIL import ImageGrab
+
+        super().__init__(bbox, grayscale)
+        self._image_grab = ImageGrab
+
+    def _grab_into(self, out: np.ndarray):
+        image = self._image_grab.grab(bbox=self.bbox)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGB")
+        code = self._CONVERSIONS[image.mode, self.grayscale]
+        cv2.cvtColor(np.asarray(image), code, dst=out)
+
+
+CAPTURE_BACKENDS: Dict[str, Type[ScreenCapture]] = {
+    "mss": MssCapture,
+    "pil": PILCapture,
+}
+
+
+def open_capture(
+    bbox: Tuple[int, int, int, int],
+    backend: str = "auto",
+    grayscale: bool = False,
+) -> ScreenCapture:
+    """
+    Open a screen capture backend.
+
+    Parameters
+    ----------
+    bbox : tuple of int
+        Screen region (x1, y1, x2, y2)
+    backend : str, default='auto'
+        A ``CAPTURE_BACKENDS`` name, or 'auto' for the first one whose
+        dependencies are installed (mss, then PIL)
+    grayscale : bool, default=False
+        Deliver grayscale frames instead of BGR
+
+    Returns
+    -------
+    ScreenCapture
+        The opened backend
+    """
+    if backend == "auto":
+        for cls in CAPTURE_BACKENDS.values():
+            try:
+                return cls(bbox, grayscale)
+            except ImportError:
+                continue
+        raise ImportError(
+            "No screen capture backend available. Install with: pip install mss"
+        )
+
+    if backend not in CAPTURE_BACKENDS:
+        raise ValueError(
+            f"backend must be 'auto' or one of {tuple(CAPTURE_BACKENDS)}, "
+            f"got '{backend}'"
+        )
+    return CAPTURE_BACKENDS[backend](bbox, grayscale)
+
+
+@dataclass
+class CapturedFrame:
+    """A frame delivered by a CaptureRing"""
+
+    sequence: int  # capture order, from 0; gaps are dropped frames
+    timestamp: int  # capture time, ns on the ring's AcquisitionClock
+    data: np.ndarray
+
+
+class CaptureRing:
+    """
+    Capture on a background thread into a ring of preallocated buffers.
+
+    The capture thread never waits for the consumer: it keeps overwriting
+    the oldest buffer that is not being read. Consumers ``read`` either the
+    newest frame or the next one in capture order; frames overwritten or
+    skipped before being read are counted as dropped.
+
+    Parameters
+    ----------
+    capture : ScreenCapture
+        Backend to grab frames with
+    size : int, default=4
+        Number of frame buffers in the ring (at least 2)
+    policy : {'newest', 'next'}, default='newest'
+        Default read policy. 'newest' returns the latest frame, skipping
+        older unread ones (lowest latency); 'next' returns unread frames in
+        capture order (fewest drops while the consumer keeps up).
+    max_fps : float, optional
+        Limit the capture rate; by default frames are grabbed back to back
+    clock : AcquisitionClock, optional
+        Clock for capture timestamps; share the tracker's to compare times
+
+    Attributes
+    ----------
+    captured, delivered, dropped : int
+        Frames grabbed, returned by ``read``, and never returned
+    """
+
+    POLICIES = ("newest", "next")
+
+    def __init__(
+        self,
+        capture: ScreenCapture,
+        size: int = 4,
+        policy: str = "newest",
+        max_fps: Optional[float] = None,
+        clock: Optional[AcquisitionClock] = None,
+    ):
+        if size < 2:
+            raise ValueError("size must be at least 2")
+        if policy not in self.POLICIES:
+            raise ValueError(f"policy must be one of {self.POLICIES}, got '{policy}'")
+        if max_fps is not None and max_fps <= 0:
+            raise ValueError("max_fps must be positive")
+
+        self.capture = capture
+        self.policy = policy
+        self.interval_ns = None if max_fps is None else int(1e9 / max_fps)
+        self.clock = clock if clock is not None else AcquisitionClock()
+
+        self._buffers = [capture.allocate() for _ in range(size)]
+        self._sequence = np.full(size, -1, dtype=np.int64)
+        self._times = np.zeros(size, dtype=np.int64)
+        self._write_slot = 0
+        self._writing = None
+        self._reading = None
+        self._last_delivered = -1
+
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._thread = None
+        self._error = None
+
+        self.captured = 0
+        self.delivered = 0
+        self.dropped = 0
+        self._latency_sum = 0
+        self._latency_max = 0
+        self._interval_count = 0
+        self._interval_mean = 0.0
+        self._interval_m2 = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "CaptureRing":
+        """Start the capture thread"""
+        if self.running:
+            raise RuntimeError("capture already running")
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._capture_loop, name="fluotrack-capture", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stop the capture thread.
+
+        Frames captured but not read by then are counted as dropped, so
+        that afterwards ``captured == delivered + dropped``.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        with self._cond:
+            self.dropped += self.captured - 1 - self._last_delivered
+            self._last_delivered = self.captured - 1
+            self._cond.notify_all()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def _next_slot(self) -> int:
+        """Oldest slot in ring order that is not being read"""
+        size = len(self._buffers)
+        slot = self._write_slot
+        if slot == self._reading:
+            slot = (slot + 1) % size
+        self._write_slot = (slot + 1) % size
+        return slot
+
+    def _capture_loop(self):
+        next_time = self.clock.now()
+        previous = None
+        while not self._stop.is_set():
+            if self.interval_ns is not None:
+                delay = next_time - self.clock.now()
+                if delay > 0 and self._stop.wait(delay / 1e9):
+                    break
+                next_time = max(next_time + self.interval_ns, self.clock.now())
+
+            with self._cond:
+                slot = self._next_slot()
+                self._writing = slot
+                # The slot no longer holds a readable frame
+                self._sequence[slot] = -1
+            try:
+                self.capture.grab(self._buffers[slot])
+            except Exception as e:
+                with self._cond:
+                    self._error = e
+                    self._writing = None
+                    self._cond.notify_all()
+                return
+            timestamp = self.clock.now()
+
+            with self._cond:
+                self._writing = None
+                self._sequence[slot] = self.captured
+                self._times[slot] = timestamp
+                self.captured += 1
+                if previous is not None:
+                    # Welford update of the capture interval statistics
+                    interval = timestamp - previous
+                    self._interval_count += 1
+                    delta = interval - self._interval_mean
+                    self._interval_mean += delta / self._interval_count
+                    self._interval_m2 += delta * (interval - self._interval_mean)
+                previous = timestamp
+                self._cond.notify_all()
+
+    def _select(self, policy: str) -> Optional[int]:
+        """Slot holding the frame to deliver under a policy, if any"""
+        unread = np.flatnonzero(self._sequence > self._last_delivered)
+        if len(unread) == 0:
+            return None
+        if policy == "newest":
+            return int(unread[np.argmax(self._sequence[unread])])
+        return int(unread[np.argmin(self._sequence[unread])])
+
+    def read(
+        self,
+        out: Optional[np.ndarray] = None,
+        timeout: Optional[float] = None,
+        policy: Optional[str] = None,
+    ) -> CapturedFrame:
+        """
+        Return an unread frame, waiting for one if necessary.
+
+        Parameters
+        ----------
+        out : np.ndarray, optional
+            Buffer to copy the frame into; a new array by default. The ring
+            buffer itself is reused by the capture thread.
+        timeout : float, optional
+            Maximum wait in seconds
+        policy : {'newest', 'next'}, optional
+            Overrides the ring's default policy for this read
+
+        Returns
+        -------
+        CapturedFrame
+            The frame with its sequence number and capture timestamp
+
+        Raises
+        ------
+        TimeoutError
+            If no frame arrives within ``timeout``
+        RuntimeError
+            If the capture thread is not running and no frame is left
+        """
+        policy = policy or self.policy
+        if policy not in self.POLICIES:
+            raise ValueError(f"policy must be one of {self.POLICIES}, got '{policy}'")
+
+        with self._cond:
+            if not self._cond.wait_for(
+                lambda: self._select(policy) is not None
+                or self._error is not None
+                or not self.running,
+                timeout,
+            ):
+                raise TimeoutError("no frame captured within the timeout")
+            slot = self._select(policy)
+            if slot is None:
+                if self._error is not None:
+                    raise RuntimeError("capture failed") from self._error
+                raise RuntimeError("capture is not running")
+            sequence = int(self._sequence[slot])
+            timestamp = int(self._times[slot])
+            self._reading = slot
+
+        # The capture thread skips the slot while it is copied
+        if out is None:
+            out = self._buffers[slot].copy()
+        else:
+            np.copyto(out, self._buffers[slot])
+
+        with self._cond:
+            self._reading = None
+            if sequence > self._last_delivered:
+                self.dropped += sequence - self._last_delivered - 1
+                self._last_delivered = sequence
+            else:
+                # stop() counted this frame as dropped while it was copied
+                self.dropped -= 1
+            self.delivered += 1
+            latency = self.clock.now() - timestamp
+            self._latency_sum += latency
+            self._latency_max = max(self._latency_max, latency)
+
+        return CapturedFrame(sequence, timestamp, out)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Capture counters.
+
+        Returns
+        -------
+        dict
+            captured, delivered and dropped frames; drop_rate (dropped
+            fraction of the frames read or skipped); mean and maximum
+            capture-to-read latency in ms; capture_fps and capture jitter
+            (standard deviation of the capture interval) in ms
+        """
+        with self._cond:
+            seen = self.delivered + self.dropped
+            n_intervals = self._interval_count
+            mean_interval = self._interval_mean
+            return {
+                "captured": self.captured,
+                "delivered": self.delivered,
+                "dropped": self.dropped,
+                "drop_rate": self.dropped / seen if seen else 0.0,
+                "latency_ms": (
+                    self._latency_sum / self.delivered / 1e6
+                    if self.delivered
+                    else float("nan")
+                ),
+                "max_latency_ms": self._latency_max / 1e6,
+                "capture_fps": 1e9 / mean_interval if mean_interval else float("nan"),
+                "jitter_ms": (
+                    math.sqrt(self._interval_m2 / n_intervals) / 1e6
+                    if n_intervals
+                    else float("nan")
+                ),
+            }
+
+
+class LiveCaptureMixin:
+    """
+    Screen capture for trackers, direct or through a CaptureRing.
+
+    Trackers call ``_init_capture`` from ``__init__`` and need a ``bbox``
+    attribute. A tracker timestamping with an AcquisitionClock shares it
+    with its capture ring.
+    """
+
+    def _init_capture(self, backend: str, grayscale: bool):
+        if backend != "auto" and backend not in CAPTURE_BACKENDS:
+            raise ValueError(
+                f"capture_backend must be 'auto' or one of "
+                f"{tuple(CAPTURE_BACKENDS)}, got '{backend}'"
+            )
+        self.capture_backend = backend
+        self.grayscale_capture = grayscale
+        self.last_capture = None
+        self._capture = None
+        self._ring = None
+
+    @property
+    def capture(self) -> ScreenCapture:
+        """Screen capture backend, opened on first use"""
+        if self._capture is None:
+            self._capture = open_capture(
+                self.bbox, self.capture_backend, self.grayscale_capture
+            )
+        return self._capture
+
+    @property
+    def clock(self) -> Optional[AcquisitionClock]:
+        """AcquisitionClock behind the tracker's timestamps, if any"""
+        clock = getattr(getattr(self, "_now", None), "__self__", None)
+        return clock if isinstance(clock, AcquisitionClock) else None
+
+    def start_capture(
+        self,
+        ring_size: int = 4,
+        policy: str = "newest",
+        max_fps: Optional[float] = None,
+    ) -> CaptureRing:
+        """
+        Capture continuously on a background thread.
+
+        Until ``stop_capture``, ``capture_frame`` returns frames from the
+        ring instead of grabbing them itself. See CaptureRing for the
+        parameters.
+
+        Returns
+        -------
+        CaptureRing
+            The running ring
+        """
+        if self._ring is not None and self._ring.running:
+            raise RuntimeError("capture already running")
+        self._ring = CaptureRing(
+            self.capture, ring_size, policy, max_fps, clock=self.clock
+        ).start()
+        return self._ring
+
+    def stop_capture(self):
+        """
+        Stop the capture thread started by ``start_capture``.
+
+        Its counters stay available; ``capture_frame`` grabs directly again.
+        """
+        if self._ring is not None:
+            self._ring.stop()
+
+    def capture_frame(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Capture a frame from the screen region.
+
+        Without a running capture thread, the screenshot is converted once,
+        directly into the backend's reused buffer (overwritten by the next
+        capture) or into ``out``. With ``start_capture``, the next frame
+        under the ring's policy is copied into ``out`` or a new array, and
+        ``last_capture`` holds its sequence number and capture time.
+
+        Parameters
+        ----------
+        out : np.ndarray, optional
+            Buffer to write into, e.g. from ``capture.allocate()``
+
+        Returns
+        -------
+        np.ndarray
+            Captured frame in BGR format, or grayscale with
+            ``grayscale_capture``
+        """
+        if self._ring is not None and self._ring.running:
+            self.last_capture = self._ring.read(out)
+            return self.last_capture.data
+        return self.capture.grab(out)
+
+    @property
+    def dropped_frames(self) -> int:
+        """Frames captured by the capture thread but never processed"""
+        return self._ring.dropped if self._ring is not None else 0
+
+    def capture_stats(self) -> Dict[str, float]:
+        """Capture thread counters (see ``CaptureRing.stats``); empty without one"""
+        return self._ring.stats() if self._ring is not None else {}
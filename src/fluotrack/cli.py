@@ -0,0 +1,545 @@
+"""
+Command-line interface.
+
+::
+
+    fluotrack                    launch the GUI
+    fluotrack track INPUT ...    track TIFF stacks, videos or image directories
+    fluotrack analyze LOG ...    summarize brightness logs (see fluotrack.batch)
+    fluotrack bench              benchmark the trackers on synthetic frames
+
+Only the GUI needs tkinter, and it is imported only when launched, so the
+subcommands run on headless machines.
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .analysis import DataLogger
+from .enhanced_tracker import EnhancedFluoTracker
+from .sources import (
+    Frame,
+    FrameSource,
+    ImageDirectorySource,
+    PrefetchingSource,
+    SyntheticSource,
+    TiffSource,
+    VideoSource,
+)
+from .tracker import BrightnessTracker
+from .tracker_enhanced import EnhancedBrightnessTracker
+
+logger = logging.getLogger(__name__)
+
+TRACKERS = ("basic", "enhanced", "multi")
+TIFF_SUFFIXES = (".tif", ".tiff")
+
+
+def open_source(
+    path: Union[str, Path],
+    pattern: str = "*.tif",
+    frame_interval: float = 1.0,
+) -> FrameSource:
+    """
+    Open a recording as a frame source.
+
+    Parameters
+    ----------
+    path : str or Path
+        Directory of images, TIFF stack or video file
+    pattern : str, default='*.tif'
+        Image file pattern inside directories
+    frame_interval : float, default=1.0
+        Time between frames in seconds for directories and TIFF stacks;
+        videos use their container timestamps
+
+    Returns
+    -------
+    FrameSource
+        ImageDirectorySource, TiffSource or VideoSource
+    """
+    path = Path(path)
+    if path.is_dir():
+        return ImageDirectorySource(path, pattern, frame_interval)
+    if path.suffix.lower() in TIFF_SUFFIXES:
+        return TiffSource(path, frame_interval)
+    return VideoSource(path)
+
+
+def make_tracker(
+    kind: str, shape: Tuple[int, int], epoch_ns: Optional[int] = None
+) -> Callable[[Frame], List[Tuple[Dict, str]]]:
+    """
+    Build a per-frame tracking step.
+
+    Parameters
+    ----------
+    kind : {'basic', 'enhanced', 'multi'}
+        'basic' and 'enhanced' follow the brightest point with
+        BrightnessTracker or EnhancedBrightnessTracker; 'multi' detects and
+        links all spots with EnhancedFluoTracker
+    shape : tuple of int
+        Frame (height, width)
+    epoch_ns : int, optional
+        Start of the acquisition (frame time zero) in nanoseconds since
+        the Unix epoch; defaults to the current time
+
+    Returns
+    -------
+    callable
+        ``step(frame) -> [(data, notes), ...]``, the rows to log for one
+        frame in the form taken by ``DataLogger.log_point``. Timestamps are
+        integer nanoseconds since the Unix epoch, as from an
+        AcquisitionClock: ``epoch_ns`` plus the frame time. Multi-target
+        rows are annotated with their track id.
+    """
+    if kind not in TRACKERS:
+        raise ValueError(f"tracker must be one of {TRACKERS}, got '{kind}'")
+
+    bbox = (0, 0, shape[1], shape[0])
+    if epoch_ns is None:
+        epoch_ns = time.time_ns()
+
+    def frame_time(frame: Frame) -> int:
+        return epoch_ns + int(round(frame.timestamp * 1e9))
+
+    if kind == "multi":
+        tracker = EnhancedFluoTracker()
+
+        def step(frame: Frame) -> List[Tuple[Dict, str]]:
+            timestamp = frame_time(frame)
+            spots = tracker.process_frame(frame.data, timestamp)
+            return [
+                (
+                    {
+                        "timestamp": timestamp,
+                        "frame_number": frame.index + 1,
+                        "location": spot.location,
+                        "intensity": spot.intensity,
+                    },
+                    f"track_{spot.id}",
+                )
+                for spot in spots
+            ]
+
+        return step
+
+    if kind == "enhanced":
+        # Preprocesses (background, denoising) inside find_brightest_point
+        detect = EnhancedBrightnessTracker(bbox).find_brightest_point
+    else:
+        tracker = BrightnessTracker(bbox)
+
+        def detect(image: np.ndarray) -> Dict:
+            return tracker.find_brightest_point(tracker.preprocess_frame(image))
+
+    def step(frame: Frame) -> List[Tuple[Dict, str]]:
+        result = detect(frame.data)
+        result["timestamp"] = frame_time(frame)
+        result["frame_number"] = frame.index + 1
+        return [(result, "")]
+
+    return step
+
+
+def track_file(
+    path: Union[str, Path],
+    output_dir: Union[str, Path] = ".",
+    tracker: str = "basic",
+    file_format: str = "csv",
+    pattern: str = "*.tif",
+    frame_interval: float = 1.0,
+    prefetch: int = 2,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> Dict:
+    """
+    Track one recording into a brightness log.
+
+    Frames are decoded ahead on ``prefetch`` threads and rows are written
+    by the logger's background thread, so decoding, tracking and writing
+    overlap.
+
+    Parameters
+    ----------
+    path : str or Path
+        Directory of images, TIFF stack or video file
+    output_dir : str or Path, default='.'
+        Directory for the log, named ``brightness_log_<input name>_<time>``
+    tracker : {'basic', 'enhanced', 'multi'}, default='basic'
+        Tracker to run (see ``make_tracker``)
+    file_format : {'csv', 'parquet'}, default='csv'
+        Log file format
+    pattern : str, default='*.tif'
+        Image file pattern inside directories
+    frame_interval : float, default=1.0
+        Time between frames in seconds (directories and TIFF stacks)
+    prefetch : int, default=2
+        Decoder threads; 0 decodes on the tracking thread
+    progress : callable, optional
+        Called as ``progress(done, total)`` after every frame
+
+    Returns
+    -------
+    dict
+        input, output, tracker, frames, rows, seconds, fps, status and
+        error. Failures are reported with status 'error' instead of
+        raising.
+    """
+    path = Path(path)
+    row = {
+        "input": str(path),
+        "output": None,
+        "tracker": tracker,
+        "frames": 0,
+        "rows": 0,
+        "seconds": 0.0,
+        "fps": 0.0,
+        "status": "ok",
+        "error": None,
+    }
+    start = time.perf_counter()
+
+    try:
+        source = open_source(path, pattern, frame_interval)
+        if prefetch > 0:
+            source = PrefetchingSource(source, n_workers=prefetch)
+
+        with source, DataLogger(
+            output_dir,
+            prefix=f"brightness_log_{path.stem}",
+            mode="async",
+            file_format=file_format,
+        ) as data_logger:
+            row["output"] = str(data_logger.filename)
+            total = len(source)
+            step = None
+            for frame in source:
+                if step is None:
+                    step = make_tracker(tracker, frame.data.shape[:2])
+                for data, notes in step(frame):
+                    data_logger.log_point(data, notes)
+                    row["rows"] += 1
+                row["frames"] += 1
+                if progress is not None:
+                    progress(row["frames"], total)
+    except Exception as e:
+        row.update(status="error", error=f"{type(e).__name__}: {e}")
+
+    row["seconds"] = time.perf_counter() - start
+    if row["seconds"] > 0:
+        row["fps"] = row["frames"] / row["seconds"]
+    return row
+
+
+def _frame_progress(name: str, interval: float = 1.0) -> Callable[[int, int], None]:
+    """Progress callback logging frames done at most every ``interval`` s"""
+    start = last = time.perf_counter()
+
+    def report(done: int, total: int):
+        nonlocal last
+        now = time.perf_counter()
+        if now - last >= interval or done == total:
+            last = now
+            fps = done / (now - start) if now > start else 0.0
+            logger.info(f"{name}: {done}/{total} frames ({fps:.0f} fps)")
+
+    return report
+
+
+def track_files(
+    inputs: Sequence[Union[str, Path]],
+    n_workers: Optional[int] = None,
+    progress: bool = True,
+    **kwargs,
+) -> List[Dict]:
+    """
+    Track several recordings, in parallel processes when there are many.
+
+    Parameters
+    ----------
+    inputs : sequence of str or Path
+        Recordings (see ``track_file``)
+    n_workers : int, optional
+        Worker processes; defaults to the CPU count. 1 tracks in the
+        calling process.
+    progress : bool, default=True
+        Log progress: per frame in the calling process, per file with
+        worker processes
+    **kwargs
+        Passed to ``track_file``
+
+    Returns
+    -------
+    list of dict
+        One ``track_file`` row per input, in input order
+    """
+    if n_workers is not None and n_workers < 1:
+        raise ValueError("n_workers must be at least 1")
+
+    total = len(inputs)
+    if n_workers == 1 or total == 1:
+        rows = []
+        for path in inputs:
+            report = _frame_progress(Path(path).name) if progress else None
+            rows.append(track_file(path, progress=report, **kwargs))
+        return rows
+
+    rows = {}
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        futures = {
+            executor.submit(track_file, path, **kwargs): i
+            for i, path in enumerate(inputs)
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            row = future.result()
+            rows[futures[future]] = row
+            if progress:
+                logger.info(
+                    f"[{done}/{total}] {Path(row['input']).name}: "
+                    f"{row['frames']} frames ({row['fps']:.0f} fps)"
+                )
+    return [rows[i] for i in range(total)]
+
+
+def benchmark(
+    trackers: Sequence[str] = TRACKERS,
+    n_frames: int = 200,
+    shape: Tuple[int, int] = (512, 512),
+    n_spots: int = 20,
+    file_format: str = "csv",
+    seed: int = 0,
+) -> List[Dict]:
+    """
+    Time rendering, tracking and logging of synthetic frames.
+
+    Frames are rendered once up front, so every tracker sees the same
+    movie and the tracking time excludes decoding.
+
+    Parameters
+    ----------
+    trackers : sequence of str, default=all
+        Trackers to benchmark
+    n_frames : int, default=200
+        Frames per run
+    shape : tuple of int, default=(512, 512)
+        Frame (height, width)
+    n_spots : int, default=20
+        Spots per frame
+    file_format : {'csv', 'parquet'}, default='csv'
+        Log file format
+    seed : int, default=0
+        Random seed of the synthetic movie
+
+    Returns
+    -------
+    list of dict
+        Per tracker: tracker, frames, rows, and frames per second of the
+        render, track and log stages
+    """
+    source = SyntheticSource(n_frames=n_frames, shape=shape, n_spots=n_spots, seed=seed)
+    start = time.perf_counter()
+    frames = list(source)
+    render_fps = n_frames / (time.perf_counter() - start)
+
+    results = []
+    with tempfile.TemporaryDirectory() as output_dir:
+        for kind in trackers:
+            step = make_tracker(kind, shape)
+            start = time.perf_counter()
+            rows = [step(frame) for frame in frames]
+            track_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            with DataLogger(
+                output_dir, prefix=kind, mode="buffered", file_format=file_format
+            ) as data_logger:
+                for frame_rows in rows:
+                    for data, notes in frame_rows:
+                        data_logger.log_point(data, notes)
+            log_seconds = time.perf_counter() - start
+
+            results.append(
+                {
+                    "tracker": kind,
+                    "frames": n_frames,
+                    "rows": sum(len(r) for r in rows),
+                    "render_fps": render_fps,
+                    "track_fps": n_frames / track_seconds,
+                    "log_fps": n_frames / log_seconds,
+                }
+            )
+
+    return results
+
+
+def _run_track(args) -> int:
+    inputs = [Path(p) for p in args.inputs]
+    missing = [str(p) for p in inputs if not p.exists()]
+    if missing:
+        logger.error(f"No such file or directory: {', '.join(missing)}")
+        return 2
+
+    rows = track_files(
+        inputs,
+        n_workers=args.workers,
+        progress=not args.quiet,
+        output_dir=args.output,
+        tracker=args.tracker,
+        file_format=args.format,
+        pattern=args.pattern,
+        frame_interval=args.interval,
+        prefetch=args.prefetch,
+    )
+
+    failed = 0
+    for row in rows:
+        if row["status"] == "ok":
+            logger.info(f"{row['input']} -> {row['output']} ({row['rows']} rows)")
+        else:
+            failed += 1
+            logger.error(f"{row['input']} failed: {row['error']}")
+    return 1 if failed else 0
+
+
+def _run_bench(args) -> int:
+    results = benchmark(
+        trackers=args.tracker or TRACKERS,
+        n_frames=args.frames,
+        shape=tuple(args.size),
+        n_spots=args.spots,
+        file_format=args.format,
+        seed=args.seed,
+    )
+
+    logger.info(
+        f"{'tracker':<10}{'rows':>8}{'render fps':>12}{'track fps':>12}"
+        f"{'log fps':>12}"
+    )
+    for r in results:
+        logger.info(
+            f"{r['tracker']:<10}{r['rows']:>8}{r['render_fps']:>12.1f}"
+            f"{r['track_fps']:>12.1f}{r['log_fps']:>12.1f}"
+        )
+    return 0
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="fluotrack",
+        description="Fluorescence brightness tracking. "
+        "Without a command, launches the GUI.",
+    )
+    commands = parser.add_subparsers(dest="command", metavar="command")
+
+    track = commands.add_parser(
+        "track", help="track TIFF stacks, videos or image directories"
+    )
+    track.add_argument(
+        "inputs", nargs="+", help="TIFF stacks, video files or image directories"
+    )
+    track.add_argument(
+        "-t", "--tracker", choices=TRACKERS, default="basic", help="tracker to run"
+    )
+    track.add_argument(
+        "-o", "--output", default=".", help="output directory (default: %(default)s)"
+    )
+    track.add_argument(
+        "-f", "--format", choices=DataLogger.FORMATS, default="csv", help="log format"
+    )
+    track.add_argument(
+        "-j", "--workers", type=int, default=None, help="worker processes"
+    )
+    track.add_argument(
+        "--prefetch",
+        type=int,
+        default=2,
+        help="decoder threads per input (default: %(default)s)",
+    )
+    track.add_argument(
+        "--pattern",
+        default="*.tif",
+        help="image pattern inside directories (default: %(default)s)",
+    )
+    track.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+        help="seconds between frames of image stacks (default: %(default)s)",
+    )
+    track.add_argument("-q", "--quiet", action="store_true", help="no progress")
+
+    commands.add_parser(
+        "analyze",
+        add_help=False,
+        help="summarize brightness logs (see 'fluotrack analyze -h')",
+    )
+
+    bench = commands.add_parser(
+        "bench", help="benchmark the trackers on synthetic frames"
+    )
+    bench.add_argument(
+        "-t",
+        "--tracker",
+        choices=TRACKERS,
+        action="append",
+        help="tracker to benchmark, repeatable (default: all)",
+    )
+    bench.add_argument(
+        "-n", "--frames", type=int, default=200, help="frames (default: %(default)s)"
+    )
+    bench.add_argument(
+        "--size",
+        type=int,
+        nargs=2,
+        default=(512, 512),
+        metavar=("HEIGHT", "WIDTH"),
+        help="frame size (default: 512 512)",
+    )
+    bench.add_argument(
+        "--spots", type=int, default=20, help="spots per frame (default: %(default)s)"
+    )
+    bench.add_argument(
+        "-f", "--format", choices=DataLogger.FORMATS, default="csv", help="log format"
+    )
+    bench.add_argument("--seed", type=int, default=0, help="random seed")
+
+    commands.add_parser("gui", help="launch the GUI")
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point of the ``fluotrack`` command"""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # 'analyze' forwards its arguments to the batch analysis command as is
+    if argv and argv[0] == "analyze":
+        from .batch import main as analyze_main
+
+        return analyze_main(argv[1:], prog="fluotrack analyze")
+
+    args = _build_parser().parse_args(argv)
+
+    if args.command in (None, "gui"):
+        from .app import main as gui_main
+
+        gui_main()
+        return 0
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    if args.command == "track":
+        return _run_track(args)
+    return _run_bench(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,125 @@
+"""
+Acquisition timestamps.
+
+Trackers stamp every result with the current time. The default 'wall' clock
+produces ISO 8601 strings, as earlier versions did. The 'monotonic' clock
+produces int64 nanoseconds since the Unix epoch, taken from
+``time.monotonic_ns()`` and anchored to the wall clock once when the clock
+is created. These timestamps are cheap to produce, compare and store, and
+intervals between them are unaffected by wall-clock adjustments (NTP,
+daylight saving). Convert them to datetimes or ISO strings only at export,
+with :func:`to_datetime` or :func:`to_isoformat`.
+"""
+
+import time
+from datetime import datetime
+from typing import Callable, Union
+
+import numpy as np
+
+
+class AcquisitionClock:
+    """
+    Monotonic clock reporting epoch-anchored integer nanoseconds.
+
+    Share one instance between a tracker and a logger so that their
+    timestamps come from the same time base.
+
+    Examples
+    --------
+    >>> clock = AcquisitionClock()
+    >>> t0 = clock.now()
+    >>> to_isoformat(t0)  # doctest: +SKIP
+    '2025-01-17T12:00:00.000000'
+    """
+
+    def __init__(self):
+        self.epoch_ns = time.time_ns()
+        self.monotonic_origin_ns = time.monotonic_ns()
+
+    def now(self) -> int:
+        """Current time in nanoseconds since the Unix epoch"""
+        return self.epoch_ns + (time.monotonic_ns() - self.monotonic_origin_ns)
+
+
+def _wall_clock() -> str:
+    """Current local time as an ISO 8601 string"""
+    return datetime.now().isoformat()
+
+
+def resolve_clock(
+    clock: Union[str, AcquisitionClock, None] = "wall",
+) -> Callable[[], Union[str, int]]:
+    """
+    Turn a clock option into a function returning the current timestamp.
+
+    Parameters
+    ----------
+    clock : {'wall', 'monotonic'} or AcquisitionClock, default='wall'
+        'wall' returns ISO strings, 'monotonic' a new AcquisitionClock's
+        integer nanoseconds; an AcquisitionClock instance is used as is
+
+    Returns
+    -------
+    callable
+        Function returning the current timestamp
+    """
+    if isinstance(clock, AcquisitionClock):
+        return clock.now
+    if clock is None or clock == "wall":
+        return _wall_clock
+    if clock == "monotonic":
+        return AcquisitionClock().now
+    raise ValueError("clock must be 'wall', 'monotonic' or an AcquisitionClock")
+
+
+def to_datetime(timestamps):
+    """
+    Convert integer-nanosecond timestamps to local datetimes.
+
+    Parameters
+    ----------
+    timestamps : int or array-like of int
+        Nanoseconds since the Unix epoch
+
+    Returns
+    -------
+    datetime or np.ndarray
+        A naive local datetime for a scalar, otherwise an array of
+        datetime64[ns] in local time
+    """
+    if np.ndim(timestamps) == 0:
+        seconds, nanoseconds = divmod(int(timestamps), 1_000_000_000)
+        return datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000)
+
+    values = np.asarray(timestamps, dtype=np.int64)
+    offset = _utc_offset_ns(values)
+    return (values + offset).astype("datetime64[ns]")
+
+
+def to_isoformat(timestamp: int) -> str:
+    """Format an integer-nanosecond timestamp as a local ISO 8601 string"""
+    return to_datetime(timestamp).isoformat()
+
+
+def _utc_offset_ns(values: np.ndarray) -> np.ndarray:
+    """Local UTC offset in nanoseconds for each timestamp"""
+    if len(values) == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    # Offsets only change at DST transitions; compute them per distinct hour
+    hours, inverse = np.unique(values // 3_600_000_000_000, return_inverse=True)
+    offsets = np.array(
+        [
+            int(
+                datetime.fromtimestamp(int(h) * 3600)
+                .astimezone()
+                .utcoffset()
+                .total_seconds()
+            )
+            * 1_000_000_000
+            for h in hours
+        ],
+        dtype=np.int64,
+    )
+    return offsets[inverse]
@@ -9,23 +9,68 @@ Key innovations:
 """
 
 import cv2
+import tempfile
 import numpy as np
-from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass
-from scipy.optimize import linear_sum_assignment
-from collections import defaultdict
+from typing import List, Dict, Mapping, Optional
+
+from .analysis import fit_photobleaching
+from .matching import gated_assignment
+from .tracker_enhanced import BatchKalmanFilter
+from .track_store import (
+    FluorescentSpot,
+    SpillStore,
+    TrackAccumulators,
+    TrackHistory,
+    TrackStore,
+    TrackView,
+)
+
+# Frames larger than this are histogrammed with np.bincount, since
+# cv2.calcHist counts in float32 and is only exact up to 2**24
+_CALCHIST_MAX_PIXELS = 2**24
+
+
+def _intensity_histogram(frame: np.ndarray) -> np.ndarray:
+    """Count pixels per intensity level of a uint8 or uint16 frame"""
+    n_levels = int(np.iinfo(frame.dtype).max) + 1
+    if frame.size <= _CALCHIST_MAX_PIXELS:
+        hist = cv2.calcHist([frame], [0], None, [n_levels], [0, n_levels])
+        return hist.ravel().astype(np.int64)
+    return np.bincount(frame.ravel(), minlength=n_levels)
+
+
+def _histogram_median_mad(hist: np.ndarray):
+    """
+    Median and median absolute deviation from an intensity histogram.
+
+    Gives the same values as ``np.median(x)`` and
+    ``np.median(np.abs(x - np.median(x)))`` on the pixels it counts,
+    including the average of the two middle values for an even count.
+    """
+    n = int(hist.sum())
+    ranks = [(n - 1) // 2, n // 2]
+
+    levels = np.arange(len(hist), dtype=np.float64)
+    cumulative = np.cumsum(hist)
+    low, high = levels[np.searchsorted(cumulative, ranks, side="right")]
+    median = (low + high) / 2
 
+    # Same ranks over the levels ordered by distance from the median
+    deviations = np.abs(levels - median)
+    order = np.argsort(deviations, kind="stable")
+    cumulative = np.cumsum(hist[order])
+    low, high = deviations[order][np.searchsorted(cumulative, ranks, side="right")]
+    mad = (low + high) / 2
 
-@dataclass
-class FluorescentSpot:
-    """Represents a single fluorescent spot"""
+    return median, mad
 
-    id: int
-    location: Tuple[int, int]
-    intensity: float
-    area: int
-    frame_number: int
-    timestamp: str
+
+def _robust_statistics(frame: np.ndarray):
+    """Median and MAD of a frame, from a histogram for 8/16-bit integers"""
+    if frame.dtype in (np.uint8, np.uint16):
+        return _histogram_median_mad(_intensity_histogram(frame))
+    median = np.median(frame)
+    return median, np.median(np.abs(frame - median))
 
 
 class AdaptiveSpotDetector:
@@ -42,6 +87,9 @@ class AdaptiveSpotDetector:
         max_spot_area: int = 1000,
         sensitivity: float = 2.0,
         denoising: bool = True,
+        engine: str = "contours",
+        threshold_stride: int = 1,
+        threshold_reuse_tolerance: Optional[float] = None,
     ):
         """
         Parameters
@@ -55,11 +103,33 @@ class AdaptiveSpotDetector:
             Threshold = mean + sensitivity * std
         denoising : bool
             Whether to apply Gaussian denoising
+        engine : str, default="contours"
+            Spot measurement engine. "contours" measures each contour in a
+            Python loop. "components" labels connected components and
+            measures all spots in one vectorized pass; its area is the
+            pixel count rather than the contour polygon area.
+        threshold_stride : int, default=1
+            Estimate background statistics from every n-th pixel in each
+            direction. 1 uses the full frame.
+        threshold_reuse_tolerance : float, optional
+            If set, keep the previous frame's threshold while a coarse
+            probe of the background (every 16th pixel) stays within this
+            many standard deviations of the probe taken when the threshold
+            was last computed.
         """
+        if engine not in ("contours", "components"):
+            raise ValueError("engine must be 'contours' or 'components'")
+
         self.min_spot_area = min_spot_area
         self.max_spot_area = max_spot_area
         self.sensitivity = sensitivity
         self.denoising = denoising
+        self.engine = engine
+        self.threshold_stride = threshold_stride
+        self.threshold_reuse_tolerance = threshold_reuse_tolerance
+
+        # (probe median, probe MAD, threshold) of the last full estimate
+        self._threshold_cache = None
 
     def detect_spots(self, frame: np.ndarray) -> List[Dict]:
         """
@@ -68,7 +138,8 @@ class AdaptiveSpotDetector:
         Parameters
         ----------
         frame : np.ndarray
-            Grayscale image
+            Grayscale image (uint8, uint16 or float32), processed in its
+            own dtype
 
         Returns
         -------
@@ -87,14 +158,17 @@ class AdaptiveSpotDetector:
         # Innovation: Use percentile-based threshold instead of fixed value
         threshold = self._calculate_adaptive_threshold(frame)
 
-        # Create binary mask
-        _, binary = cv2.threshold(frame, threshold, 255, cv2.THRESH_BINARY)
+        # Create binary mask (uint8 for any input dtype)
+        binary = cv2.compare(frame, float(threshold), cv2.CMP_GT)
 
         # Morphological operations to clean up
         kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3))
         binary = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel)
         binary = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel)
 
+        if self.engine == "components":
+            return self._measure_components(frame, binary)
+
         # Find contours (potential spots)
         contours, _ = cv2.findContours(
             binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
@@ -137,16 +211,119 @@ class AdaptiveSpotDetector:
 
         return spots
 
+    def _measure_components(self, frame: np.ndarray, binary: np.ndarray) -> List[Dict]:
+        """
+        Measure all spots from a labeled connected-component image.
+
+        Foreground pixels are sorted once by (label, intensity). Area, bounding
+        box, mean intensity and the brightest pixel of every spot then come
+        from segment reductions over that order, without a Python loop.
+        """
+        n_labels, labels = cv2.connectedComponents(
+            binary, connectivity=8, ltype=cv2.CV_32S
+        )
+        if n_labels <= 1:
+            return []
+
+        foreground = np.flatnonzero(binary.ravel() > 0)
+        spot_labels = labels.ravel()[foreground]
+        values = frame.ravel()[foreground]
+
+        # Sort by label, then value; within equal values keep raster order
+        if np.issubdtype(frame.dtype, np.integer):
+            key = spot_labels.astype(np.int64) * (int(np.iinfo(frame.dtype).max) + 1)
+            key += values
+            order = np.argsort(key, kind="stable")
+        else:
+            key = None
+            order = np.lexsort((values, spot_labels))
+
+        sorted_labels = spot_labels[order]
+        starts = np.flatnonzero(np.r_[True, sorted_labels[1:] != sorted_labels[:-1]])
+        areas = np.diff(np.r_[starts, len(order)])
+
+        sorted_values = values[order].astype(np.float64)
+        means = np.add.reduceat(sorted_values, starts) / areas
+
+        # Brightest pixel: first pixel (raster order) with the segment maximum
+        last = np.r_[starts[1:], len(order)] - 1
+        if key is not None:
+            sorted_key = key[order]
+            peak = np.searchsorted(sorted_key, sorted_key[last], side="left")
+        else:
+            peak = last
+            while True:
+                previous = np.maximum(peak - 1, starts)
+                same = (previous < peak) & (
+                    sorted_values[previous] == sorted_values[peak]
+                )
+                if not same.any():
+                    break
+                peak = np.where(same, previous, peak)
+        peak_index = foreground[order[peak]]
+        peak_value = sorted_values[peak]
+
+        width = frame.shape[1]
+        xs = foreground[order] % width
+        ys = foreground[order] // width
+        x_min = np.minimum.reduceat(xs, starts)
+        y_min = np.minimum.reduceat(ys, starts)
+        x_max = np.maximum.reduceat(xs, starts)
+        y_max = np.maximum.reduceat(ys, starts)
+
+        keep = np.flatnonzero(
+            (areas >= self.min_spot_area) & (areas <= self.max_spot_area)
+        )
+        keep = keep[np.argsort(-means[keep], kind="stable")]
+
+        spots = []
+        for i in keep.tolist():
+            spots.append(
+                {
+                    "location": (
+                        int(peak_index[i] % width),
+                        int(peak_index[i] // width),
+                    ),
+                    "intensity": float(means[i]),
+                    "max_intensity": float(peak_value[i]),
+                    "area": int(areas[i]),
+                    "bbox": (
+                        int(x_min[i]),
+                        int(y_min[i]),
+                        int(x_max[i] - x_min[i] + 1),
+                        int(y_max[i] - y_min[i] + 1),
+                    ),
+                }
+            )
+
+        return spots
+
     def _calculate_adaptive_threshold(self, frame: np.ndarray) -> float:
         """
         Calculate adaptive threshold based on image statistics.
 
         Innovation: Uses robust statistics (median, MAD) instead of mean/std
-        to handle outliers better.
+        to handle outliers better. For uint8/uint16 frames both come from a
+        single intensity histogram instead of two full-frame sorts.
         """
+        probe = None
+        if self.threshold_reuse_tolerance is not None:
+            probe = _robust_statistics(frame[::16, ::16])
+            if self._threshold_cache is not None:
+                probe_median, probe_mad, threshold = self._threshold_cache
+                tolerance = self.threshold_reuse_tolerance * max(
+                    1.4826 * probe_mad, 1.0
+                )
+                if (
+                    abs(probe[0] - probe_median) <= tolerance
+                    and abs(probe[1] - probe_mad) <= tolerance
+                ):
+                    return threshold
+
         # Use median and MAD (Median Absolute Deviation) for robustness
-        median = np.median(frame)
-        mad = np.median(np.abs(frame - median))
+        stride = self.threshold_stride
+        sample = frame[::stride, ::stride] if stride > 1 else frame
+        median, mad = _robust_statistics(sample)
 
         # Convert MAD to standard deviation equivalent
         std_estimate = 1.4826 * mad
@@ -154,6 +331,9 @@ class AdaptiveSpotDetector:
         # Threshold: median + sensitivity * std
         threshold = median + self.sensitivity * std_estimate
 
+        if probe is not None:
+            self._threshold_cache = (probe[0], probe[1], threshold)
+
         return threshold
 
 
@@ -165,19 +345,67 @@ class MultiTargetTracker:
     handles spot appearance/disappearance, maintains trajectory history.
     """
 
-    def __init__(self, max_distance: float = 50.0):
+    def __init__(
+        self,
+        max_distance: float = 50.0,
+        n_workers: Optional[int] = None,
+        memory_budget: Optional[int] = None,
+        spill_dir: Optional[str] = None,
+        use_kalman: bool = False,
+    ):
         """
         Parameters
         ----------
         max_distance : float
             Maximum distance (pixels) to consider same spot between frames
+        n_workers : int, optional
+            If greater than 1, solve independent assignment components
+            on a thread pool of this size
+        memory_budget : int, optional
+            Number of observations kept in memory before finished tracks
+            are moved to an on-disk store, in batches that bring memory
+            down to half the budget. This is a soft limit: rows of active
+            tracks are never spilled, so while they alone exceed the budget
+            further spills wait for another half budget of rows. None
+            keeps everything in memory.
+        spill_dir : str, optional
+            Directory for spilled tracks. Defaults to a new temporary
+            directory when memory_budget is set.
+        use_kalman : bool, default=False
+            Predict every active track with a batched constant-velocity
+            Kalman filter and match spots against the predicted positions
+            instead of the last seen locations
         """
         self.max_distance = max_distance
+        self.n_workers = n_workers
+        self.memory_budget = memory_budget
+        self.spill_dir = spill_dir
         self.next_id = 0
         self.active_tracks = {}  # id -> track info
-        self.track_history = defaultdict(list)  # id -> list of observations
+        self.tracks = TrackStore()  # columnar observation history
+        self.spill = None  # on-disk store of finished tracks
+        self.finished_tracks = []  # ids dropped from active_tracks, in memory
+        self._spill_at = 0  # store size that triggers the next spill
         self.frame_number = 0
 
+        # One filter row per active track, in active_tracks order
+        self.kalman = BatchKalmanFilter() if use_kalman else None
+        # Running per-track statistics of the tracks not yet spilled
+        self.track_stats = TrackAccumulators()
+
+    @property
+    def bleaching(self):
+        """
+        OnlineBleachingEstimator of the intensity of every track in memory,
+        at the rows given by ``track_stats.rows``
+        """
+        return self.track_stats.intensity
+
+    @property
+    def track_history(self) -> TrackHistory:
+        """Mapping of track id -> TrackView of all observations"""
+        return TrackHistory(self.tracks, self.spill)
+
     def update(self, spots: List[Dict], timestamp: str) -> List[FluorescentSpot]:
         """
         Update tracks with new detections.
@@ -198,13 +426,63 @@ class MultiTargetTracker:
 
         if not self.active_tracks:
             # First frame: create new tracks
-            return self._initialize_tracks(spots, timestamp)
+            tracked_spots = self._initialize_tracks(spots, timestamp)
+        else:
+            # Match current spots to existing tracks
+            tracked_spots = self._match_spots_to_tracks(spots, timestamp)
 
-        # Match current spots to existing tracks
-        tracked_spots = self._match_spots_to_tracks(spots, timestamp)
+        self._record(tracked_spots, timestamp)
+        self._apply_retention()
 
         return tracked_spots
 
+    def _record(self, tracked_spots: List[FluorescentSpot], timestamp: str):
+        """
+        Append this frame's observations to the track store and the running
+        per-track statistics
+        """
+        if not tracked_spots:
+            return
+
+        ids = [spot.id for spot in tracked_spots]
+        x = [spot.location[0] for spot in tracked_spots]
+        y = [spot.location[1] for spot in tracked_spots]
+        intensity = [spot.intensity for spot in tracked_spots]
+
+        self.tracks.set_timestamp(self.frame_number, timestamp)
+        self.tracks.append(
+            ids=ids,
+            frames=np.full(len(tracked_spots), self.frame_number),
+            x=x,
+            y=y,
+            intensity=intensity,
+            area=[spot.area for spot in tracked_spots],
+        )
+        self.track_stats.update(ids, x, y, intensity)
+
+    def _apply_retention(self):
+        """Spill finished tracks to disk once the memory budget is exceeded"""
+        if self.memory_budget is None or not self.finished_tracks:
+            return
+        if len(self.tracks) <= max(self.memory_budget, self._spill_at):
+            return
+
+        if self.spill is None:
+            spill_dir = self.spill_dir or tempfile.mkdtemp(prefix="fluotrack_")
+            self.spill = SpillStore(spill_dir)
+
+        timestamps = self.tracks.timestamps
+        finished = self.tracks.pop_tracks(self.finished_tracks)
+        statistics = self.track_stats.release(self.finished_tracks)
+        self.spill.append(finished, timestamps, statistics)
+        self.finished_tracks = []
+
+        # Spilling leaves only active tracks in memory. If they still hold
+        # more than the low-water mark, wait until another half budget of
+        # rows arrives instead of writing a small chunk every frame.
+        low_water = self.memory_budget // 2
+        self._spill_at = len(self.tracks) + self.memory_budget - low_water
+
     def _initialize_tracks(
         self, spots: List[Dict], timestamp: str
     ) -> List[FluorescentSpot]:
@@ -227,9 +505,11 @@ class MultiTargetTracker:
                 "last_location": spot["location"],
                 "last_seen": self.frame_number,
             }
-            self.track_history[track_id].append(tracked_spot)
             tracked_spots.append(tracked_spot)
 
+        if self.kalman is not None:
+            self.kalman.add([spot["location"] for spot in spots])
+
         return tracked_spots
 
     def _match_spots_to_tracks(
@@ -239,56 +519,60 @@ class MultiTargetTracker:
         Match detected spots to existing tracks using Hungarian algorithm.
 
         Innovation: Optimal assignment that minimizes total distance.
+        Candidate pairs are gated to ``max_distance`` with a KD-tree, and
+        groups of tracks and spots that cannot compete with each other are
+        solved as independent components. With ``use_kalman``, tracks are
+        matched at their predicted positions.
         """
-        if not spots:
-            return []
-
-        # Build cost matrix (distances between spots and tracks)
         track_ids = list(self.active_tracks.keys())
-        n_tracks = len(track_ids)
-        n_spots = len(spots)
 
-        cost_matrix = np.zeros((n_tracks, n_spots))
+        if self.kalman is not None:
+            # Advance all tracks by one frame, even if nothing was detected
+            track_positions = self.kalman.predict()
+        else:
+            track_positions = np.array(
+                [self.active_tracks[tid]["last_location"] for tid in track_ids],
+                dtype=np.float64,
+            ).reshape(-1, 2)
 
-        for i, track_id in enumerate(track_ids):
-            last_loc = self.active_tracks[track_id]["last_location"]
+        if not spots:
+            return []
 
-            for j, spot in enumerate(spots):
-                current_loc = spot["location"]
-                distance = np.sqrt(
-                    (current_loc[0] - last_loc[0]) ** 2
-                    + (current_loc[1] - last_loc[1]) ** 2
-                )
-                cost_matrix[i, j] = distance
+        spot_positions = np.array(
+            [spot["location"] for spot in spots], dtype=np.float64
+        ).reshape(-1, 2)
 
-        # Hungarian algorithm for optimal assignment
-        row_ind, col_ind = linear_sum_assignment(cost_matrix)
+        # Gated Hungarian assignment, solved per connected component
+        row_ind, col_ind = gated_assignment(
+            track_positions, spot_positions, self.max_distance, self.n_workers
+        )
 
         tracked_spots = []
         matched_spots = set()
 
         # Process matched pairs
         for i, j in zip(row_ind, col_ind):
-            if cost_matrix[i, j] <= self.max_distance:
-                track_id = track_ids[i]
-                spot = spots[j]
+            track_id = track_ids[i]
+            spot = spots[j]
 
-                tracked_spot = FluorescentSpot(
-                    id=track_id,
-                    location=spot["location"],
-                    intensity=spot["intensity"],
-                    area=spot["area"],
-                    frame_number=self.frame_number,
-                    timestamp=timestamp,
-                )
+            tracked_spot = FluorescentSpot(
+                id=track_id,
+                location=spot["location"],
+                intensity=spot["intensity"],
+                area=spot["area"],
+                frame_number=self.frame_number,
+                timestamp=timestamp,
+            )
 
-                # Update track
-                self.active_tracks[track_id]["last_location"] = spot["location"]
-                self.active_tracks[track_id]["last_seen"] = self.frame_number
-                self.track_history[track_id].append(tracked_spot)
+            # Update track
+            self.active_tracks[track_id]["last_location"] = spot["location"]
+            self.active_tracks[track_id]["last_seen"] = self.frame_number
 
-                tracked_spots.append(tracked_spot)
-                matched_spots.add(j)
+            tracked_spots.append(tracked_spot)
+            matched_spots.add(j)
+
+        if self.kalman is not None:
+            self.kalman.update(row_ind, spot_positions[col_ind])
 
         # Create new tracks for unmatched spots
         for j, spot in enumerate(spots):
@@ -308,17 +592,26 @@ class MultiTargetTracker:
                     "last_location": spot["location"],
                     "last_seen": self.frame_number,
                 }
-                self.track_history[track_id].append(tracked_spot)
                 tracked_spots.append(tracked_spot)
 
+        if self.kalman is not None:
+            new_spots = [j for j in range(len(spots)) if j not in matched_spots]
+            self.kalman.add(spot_positions[new_spots])
+
         # Remove stale tracks (not seen for 5 frames)
         stale_ids = [
             tid
             for tid, info in self.active_tracks.items()
             if self.frame_number - info["last_seen"] > 5
         ]
+        if self.kalman is not None and stale_ids:
+            stale = set(stale_ids)
+            self.kalman.remove(
+                [i for i, tid in enumerate(self.active_tracks) if tid in stale]
+            )
         for tid in stale_ids:
             del self.active_tracks[tid]
+        self.finished_tracks.extend(stale_ids)
 
         return tracked_spots
 
@@ -342,50 +635,79 @@ class MultiTargetTracker:
             - displacement: total distance traveled
             - velocity: average movement per frame
         """
-        if track_id not in self.track_history:
-            return {}
+        # Maintained incrementally as observations arrive and stored with
+        # spilled tracks, so this never reads the track history back
+        if track_id in self.track_stats:
+            return self.track_stats.statistics(track_id)
+        if self.spill is not None:
+            return self.spill.statistics(track_id)
+        return {}
+
+    def track_population(self) -> Dict[str, np.ndarray]:
+        """
+        Per-track statistics columns of all tracks.
 
-        track = self.track_history[track_id]
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            TrackAccumulators.population columns of the spilled tracks
+            followed by the tracks in memory
+        """
+        population = self.track_stats.population()
+        spilled = self.spill.population() if self.spill is not None else {}
+        if not spilled:
+            return population
+        return {
+            name: np.concatenate([spilled[name], population[name]])
+            for name in population
+        }
 
-        if len(track) < 2:
-            return {
-                "duration": 1,
-                "mean_intensity": track[0].intensity,
-                "intensity_trend": 0.0,
-                "total_displacement": 0.0,
-                "mean_velocity": 0.0,
-                "is_photobleaching": False,
-            }
+    def get_bleaching(self, track_id: int) -> Dict:
+        """
+        Live bleaching estimates of a track.
 
-        # Intensity statistics
-        intensities = [spot.intensity for spot in track]
-        mean_intensity = np.mean(intensities)
+        Returns
+        -------
+        Dict
+            OnlineBleachingEstimator.summary of the track, with the rate
+            and half-life per observation; empty for unknown and spilled
+            tracks
+        """
+        if track_id not in self.track_stats:
+            return {}
+        return self.bleaching.summary(self.track_stats.rows([track_id])[0])
 
-        # Fit linear trend
-        frames = np.arange(len(track))
-        intensity_trend = np.polyfit(frames, intensities, 1)[0]
+    def bleached_tracks(self, min_fraction: float) -> List[int]:
+        """
+        Active tracks whose fitted intensity fell below ``min_fraction`` of
+        its initial value.
+        """
+        ids = np.fromiter(self.active_tracks, dtype=np.intp)
+        rows = self.track_stats.rows(ids.tolist())
+        bleached = self.bleaching.is_bleached(min_fraction)[rows]
+        return ids[bleached].tolist()
 
-        # Movement statistics
-        positions = [spot.location for spot in track]
-        distances = [
-            np.sqrt(
-                (positions[i + 1][0] - positions[i][0]) ** 2
-                + (positions[i + 1][1] - positions[i][1]) ** 2
-            )
-            for i in range(len(positions) - 1)
-        ]
+    def fit_bleaching(self, model: str = "mono", **kwargs) -> Dict[str, np.ndarray]:
+        """
+        Fit exponential bleaching curves to every track in one batch.
 
-        total_displacement = sum(distances)
-        mean_velocity = np.mean(distances) if distances else 0
+        Parameters
+        ----------
+        model : {'mono', 'bi'}, default='mono'
+            Decay model, see :func:`fluotrack.analysis.fit_photobleaching`
+        **kwargs
+            Further options for ``fit_photobleaching``
 
-        return {
-            "duration": len(track),
-            "mean_intensity": float(mean_intensity),
-            "intensity_trend": float(intensity_trend),
-            "total_displacement": float(total_displacement),
-            "mean_velocity": float(mean_velocity),
-            "is_photobleaching": intensity_trend < -0.5,
-        }
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            ``fit_photobleaching`` results against frame number, plus
+            'track_id' with the id of every row
+        """
+        track_ids, frames, intensities = self.track_history.padded("intensity")
+        result = fit_photobleaching(intensities, frames, model=model, **kwargs)
+        result["track_id"] = track_ids
+        return result
 
 
 class EnhancedFluoTracker:
@@ -401,6 +723,11 @@ class EnhancedFluoTracker:
         max_spot_area: int = 1000,
         sensitivity: float = 2.0,
         max_tracking_distance: float = 50.0,
+        tracking_workers: Optional[int] = None,
+        memory_budget: Optional[int] = None,
+        spill_dir: Optional[str] = None,
+        use_kalman: bool = False,
+        detection_engine: str = "contours",
     ):
         """
         Parameters
@@ -413,13 +740,31 @@ class EnhancedFluoTracker:
             Detection sensitivity (2.0 = 2 std above background)
         max_tracking_distance : float
             Maximum distance for tracking between frames
+        tracking_workers : int, optional
+            Thread pool size for solving assignment components
+        memory_budget : int, optional
+            Soft limit on observations kept in memory before finished
+            tracks are spilled to disk, see MultiTargetTracker
+        spill_dir : str, optional
+            Directory for spilled tracks
+        use_kalman : bool, default=False
+            Match spots against Kalman-predicted track positions
+        detection_engine : str, default="contours"
+            Spot measurement engine ("contours" or "components")
         """
         self.detector = AdaptiveSpotDetector(
             min_spot_area=min_spot_area,
             max_spot_area=max_spot_area,
             sensitivity=sensitivity,
+            engine=detection_engine,
+        )
+        self.tracker = MultiTargetTracker(
+            max_distance=max_tracking_distance,
+            n_workers=tracking_workers,
+            memory_budget=memory_budget,
+            spill_dir=spill_dir,
+            use_kalman=use_kalman,
         )
-        self.tracker = MultiTargetTracker(max_distance=max_tracking_distance)
 
     def process_frame(self, frame: np.ndarray, timestamp: str) -> List[FluorescentSpot]:
         """
@@ -445,9 +790,18 @@ class EnhancedFluoTracker:
 
         return tracked_spots
 
-    def get_all_tracks(self) -> Dict[int, List[FluorescentSpot]]:
-        """Get all track histories"""
-        return dict(self.tracker.track_history)
+    def get_all_tracks(self) -> Mapping[int, TrackView]:
+        """
+        Get all track histories.
+
+        Returns
+        -------
+        Mapping[int, TrackView]
+            Track id -> view of its observations. Each view yields
+            FluorescentSpot objects and exposes frame, x, y, intensity
+            and area arrays.
+        """
+        return self.tracker.track_history
 
     def get_track_stats(self, track_id: int) -> Dict:
         """Get statistics for specific track"""
@@ -458,35 +812,23 @@ class EnhancedFluoTracker:
         Get population-level statistics.
 
         Innovation: Analyze collective behavior of all spots.
+        Computed from the running per-track statistics in one vectorized
+        pass over the tracks, without reading any track history.
         """
-        all_tracks = self.tracker.track_history
+        population = self.tracker.track_population()
 
-        if not all_tracks:
-            return {}
-
-        # Count active tracks
-        n_tracks = len(all_tracks)
+        n_tracks = len(population["track_id"])
 
-        # Average properties
-        all_intensities = []
-        all_velocities = []
-        photobleaching_count = 0
+        if n_tracks == 0:
+            return {}
 
-        for track_id in all_tracks:
-            stats = self.get_track_stats(track_id)
-            if stats:
-                all_intensities.append(stats["mean_intensity"])
-                if "mean_velocity" in stats:
-                    all_velocities.append(stats["mean_velocity"])
-                if stats.get("is_photobleaching", False):
-                    photobleaching_count += 1
+        intensities = population["mean_intensity"]
+        photobleaching_count = int(np.sum(population["intensity_trend"] < -0.5))
 
         return {
             "total_tracks": n_tracks,
-            "mean_intensity": float(np.mean(all_intensities)) if all_intensities else 0,
-            "std_intensity": float(np.std(all_intensities)) if all_intensities else 0,
-            "mean_velocity": float(np.mean(all_velocities)) if all_velocities else 0,
-            "photobleaching_fraction": (
-                photobleaching_count / n_tracks if n_tracks > 0 else 0
-            ),
+            "mean_intensity": float(np.mean(intensities)),
+            "std_intensity": float(np.std(intensities)),
+            "mean_velocity": float(np.mean(population["mean_velocity"])),
+            "photobleaching_fraction": photobleaching_count / n_tracks,
         }
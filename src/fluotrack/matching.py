@@ -0,0 +1,222 @@
+"""
+Gated track-to-spot assignment for multi-target tracking.
+
+Instead of solving one dense Hungarian problem over every track/spot pair,
+candidate pairs are first found with a KD-tree within the gating distance.
+The candidate graph is then split into connected components, and each
+component is solved as a small assignment problem of its own, with all
+non-candidate pairs marked as infeasible.
+"""
+
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
+# scipy is imported inside the functions that use it, so importing the
+# trackers stays cheap until the first frame is matched
+
+
+def find_candidate_pairs(
+    track_positions: np.ndarray, spot_positions: np.ndarray, max_distance: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Find all track/spot pairs closer than the gating distance.
+
+    Parameters
+    ----------
+    track_positions : np.ndarray
+        Array of shape (n_tracks, 2) with (x, y) track positions
+    spot_positions : np.ndarray
+        Array of shape (n_spots, 2) with (x, y) spot positions
+    max_distance : float
+        Gating distance in pixels (inclusive)
+
+    Returns
+    -------
+    tuple of np.ndarray
+        (track_indices, spot_indices, distances) for every candidate pair
+    """
+    if len(track_positions) == 0 or len(spot_positions) == 0:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty, np.empty(0, dtype=np.float64)
+
+    from scipy.spatial import cKDTree
+
+    track_tree = cKDTree(np.asarray(track_positions, dtype=np.float64))
+    spot_tree = cKDTree(np.asarray(spot_positions, dtype=np.float64))
+    pairs = track_tree.sparse_distance_matrix(
+        spot_tree, max_distance, output_type="ndarray"
+    )
+
+    rows = pairs["i"].astype(np.intp)
+    cols = pairs["j"].astype(np.intp)
+    distances = pairs["v"].astype(np.float64)
+
+    return rows, cols, distances
+
+
+def connected_components(
+    rows: np.ndarray, cols: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Split the bipartite candidate graph into connected components.
+
+    Parameters
+    ----------
+    rows, cols : np.ndarray
+        Row and column indices of the candidate pairs (graph edges)
+
+    Returns
+    -------
+    tuple of np.ndarray
+        (edge_labels, local_rows, local_cols): component label of every edge
+        and the compact row/column index of every edge. Rows and columns are
+        numbered in sorted order of their original indices.
+    """
+    unique_rows, local_rows = np.unique(rows, return_inverse=True)
+    unique_cols, local_cols = np.unique(cols, return_inverse=True)
+    n_rows = len(unique_rows)
+    n_nodes = n_rows + len(unique_cols)
+
+    from scipy.sparse import coo_matrix, csgraph
+
+    graph = coo_matrix(
+        (np.ones(len(rows), dtype=np.int8), (local_rows, local_cols + n_rows)),
+        shape=(n_nodes, n_nodes),
+    )
+    _, node_labels = csgraph.connected_components(graph, directed=False)
+
+    return node_labels[local_rows], local_rows, local_cols
+
+
+def _solve_dense(
+    rows: np.ndarray, cols: np.ndarray, costs: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Solve one assignment problem over the rows and columns of its candidates.
+
+    Non-candidate entries get a penalty larger than any feasible total cost,
+    so the solver first maximizes the number of feasible matches and then
+    minimizes their cost.
+    """
+    unique_rows, local_rows = np.unique(rows, return_inverse=True)
+    unique_cols, local_cols = np.unique(cols, return_inverse=True)
+
+    penalty = (float(np.max(costs)) + 1.0) * (
+        min(len(unique_rows), len(unique_cols)) + 1
+    )
+    cost_matrix = np.full((len(unique_rows), len(unique_cols)), penalty)
+    cost_matrix[local_rows, local_cols] = costs
+
+    from scipy.optimize import linear_sum_assignment
+
+    row_ind, col_ind = linear_sum_assignment(cost_matrix)
+    feasible = cost_matrix[row_ind, col_ind] < penalty
+
+    return unique_rows[row_ind[feasible]], unique_cols[col_ind[feasible]]
+
+
+def solve_assignment(
+    rows: np.ndarray,
+    cols: np.ndarray,
+    costs: np.ndarray,
+    n_workers: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Solve a sparse assignment problem given as candidate (row, col, cost) triples.
+
+    The candidate graph is split into connected components, and each
+    component is solved on its own, since rows and columns in different
+    components never compete. Components with a single candidate pair are
+    matched directly. For spatially sparse data this makes the cost roughly
+    linear in the number of candidates instead of cubic.
+
+    Parameters
+    ----------
+    rows, cols : np.ndarray
+        Row and column indices of the candidate pairs
+    costs : np.ndarray
+        Cost of each candidate pair
+    n_workers : int, optional
+        If greater than 1, solve components on a thread pool of this size
+
+    Returns
+    -------
+    tuple of np.ndarray
+        (matched_rows, matched_cols) in the original index space, sorted by row
+    """
+    if len(rows) == 0:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+
+    rows = np.asarray(rows, dtype=np.intp)
+    cols = np.asarray(cols, dtype=np.intp)
+    costs = np.asarray(costs, dtype=np.float64)
+
+    edge_labels, _, _ = connected_components(rows, cols)
+
+    # Group edges by component
+    order = np.argsort(edge_labels, kind="stable")
+    sorted_labels = edge_labels[order]
+    starts = np.flatnonzero(np.r_[True, sorted_labels[1:] != sorted_labels[:-1]])
+    sizes = np.diff(np.r_[starts, len(order)])
+
+    # A component with a single candidate pair is its own optimal matching
+    single = order[starts[sizes == 1]]
+    matched_rows = [rows[single]]
+    matched_cols = [cols[single]]
+
+    groups = [
+        order[start : start + size]
+        for start, size in zip(starts[sizes > 1], sizes[sizes > 1])
+    ]
+
+    def solve(edges):
+        return _solve_dense(rows[edges], cols[edges], costs[edges])
+
+    if n_workers is not None and n_workers > 1 and len(groups) > 1:
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            results = list(executor.map(solve, groups))
+    else:
+        results = [solve(edges) for edges in groups]
+
+    for component_rows, component_cols in results:
+        matched_rows.append(component_rows)
+        matched_cols.append(component_cols)
+
+    matched_rows = np.concatenate(matched_rows)
+    matched_cols = np.concatenate(matched_cols)
+    by_row = np.argsort(matched_rows, kind="stable")
+
+    return matched_rows[by_row], matched_cols[by_row]
+
+
+def gated_assignment(
+    track_positions: np.ndarray,
+    spot_positions: np.ndarray,
+    max_distance: float,
+    n_workers: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Assign spots to tracks, allowing only pairs within the gating distance.
+
+    Parameters
+    ----------
+    track_positions : np.ndarray
+        Array of shape (n_tracks, 2) with (x, y) track positions
+    spot_positions : np.ndarray
+        Array of shape (n_spots, 2) with (x, y) spot positions
+    max_distance : float
+        Maximum distance (pixels) for a valid match
+    n_workers : int, optional
+        If greater than 1, solve independent components on a thread pool
+
+    Returns
+    -------
+    tuple of np.ndarray
+        (track_indices, spot_indices) of the matched pairs
+    """
+    rows, cols, distances = find_candidate_pairs(
+        track_positions, spot_positions, max_distance
+    )
+    return solve_assignment(rows, cols, distances, n_workers=n_workers)
@@ -0,0 +1,252 @@
+"""
+Staged acquisition pipeline.
+
+Capture, processing and logging run on their own threads, connected by
+bounded queues, so the frame rate is limited by the slowest stage instead of
+the sum of all stages. Display runs on the calling thread (GUI toolkits such
+as OpenCV's HighGUI expect the main thread) at its own capped rate and only
+ever shows the newest processed frame, so a slow display never holds back
+tracking.
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of the stream in the stage queues
+_END = object()
+
+
+class AcquisitionPipeline:
+    """
+    Run capture -> process -> log on threads and display on the caller.
+
+    Parameters
+    ----------
+    capture : callable
+        ``capture() -> frame``, called repeatedly on the capture thread
+    process : callable
+        ``process(frame) -> result``, called on the processing thread in
+        capture order
+    log : callable, optional
+        ``log(result)``, called on the logging thread in capture order
+    queue_size : int, default=4
+        Capacity of each queue between stages. A full queue blocks the
+        stage before it, which bounds memory and latency.
+    display_fps : float, default=30.0
+        Maximum display refresh rate
+    stop_when : callable, optional
+        ``stop_when(result) -> bool``, checked on the processing thread;
+        True stops the acquisition after that result is logged
+    max_frames : int, optional
+        Stop after capturing this many frames
+
+    Attributes
+    ----------
+    captured, processed, logged, displayed : int
+        Frames that passed each stage
+    """
+
+    def __init__(
+        self,
+        capture: Callable[[], Any],
+        process: Callable[[Any], Any],
+        log: Optional[Callable[[Any], None]] = None,
+        queue_size: int = 4,
+        display_fps: float = 30.0,
+        stop_when: Optional[Callable[[Any], bool]] = None,
+        max_frames: Optional[int] = None,
+    ):
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+        if display_fps <= 0:
+            raise ValueError("display_fps must be positive")
+
+        self.capture = capture
+        self.process = process
+        self.log = log
+        self.display_interval = 1.0 / display_fps
+        self.stop_when = stop_when
+        self.max_frames = max_frames
+
+        self._frames = queue.Queue(maxsize=queue_size)
+        self._results = queue.Queue(maxsize=queue_size)
+        self._stop = threading.Event()  # stop capturing, drain the rest
+        self._abort = threading.Event()  # a stage failed, drop everything
+        self._error = None
+        self._latest = None  # newest (frame, result) for display
+        self._latest_lock = threading.Lock()
+        self._threads = []
+
+        self.captured = 0
+        self.processed = 0
+        self.logged = 0
+        self.displayed = 0
+        self._start_time = None
+
+    @property
+    def fps(self) -> float:
+        """Average processed frames per second since start"""
+        if self._start_time is None:
+            return 0.0
+        elapsed = time.perf_counter() - self._start_time
+        return self.processed / elapsed if elapsed > 0 else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        """Counters of every stage and the processing rate"""
+        return {
+            "captured": self.captured,
+            "processed": self.processed,
+            "logged": self.logged,
+            "displayed": self.displayed,
+            "fps": self.fps,
+        }
+
+    def stop(self):
+        """Stop capturing; frames already captured are still processed and logged"""
+        self._stop.set()
+
+    def _put(self, q: queue.Queue, item):
+        """Blocking put that gives up once the pipeline is aborted"""
+        while not self._abort.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _fail(self, stage: str, error: BaseException):
+        """Record the first stage error and abort every stage"""
+        if self._error is None:
+            logger.error(f"{stage} stage failed: {error}")
+            self._error = error
+        self._abort.set()
+        self._stop.set()
+
+    def _capture_loop(self):
+        try:
+            while not self._stop.is_set():
+                if self.max_frames is not None and self.captured >= self.max_frames:
+                    break
+                frame = self.capture()
+                self.captured += 1
+                self._put(self._frames, frame)
+        except Exception as e:
+            self._fail("capture", e)
+        finally:
+            self._put(self._frames, _END)
+
+    def _process_loop(self):
+        try:
+            while not self._abort.is_set():
+                try:
+                    frame = self._frames.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if frame is _END:
+                    break
+
+                result = self.process(frame)
+                self.processed += 1
+                with self._latest_lock:
+                    self._latest = (frame, result)
+                if self.log is not None:
+                    self._put(self._results, result)
+
+                if self.stop_when is not None and self.stop_when(result):
+                    self.stop()
+        except Exception as e:
+            self._fail("process", e)
+        finally:
+            self._put(self._results, _END)
+
+    def _log_loop(self):
+        try:
+            while not self._abort.is_set():
+                try:
+                    result = self._results.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if result is _END:
+                    break
+                self.log(result)
+                self.logged += 1
+        except Exception as e:
+            self._fail("log", e)
+
+    def start(self):
+        """Start the capture, processing and logging threads"""
+        if self._threads:
+            raise RuntimeError("pipeline already started")
+
+        self._start_time = time.perf_counter()
+        stages = [("capture", self._capture_loop), ("process", self._process_loop)]
+        if self.log is not None:
+            stages.append(("log", self._log_loop))
+        for name, target in stages:
+            thread = threading.Thread(
+                target=target, name=f"fluotrack-{name}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def latest(self) -> Optional[Tuple[Any, Any]]:
+        """Newest (frame, result) pair, or None before the first result"""
+        with self._latest_lock:
+            return self._latest
+
+    def join(self, timeout: Optional[float] = None):
+        """Wait for all stage threads; re-raise the first stage error"""
+        for thread in self._threads:
+            thread.join(timeout)
+        if self._error is not None:
+            raise self._error
+
+    def run(self, display: Optional[Callable[[Any, Any], bool]] = None):
+        """
+        Run the pipeline until stopped, displaying on the calling thread.
+
+        Parameters
+        ----------
+        display : callable, optional
+            ``display(frame, result) -> bool``, called with the newest
+            processed frame at most ``display_fps`` times per second;
+            returning False stops the acquisition. Without a display the
+            call just waits for the pipeline to finish.
+
+        Raises
+        ------
+        Exception
+            The first error raised by any stage
+        """
+        self.start()
+        try:
+            shown = None
+            next_refresh = time.perf_counter()
+            while any(t.is_alive() for t in self._threads):
+                if display is None:
+                    self._threads[0].join(0.1)
+                    continue
+
+                # Cap the refresh rate; sleep in short steps to notice shutdown
+                now = time.perf_counter()
+                if now < next_refresh:
+                    time.sleep(min(next_refresh - now, 0.1))
+                    continue
+
+                latest = self.latest()
+                if latest is not None and latest is not shown:
+                    shown = latest
+                    self.displayed += 1
+                    next_refresh = now + self.display_interval
+                    if not display(*latest):
+                        self.stop()
+                else:
+                    time.sleep(min(self.display_interval, 0.01))
+        finally:
+            self.stop()
+            self.join()
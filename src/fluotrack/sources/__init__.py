@@ -0,0 +1,30 @@
+"""
+Lazy frame sources.
+
+Every source yields :class:`Frame` objects (index, timestamp in seconds,
+image data) one at a time, so arbitrarily long recordings can be tracked
+in constant memory::
+
+    from fluotrack.sources import TiffSource
+
+    with TiffSource("stack.ome.tif", frame_interval=0.5) as source:
+        for frame in source:
+            tracker.process_frame(frame.data, frame.timestamp)
+"""
+
+from .base import Frame, FrameSource
+from .directory import ImageDirectorySource
+from .prefetch import PrefetchingSource
+from .synthetic import SyntheticSource
+from .tiff import TiffSource
+from .video import VideoSource
+
+__all__ = [
+    "Frame",
+    "FrameSource",
+    "ImageDirectorySource",
+    "PrefetchingSource",
+    "SyntheticSource",
+    "TiffSource",
+    "VideoSource",
+]
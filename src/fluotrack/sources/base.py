@@ -0,0 +1,74 @@
+"""
+Frame source protocol shared by all readers.
+"""
+
+import numpy as np
+from dataclasses import dataclass
+from typing import Iterator
+
+
+@dataclass
+class Frame:
+    """A single frame yielded by a FrameSource"""
+
+    index: int
+    timestamp: float  # seconds since the start of the acquisition
+    data: np.ndarray
+
+
+class FrameSource:
+    """
+    Lazy, iterable source of frames.
+
+    Subclasses implement ``__len__`` and ``read``; iteration then yields
+    :class:`Frame` objects one at a time, so only the current frame is held
+    in memory. Sources that decode sequentially (such as video files) may
+    override ``__iter__`` as well.
+
+    Sources are context managers; ``close`` releases file handles.
+    ``random_access`` tells whether ``read`` may be called concurrently
+    and out of order at little extra cost.
+    """
+
+    random_access = True
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def read(self, index: int) -> Frame:
+        """
+        Read one frame by index.
+
+        Parameters
+        ----------
+        index : int
+            Frame index (0-based)
+
+        Returns
+        -------
+        Frame
+            The decoded frame with its timestamp
+        """
+        raise NotImplementedError
+
+    def __iter__(self) -> Iterator[Frame]:
+        for index in range(len(self)):
+            yield self.read(index)
+
+    def close(self):
+        """Release any open resources"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _check_index(self, index: int) -> int:
+        """Normalize a possibly negative index and check its range"""
+        n_frames = len(self)
+        if index < 0:
+            index += n_frames
+        if not 0 <= index < n_frames:
+            raise IndexError(f"frame index out of range (0-{n_frames - 1})")
+        return index
@@ -0,0 +1,50 @@
+"""
+Directories of single-frame image files.
+"""
+
+import cv2
+from pathlib import Path
+from typing import Union
+
+from .base import Frame, FrameSource
+
+
+class ImageDirectorySource(FrameSource):
+    """
+    Read one frame per image file from a directory, in sorted name order.
+
+    Files are decoded only when their frame is read, keeping their native
+    bit depth (8- or 16-bit grayscale).
+
+    Parameters
+    ----------
+    directory : str or Path
+        Directory containing the frames
+    pattern : str, default="*.tif"
+        Glob pattern selecting the frame files
+    frame_interval : float, default=1.0
+        Time between frames in seconds, used for frame timestamps
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        pattern: str = "*.tif",
+        frame_interval: float = 1.0,
+    ):
+        self.directory = Path(directory)
+        self.frame_interval = frame_interval
+        self.paths = sorted(self.directory.glob(pattern))
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def read(self, index: int) -> Frame:
+        index = self._check_index(index)
+        path = self.paths[index]
+
+        data = cv2.imread(str(path), cv2.IMREAD_GRAYSCALE | cv2.IMREAD_ANYDEPTH)
+        if data is None:
+            raise IOError(f"Could not read image: {path}")
+
+        return Frame(index, index * self.frame_interval, data)
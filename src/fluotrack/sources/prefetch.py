@@ -0,0 +1,128 @@
+"""
+Background prefetching for frame sources.
+"""
+
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional
+
+from .base import Frame, FrameSource
+
+
+class PrefetchingSource(FrameSource):
+    """
+    Decode upcoming frames in the background while the caller processes
+    the current one.
+
+    For random-access sources, up to ``depth`` frames are read ahead on a
+    thread pool and yielded in frame order. Sequential sources (such as
+    video files) are read ahead by a single producer thread. Either way, at
+    most ``depth`` decoded frames are held in memory.
+
+    Parameters
+    ----------
+    source : FrameSource
+        Source to read from
+    n_workers : int, default=4
+        Number of decoding threads for random-access sources
+    depth : int, optional
+        Maximum number of frames read ahead (default: 2 * n_workers)
+
+    Examples
+    --------
+    >>> source = PrefetchingSource(ImageDirectorySource("frames/"))
+    >>> for frame in source:
+    ...     tracker.process_frame(frame.data, frame.timestamp)
+    """
+
+    def __init__(
+        self, source: FrameSource, n_workers: int = 4, depth: Optional[int] = None
+    ):
+        if n_workers < 1:
+            raise ValueError("n_workers must be at least 1")
+
+        self.source = source
+        self.n_workers = n_workers
+        self.depth = depth if depth is not None else 2 * n_workers
+        self.random_access = source.random_access
+
+        if self.depth < 1:
+            raise ValueError("depth must be at least 1")
+
+    def __len__(self) -> int:
+        return len(self.source)
+
+    def read(self, index: int) -> Frame:
+        return self.source.read(index)
+
+    def __iter__(self) -> Iterator[Frame]:
+        if self.source.random_access:
+            return self._iter_pool()
+        return self._iter_producer()
+
+    def _iter_pool(self) -> Iterator[Frame]:
+        """Read ahead on a thread pool, keeping futures in frame order"""
+        n_frames = len(self.source)
+        pending = deque()
+        executor = ThreadPoolExecutor(
+            max_workers=self.n_workers, thread_name_prefix="fluotrack-prefetch"
+        )
+        try:
+            next_index = 0
+            while next_index < n_frames or pending:
+                while next_index < n_frames and len(pending) < self.depth:
+                    pending.append(executor.submit(self.source.read, next_index))
+                    next_index += 1
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def _iter_producer(self) -> Iterator[Frame]:
+        """Read ahead with one thread iterating a sequential source"""
+        buffer = queue.Queue(maxsize=self.depth)
+        stop = threading.Event()
+        done = object()
+
+        def produce():
+            try:
+                for frame in self.source:
+                    while not stop.is_set():
+                        try:
+                            buffer.put(frame, timeout=0.1)
+                            break
+                        except queue.Full:
+                            continue
+                    if stop.is_set():
+                        return
+                item = done
+            except BaseException as err:  # re-raised in the consumer
+                item = err
+            while not stop.is_set():
+                try:
+                    buffer.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        producer = threading.Thread(
+            target=produce, name="fluotrack-prefetch", daemon=True
+        )
+        producer.start()
+        try:
+            while True:
+                item = buffer.get()
+                if item is done:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            producer.join()
+
+    def close(self):
+        self.source.close()
@@ -0,0 +1,107 @@
+"""
+Memory-mapped TIFF / OME-TIFF stacks.
+
+Requires the optional ``tifffile`` package.
+"""
+
+import threading
+import numpy as np
+from pathlib import Path
+from typing import Union
+
+from .base import Frame, FrameSource
+
+
+class TiffSource(FrameSource):
+    """
+    Read frames lazily from a multi-page TIFF or OME-TIFF stack.
+
+    Uncompressed stacks are memory-mapped, so a frame costs only the pages
+    it touches. Other stacks are decoded page by page on demand. Either way,
+    the whole file is never loaded at once.
+
+    Parameters
+    ----------
+    path : str or Path
+        TIFF file
+    frame_interval : float, default=1.0
+        Time between frames in seconds, used for frame timestamps
+    series : int, default=0
+        Image series to read
+    project_z : bool, default=True
+        For stacks of shape (frames, z, height, width), return the maximum
+        projection over z. Otherwise return the (z, height, width) block.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        frame_interval: float = 1.0,
+        series: int = 0,
+        project_z: bool = True,
+    ):
+        try:
+            import tifffile
+        except ImportError as err:
+            raise ImportError(
+                "TiffSource requires tifffile. Install with: pip install tifffile"
+            ) from err
+
+        self.path = Path(path)
+        self.frame_interval = frame_interval
+        self.project_z = project_z
+
+        self._tiff = tifffile.TiffFile(str(self.path))
+        self._series = self._tiff.series[series]
+        self.shape = tuple(self._series.shape)
+        self.dtype = np.dtype(self._series.dtype)
+
+        if len(self.shape) < 3:
+            # A single image is a one-frame stack
+            self.shape = (1,) + self.shape
+
+        try:
+            self._memmap = tifffile.memmap(str(self.path), mode="r", series=series)
+            self._memmap = self._memmap.reshape(self.shape)
+        except ValueError:
+            # Compressed or non-contiguous data cannot be memory-mapped
+            self._memmap = None
+
+        # Pages per frame, e.g. the z-slices of a (t, z, y, x) stack
+        self._pages_per_frame = int(np.prod(self.shape[1:-2], dtype=np.int64))
+        self._paged = len(self._series.pages) == len(self) * self._pages_per_frame
+        self._data = None
+
+        # Serializes file seeks/reads so frames can be decoded concurrently
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def read(self, index: int) -> Frame:
+        index = self._check_index(index)
+
+        if self._memmap is not None:
+            data = self._memmap[index]
+        elif not self._paged:
+            # Frames do not map onto whole pages (e.g. multi-sample pages);
+            # decode the series once
+            with self._lock:
+                if self._data is None:
+                    self._data = self._series.asarray().reshape(self.shape)
+            data = self._data[index]
+        else:
+            start = index * self._pages_per_frame
+            pages = self._series.pages[start : start + self._pages_per_frame]
+            data = np.stack([page.asarray(lock=self._lock) for page in pages])
+            data = data.reshape(self.shape[1:])
+
+        if self.project_z and data.ndim == 3:
+            data = data.max(axis=0)
+
+        return Frame(index, index * self.frame_interval, data)
+
+    def close(self):
+        self._memmap = None
+        self._data = None
+        self._tiff.close()
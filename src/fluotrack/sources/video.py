@@ -0,0 +1,72 @@
+"""
+Video files read through cv2.VideoCapture.
+"""
+
+import cv2
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+from .base import Frame, FrameSource
+
+
+class VideoSource(FrameSource):
+    """
+    Decode frames from a video file one at a time.
+
+    Frame timestamps come from the container (``CAP_PROP_POS_MSEC``).
+    Iteration decodes sequentially; ``read`` seeks, which is slower for
+    most codecs.
+
+    Parameters
+    ----------
+    path : str or Path
+        Video file
+    grayscale : bool, default=True
+        Convert decoded BGR frames to grayscale
+    """
+
+    random_access = False
+
+    def __init__(self, path: Union[str, Path], grayscale: bool = True):
+        self.path = Path(path)
+        self.grayscale = grayscale
+
+        self._capture = cv2.VideoCapture(str(self.path))
+        if not self._capture.isOpened():
+            raise IOError(f"Could not open video: {self.path}")
+
+        self.fps = self._capture.get(cv2.CAP_PROP_FPS)
+        self._n_frames = int(self._capture.get(cv2.CAP_PROP_FRAME_COUNT))
+
+    def __len__(self) -> int:
+        return self._n_frames
+
+    def _decode(self, index: int) -> Optional[Frame]:
+        ok, data = self._capture.read()
+        if not ok:
+            return None
+        timestamp = self._capture.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
+        if self.grayscale and data.ndim == 3:
+            data = cv2.cvtColor(data, cv2.COLOR_BGR2GRAY)
+        return Frame(index, timestamp, data)
+
+    def read(self, index: int) -> Frame:
+        index = self._check_index(index)
+        self._capture.set(cv2.CAP_PROP_POS_FRAMES, index)
+        frame = self._decode(index)
+        if frame is None:
+            raise IOError(f"Could not decode frame {index} of {self.path}")
+        return frame
+
+    def __iter__(self) -> Iterator[Frame]:
+        self._capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        index = 0
+        while True:
+            frame = self._decode(index)
+            if frame is None:
+                return
+            yield frame
+            index += 1
+
+    def close(self):
+        self._capture.release()
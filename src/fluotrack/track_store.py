@@ -0,0 +1,854 @@
+"""
+Columnar storage for multi-target track histories.
+
+Observations are stored as a struct of NumPy arrays (one column each for
+track id, frame, x, y, intensity and area) grown in preallocated chunks,
+instead of one Python object per observation. Timestamps are stored once per
+frame. Per-track views expose the columns as arrays and can still produce
+FluorescentSpot objects on demand. Finished tracks can be moved to an
+append-only on-disk store of NPZ chunks to bound memory use. Summary
+statistics of every track are kept up to date incrementally and written
+alongside spilled tracks, so they never require reading the history back.
+"""
+
+import numpy as np
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import chain
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from .bleaching import OnlineBleachingEstimator
+
+
+@dataclass
+class FluorescentSpot:
+    """Represents a single fluorescent spot"""
+
+    id: int
+    location: Tuple[int, int]
+    intensity: float
+    area: int
+    frame_number: int
+    timestamp: str
+
+
+class TrackView:
+    """
+    Read-only view of one track's observations.
+
+    Behaves like a sequence of FluorescentSpot objects, which are built
+    lazily on access, and exposes the underlying columns as arrays.
+    Slicing returns a list of spots, as with the list-based histories.
+
+    Parameters
+    ----------
+    track_id : int
+        Track identifier
+    columns : dict of np.ndarray
+        Column arrays for this track's observations, in frame order
+    timestamps : dict, optional
+        Mapping from frame number to timestamp
+    """
+
+    def __init__(
+        self,
+        track_id: int,
+        columns: Dict[str, np.ndarray],
+        timestamps: Optional[Dict[int, Any]] = None,
+    ):
+        self.track_id = track_id
+        self.frame = columns["frame"]
+        self.x = columns["x"]
+        self.y = columns["y"]
+        self.intensity = columns["intensity"]
+        self.area = columns["area"]
+        self._timestamps = timestamps if timestamps is not None else {}
+
+    @property
+    def locations(self) -> np.ndarray:
+        """Array of shape (n, 2) with (x, y) positions"""
+        return np.column_stack([self.x, self.y])
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        frame = int(self.frame[index])
+        return FluorescentSpot(
+            id=self.track_id,
+            location=(int(self.x[index]), int(self.y[index])),
+            intensity=float(self.intensity[index]),
+            area=int(self.area[index]),
+            frame_number=frame,
+            timestamp=self._timestamps.get(frame),
+        )
+
+    def __iter__(self) -> Iterator[FluorescentSpot]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        return f"TrackView(track_id={self.track_id}, length={len(self)})"
+
+
+class TrackStore:
+    """
+    Struct-of-arrays store for track observations.
+
+    Parameters
+    ----------
+    chunk_size : int, default=65536
+        Number of rows preallocated each time the store grows
+    """
+
+    COLUMNS = {
+        "id": np.int64,
+        "frame": np.int32,
+        "x": np.int32,
+        "y": np.int32,
+        "intensity": np.float64,
+        "area": np.int32,
+    }
+
+    def __init__(self, chunk_size: int = 65536):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.chunk_size = chunk_size
+        self.timestamps = {}  # frame -> timestamp
+        self._chunks = {name: [] for name in self.COLUMNS}
+        self._fill = chunk_size  # rows used in the last chunk
+        self._n_rows = 0
+        self._columns = None  # cached concatenated columns
+        self._index = None  # cached (order, ids, starts, ends)
+
+    def __len__(self) -> int:
+        return self._n_rows
+
+    def append(
+        self,
+        ids: np.ndarray,
+        frames: np.ndarray,
+        x: np.ndarray,
+        y: np.ndarray,
+        intensity: np.ndarray,
+        area: np.ndarray,
+    ):
+        """
+        Append a batch of observations.
+
+        Parameters
+        ----------
+        ids, frames, x, y, intensity, area : array-like
+            Equal-length columns for the new observations
+        """
+        values = {
+            "id": ids,
+            "frame": frames,
+            "x": x,
+            "y": y,
+            "intensity": intensity,
+            "area": area,
+        }
+        n = len(ids)
+        if any(len(v) != n for v in values.values()):
+            raise ValueError("all columns must have the same length")
+
+        written = 0
+        while written < n:
+            if self._fill == self.chunk_size:
+                for name, dtype in self.COLUMNS.items():
+                    self._chunks[name].append(np.empty(self.chunk_size, dtype=dtype))
+                self._fill = 0
+
+            count = min(n - written, self.chunk_size - self._fill)
+            for name in self.COLUMNS:
+                chunk = self._chunks[name][-1]
+                chunk[self._fill : self._fill + count] = values[name][
+                    written : written + count
+                ]
+            self._fill += count
+            written += count
+
+        self._n_rows += n
+        if n:
+            self._columns = None
+            self._index = None
+
+    def set_timestamp(self, frame: int, timestamp: Any):
+        """Record the timestamp shared by all observations of a frame"""
+        self.timestamps[frame] = timestamp
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Get one column for all stored observations.
+
+        Parameters
+        ----------
+        name : str
+            Column name (id, frame, x, y, intensity or area)
+
+        Returns
+        -------
+        np.ndarray
+            Column values in insertion order
+        """
+        if self._columns is None:
+            self._columns = {}
+            for col, chunks in self._chunks.items():
+                if not chunks:
+                    self._columns[col] = np.empty(0, dtype=self.COLUMNS[col])
+                    continue
+                parts = chunks[:-1] + [chunks[-1][: self._fill]]
+                self._columns[col] = np.concatenate(parts)
+        return self._columns[name]
+
+    def _track_index(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Sort rows by track id, keeping insertion order within each track"""
+        if self._index is None:
+            ids = self.column("id")
+            order = np.argsort(ids, kind="stable")
+            unique_ids, starts, counts = np.unique(
+                ids[order], return_index=True, return_counts=True
+            )
+            self._index = (order, unique_ids, starts, starts + counts)
+        return self._index
+
+    def track_ids(self) -> np.ndarray:
+        """Get the sorted array of all track ids in the store"""
+        return self._track_index()[1]
+
+    def track_lengths(self) -> np.ndarray:
+        """Get the number of observations of each track, in id order"""
+        _, _, starts, ends = self._track_index()
+        return ends - starts
+
+    def __contains__(self, track_id) -> bool:
+        ids = self.track_ids()
+        pos = np.searchsorted(ids, track_id)
+        return bool(pos < len(ids) and ids[pos] == track_id)
+
+    def _view(self, position: int) -> TrackView:
+        order, unique_ids, starts, ends = self._track_index()
+        rows = order[starts[position] : ends[position]]
+        columns = {name: self.column(name)[rows] for name in self.COLUMNS}
+        return TrackView(int(unique_ids[position]), columns, self.timestamps)
+
+    def get_track(self, track_id: int) -> Optional[TrackView]:
+        """
+        Get a view of one track.
+
+        Parameters
+        ----------
+        track_id : int
+            Track identifier
+
+        Returns
+        -------
+        TrackView or None
+            View of the track, or None if the id is not stored
+        """
+        ids = self.track_ids()
+        pos = int(np.searchsorted(ids, track_id))
+        if pos >= len(ids) or ids[pos] != track_id:
+            return None
+        return self._view(pos)
+
+    def iter_tracks(self) -> Iterator[TrackView]:
+        """Iterate over views of all tracks in id order"""
+        for position in range(len(self.track_ids())):
+            yield self._view(position)
+
+    def padded(
+        self, column: str = "intensity"
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Export one column as a NaN-padded (n_tracks, max_length) array.
+
+        Parameters
+        ----------
+        column : str, default='intensity'
+            Column to export
+
+        Returns
+        -------
+        tuple of np.ndarray
+            (track_ids, frames, values): sorted track ids and float arrays
+            of frame numbers and values, one row per track in insertion
+            order, padded with NaN after the end of each track
+        """
+        order, unique_ids, starts, ends = self._track_index()
+        counts = ends - starts
+        shape = (len(unique_ids), int(counts.max(initial=0)))
+        frames = np.full(shape, np.nan)
+        values = np.full(shape, np.nan)
+
+        rows = np.repeat(np.arange(len(unique_ids)), counts)
+        positions = np.arange(len(order)) - np.repeat(starts, counts)
+        frames[rows, positions] = self.column("frame")[order]
+        values[rows, positions] = self.column(column)[order]
+
+        return unique_ids, frames, values
+
+    def pop_tracks(self, track_ids) -> Dict[str, np.ndarray]:
+        """
+        Remove whole tracks from the store and return their rows.
+
+        Parameters
+        ----------
+        track_ids : array-like of int
+            Tracks to remove
+
+        Returns
+        -------
+        dict of np.ndarray
+            Columns of the removed rows, in insertion order
+        """
+        columns = {name: self.column(name) for name in self.COLUMNS}
+        mask = np.isin(columns["id"], np.asarray(track_ids, dtype=np.int64))
+        removed = {name: values[mask] for name, values in columns.items()}
+
+        kept = {name: values[~mask] for name, values in columns.items()}
+        self._chunks = {name: [] for name in self.COLUMNS}
+        self._fill = self.chunk_size
+        self._n_rows = 0
+        self._columns = None
+        self._index = None
+        self.append(
+            kept["id"],
+            kept["frame"],
+            kept["x"],
+            kept["y"],
+            kept["intensity"],
+            kept["area"],
+        )
+
+        # Only keep timestamps still referenced by in-memory rows
+        if len(self):
+            first_frame = int(kept["frame"].min())
+            self.timestamps = {
+                f: t for f, t in self.timestamps.items() if f >= first_frame
+            }
+
+        return removed
+
+    @classmethod
+    def from_columns(
+        cls, columns: Dict[str, np.ndarray], timestamps: Optional[Dict] = None
+    ) -> "TrackStore":
+        """Build a single-chunk store from existing column arrays"""
+        store = cls(chunk_size=max(1, len(columns["id"])))
+        store.append(
+            columns["id"],
+            columns["frame"],
+            columns["x"],
+            columns["y"],
+            columns["intensity"],
+            columns["area"],
+        )
+        store.timestamps = dict(timestamps or {})
+        return store
+
+
+def _encode_timestamps(values: list) -> Tuple[np.ndarray, str]:
+    """
+    Convert timestamps to an array that NPZ files store without pickling.
+
+    Returns the array and the kind needed to restore the values: datetimes
+    are stored as ISO 8601 strings, numbers and strings as themselves and
+    any other objects as their string representation.
+    """
+    if values and all(isinstance(v, datetime) for v in values):
+        return np.array([v.isoformat() for v in values], dtype=str), "datetime"
+    array = np.asarray(values)
+    if array.dtype == object:
+        return array.astype(str), "str"
+    return array, "value"
+
+
+def _decode_timestamps(array: np.ndarray, kind: str) -> list:
+    """Restore timestamps written by _encode_timestamps"""
+    if kind == "datetime":
+        return [datetime.fromisoformat(v) for v in array.tolist()]
+    return array.tolist()
+
+
+class SpillStore:
+    """
+    Append-only on-disk store for finished tracks.
+
+    Each spill writes one NPZ chunk file with the track columns and the
+    timestamps of the frames they reference. Timestamps are stored with a
+    plain dtype (datetimes as ISO 8601 strings), so chunks load without
+    pickling. Only the sorted track ids of each chunk are kept in memory.
+
+    Parameters
+    ----------
+    directory : str or Path
+        Directory for chunk files (created if needed)
+    compress : bool, default=False
+        Write compressed NPZ files
+    """
+
+    def __init__(self, directory: str, compress: bool = False):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.compress = compress
+        self._chunks = []  # list of (path, sorted track ids)
+        self._lengths = []  # rows per track of each chunk, in id order
+        self._n_rows = 0
+        self._cache = None  # (path, TrackStore) of the last chunk read
+
+    def __len__(self) -> int:
+        return self._n_rows
+
+    def append(
+        self,
+        columns: Dict[str, np.ndarray],
+        timestamps: Dict[int, Any],
+        statistics: Optional[Dict[str, np.ndarray]] = None,
+    ):
+        """
+        Write finished tracks to a new chunk file.
+
+        Parameters
+        ----------
+        columns : dict of np.ndarray
+            Rows of complete tracks, as returned by TrackStore.pop_tracks
+        timestamps : dict
+            Frame -> timestamp mapping covering the rows' frames
+        statistics : dict of np.ndarray, optional
+            Final per-track statistics of the tracks, as returned by
+            TrackAccumulators.release
+        """
+        if len(columns["id"]) == 0:
+            return
+
+        frames = np.unique(columns["frame"])
+        ts_frames = np.array(
+            [f for f in frames.tolist() if f in timestamps], dtype=np.int64
+        )
+        ts_values, ts_kind = _encode_timestamps(
+            [timestamps[f] for f in ts_frames.tolist()]
+        )
+
+        path = self.directory / f"tracks_{len(self._chunks):06d}.npz"
+        save = np.savez_compressed if self.compress else np.savez
+        save(
+            path,
+            ts_frames=ts_frames,
+            ts_values=ts_values,
+            ts_kind=np.array(ts_kind),
+            **columns,
+            **{f"stat_{name}": v for name, v in (statistics or {}).items()},
+        )
+
+        ids, lengths = np.unique(columns["id"], return_counts=True)
+        self._chunks.append((path, ids))
+        self._lengths.append(lengths)
+        self._n_rows += len(columns["id"])
+
+    def _load(self, path: Path) -> TrackStore:
+        if self._cache is None or self._cache[0] != path:
+            with np.load(path) as data:
+                columns = {name: data[name] for name in TrackStore.COLUMNS}
+                ts_values = _decode_timestamps(data["ts_values"], str(data["ts_kind"]))
+                timestamps = dict(zip(data["ts_frames"].tolist(), ts_values))
+            self._cache = (path, TrackStore.from_columns(columns, timestamps))
+        return self._cache[1]
+
+    def track_ids(self) -> np.ndarray:
+        """Get the sorted array of all spilled track ids"""
+        if not self._chunks:
+            return np.empty(0, dtype=np.int64)
+        return np.sort(np.concatenate([ids for _, ids in self._chunks]))
+
+    def track_lengths(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the number of observations of every spilled track.
+
+        Known from the chunk index, without reading any chunk file.
+
+        Returns
+        -------
+        tuple of np.ndarray
+            (track_ids, lengths) in spill order
+        """
+        if not self._chunks:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        return (
+            np.concatenate([ids for _, ids in self._chunks]),
+            np.concatenate(self._lengths),
+        )
+
+    def _find_chunk(self, track_id: int) -> Optional[Path]:
+        for path, ids in self._chunks:
+            pos = np.searchsorted(ids, track_id)
+            if pos < len(ids) and ids[pos] == track_id:
+                return path
+        return None
+
+    def __contains__(self, track_id) -> bool:
+        return self._find_chunk(track_id) is not None
+
+    def get_track(self, track_id: int) -> Optional[TrackView]:
+        """Get a view of one spilled track, or None if it is not on disk"""
+        path = self._find_chunk(track_id)
+        if path is None:
+            return None
+        return self._load(path).get_track(track_id)
+
+    def iter_tracks(self) -> Iterator[TrackView]:
+        """Iterate over views of all spilled tracks, one chunk at a time"""
+        for path, _ in self._chunks:
+            yield from self._load(path).iter_tracks()
+
+    def iter_padded(
+        self, column: str = "intensity"
+    ) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Yield the padded export of each chunk (see TrackStore.padded)"""
+        for path, _ in self._chunks:
+            yield self._load(path).padded(column)
+
+    @staticmethod
+    def _load_statistics(path: Path) -> Dict[str, np.ndarray]:
+        """Per-track statistics columns stored in one chunk file"""
+        with np.load(path) as data:
+            return {
+                name[len("stat_") :]: data[name]
+                for name in data.files
+                if name.startswith("stat_")
+            }
+
+    def statistics(self, track_id: int) -> Dict:
+        """
+        Final statistics of one spilled track.
+
+        Returns
+        -------
+        Dict
+            Same keys as TrackAccumulators.statistics; empty if the track
+            is not on disk or was spilled without statistics
+        """
+        path = self._find_chunk(track_id)
+        if path is None:
+            return {}
+        columns = self._load_statistics(path)
+        if not columns:
+            return {}
+
+        pos = int(np.searchsorted(columns["track_id"], track_id))
+        trend = float(columns["intensity_trend"][pos])
+        return {
+            "duration": int(columns["duration"][pos]),
+            "mean_intensity": float(columns["mean_intensity"][pos]),
+            "intensity_trend": trend,
+            "total_displacement": float(columns["total_displacement"][pos]),
+            "mean_velocity": float(columns["mean_velocity"][pos]),
+            "is_photobleaching": trend < -0.5,
+        }
+
+    def population(self) -> Dict[str, np.ndarray]:
+        """
+        Per-track statistics columns of all spilled tracks.
+
+        Returns
+        -------
+        dict of np.ndarray
+            Columns as returned by TrackAccumulators.population, in spill
+            order; empty when no chunk has statistics
+        """
+        chunks = [self._load_statistics(path) for path, _ in self._chunks]
+        chunks = [columns for columns in chunks if columns]
+        if not chunks:
+            return {}
+        return {
+            name: np.concatenate([columns[name] for columns in chunks])
+            for name in chunks[0]
+        }
+
+
+class TrackHistory(Mapping):
+    """
+    Read-only mapping from track id to TrackView.
+
+    Reads transparently from the in-memory store and, if given, the
+    on-disk store of finished tracks.
+
+    Parameters
+    ----------
+    store : TrackStore
+        In-memory store
+    spill : SpillStore, optional
+        On-disk store for finished tracks
+    """
+
+    def __init__(self, store: TrackStore, spill: Optional[SpillStore] = None):
+        self.store = store
+        self.spill = spill
+
+    def __getitem__(self, track_id: int) -> TrackView:
+        view = self.store.get_track(track_id)
+        if view is None and self.spill is not None:
+            view = self.spill.get_track(track_id)
+        if view is None:
+            raise KeyError(track_id)
+        return view
+
+    def __contains__(self, track_id) -> bool:
+        if track_id in self.store:
+            return True
+        return self.spill is not None and track_id in self.spill
+
+    def _ids(self) -> np.ndarray:
+        ids = self.store.track_ids()
+        if self.spill is not None and len(self.spill):
+            ids = np.sort(np.concatenate([ids, self.spill.track_ids()]))
+        return ids
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._ids().tolist())
+
+    def __len__(self) -> int:
+        return len(self._ids())
+
+    def padded(
+        self, column: str = "intensity"
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Export one column of every track, in memory or spilled, as a
+        NaN-padded array (see :meth:`TrackStore.padded`).
+
+        The output is sized from the track lengths in the chunk index and
+        filled one spilled chunk at a time, so at most one chunk is read
+        into memory alongside the result.
+        """
+        if self.spill is None or not len(self.spill):
+            return self.store.padded(column)
+
+        spilled_ids, spilled_lengths = self.spill.track_lengths()
+        ids = np.concatenate([spilled_ids, self.store.track_ids()])
+        lengths = np.concatenate([spilled_lengths, self.store.track_lengths()])
+        order = np.argsort(ids, kind="stable")
+        ids = ids[order]
+        shape = (len(ids), int(lengths.max(initial=0)))
+        frames = np.full(shape, np.nan)
+        values = np.full(shape, np.nan)
+
+        parts = chain(self.spill.iter_padded(column), [self.store.padded(column)])
+        for part_ids, part_frames, part_values in parts:
+            rows = np.searchsorted(ids, part_ids)
+            width = part_frames.shape[1]
+            frames[rows, :width] = part_frames
+            values[rows, :width] = part_values
+
+        return ids, frames, values
+
+    def iter_tracks(self) -> Iterator[TrackView]:
+        """Iterate over all track views, spilled tracks first"""
+        if self.spill is not None:
+            yield from self.spill.iter_tracks()
+        yield from self.store.iter_tracks()
+
+
+class TrackAccumulators:
+    """
+    Running per-track statistics of the tracks kept in memory.
+
+    Keeps the observation count, intensity mean and linear trend (through
+    an OnlineBleachingEstimator with one row per track) and the path length
+    of every track, updated once per frame for all observed tracks.
+    Per-track statistics are O(1) and population statistics one vectorized
+    pass over the tracks, independent of the number of observations.
+
+    Rows are assigned in order of first observation and grown with
+    amortized doubling. ``release`` returns the final statistics of
+    finished tracks and frees their rows, so memory follows the number of
+    tracks kept rather than of all tracks ever observed.
+    """
+
+    def __init__(self):
+        self.intensity = OnlineBleachingEstimator()
+        self.path_length = np.empty(0, dtype=np.float64)
+        self.last_x = np.empty(0, dtype=np.float64)
+        self.last_y = np.empty(0, dtype=np.float64)
+        self.track_ids = np.empty(0, dtype=np.int64)  # track id of each row
+        self.n_rows = 0  # rows in use
+        self._rows = {}  # track id -> row
+
+    def __len__(self) -> int:
+        return self.n_rows
+
+    def __contains__(self, track_id) -> bool:
+        return track_id in self._rows
+
+    def rows(self, track_ids) -> np.ndarray:
+        """
+        Rows of tracks in ``intensity`` and the per-track arrays.
+
+        Raises
+        ------
+        KeyError
+            If a track is not kept
+        """
+        return np.fromiter(
+            (self._rows[t] for t in track_ids), dtype=np.intp, count=len(track_ids)
+        )
+
+    def _reserve(self, n_rows: int):
+        """Make room for ``n_rows`` rows"""
+        capacity = len(self.path_length)
+        if n_rows > capacity:
+            extra = max(n_rows, 2 * capacity, 64) - capacity
+            self.intensity.add(extra)
+            zeros = np.zeros(extra)
+            self.path_length = np.concatenate([self.path_length, zeros])
+            self.last_x = np.concatenate([self.last_x, zeros])
+            self.last_y = np.concatenate([self.last_y, zeros])
+            self.track_ids = np.concatenate(
+                [self.track_ids, np.zeros(extra, dtype=np.int64)]
+            )
+
+    def _assign(self, track_ids: list) -> np.ndarray:
+        """Rows of tracks, assigning new rows to tracks not seen before"""
+        new = [t for t in track_ids if t not in self._rows]
+        if new:
+            self._reserve(self.n_rows + len(new))
+            rows = range(self.n_rows, self.n_rows + len(new))
+            self._rows.update(zip(new, rows))
+            self.track_ids[self.n_rows : self.n_rows + len(new)] = new
+            self.n_rows += len(new)
+        return self.rows(track_ids)
+
+    def update(
+        self, ids: np.ndarray, x: np.ndarray, y: np.ndarray, intensity: np.ndarray
+    ):
+        """
+        Add one frame of observations.
+
+        Parameters
+        ----------
+        ids : array-like of int
+            Track id of each observation, without duplicates
+        x, y, intensity : array-like
+            Location and intensity of each observation
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        if len(ids) == 0:
+            return
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        rows = self._assign(ids.tolist())
+
+        seen = self.intensity.count[rows] > 0
+        step = np.hypot(x - self.last_x[rows], y - self.last_y[rows])
+        self.path_length[rows] += np.where(seen, step, 0.0)
+        self.last_x[rows] = x
+        self.last_y[rows] = y
+        self.intensity.update(rows, intensity)
+
+    def statistics(self, track_id: int) -> Dict:
+        """
+        Summary statistics of one track.
+
+        Returns
+        -------
+        Dict
+            duration, mean_intensity, intensity_trend, total_displacement,
+            mean_velocity and is_photobleaching (see
+            MultiTargetTracker.get_track_statistics); empty for tracks
+            that are not kept
+        """
+        if track_id not in self:
+            return {}
+
+        row = self._rows[track_id]
+        summary = self.intensity.summary(row)
+        count = summary["observations"]
+        mean_intensity = summary["mean_intensity"]
+        if count < 2:
+            return {
+                "duration": 1,
+                "mean_intensity": mean_intensity,
+                "intensity_trend": 0.0,
+                "total_displacement": 0.0,
+                "mean_velocity": 0.0,
+                "is_photobleaching": False,
+            }
+
+        trend = summary["slope"]
+        path_length = float(self.path_length[row])
+        return {
+            "duration": count,
+            "mean_intensity": mean_intensity,
+            "intensity_trend": trend,
+            "total_displacement": path_length,
+            "mean_velocity": path_length / (count - 1),
+            "is_photobleaching": trend < -0.5,
+        }
+
+    def _columns(self, rows: np.ndarray) -> Dict[str, np.ndarray]:
+        """Per-track statistics columns of the given rows"""
+        counts = self.intensity.count[rows]
+        moving = counts > 1
+
+        trend = np.where(moving, self.intensity.slope[rows], 0.0)
+        path_length = self.path_length[rows]
+        velocity = np.zeros(len(rows))
+        velocity[moving] = path_length[moving] / (counts[moving] - 1)
+
+        return {
+            "track_id": self.track_ids[rows],
+            "duration": counts,
+            "mean_intensity": self.intensity.mean_intensity[rows],
+            "intensity_trend": trend,
+            "total_displacement": path_length,
+            "mean_velocity": velocity,
+        }
+
+    def population(self) -> Dict[str, np.ndarray]:
+        """
+        Per-track columns of all kept tracks, sorted by track id.
+
+        Returns
+        -------
+        dict of np.ndarray
+            track_id, duration, mean_intensity, intensity_trend,
+            total_displacement and mean_velocity, with the same single
+            observation conventions as ``statistics``
+        """
+        rows = np.argsort(self.track_ids[: self.n_rows], kind="stable")
+        return self._columns(rows)
+
+    def release(self, track_ids) -> Dict[str, np.ndarray]:
+        """
+        Stop keeping finished tracks.
+
+        Parameters
+        ----------
+        track_ids : iterable of int
+            Tracks to drop; ids that are not kept are ignored
+
+        Returns
+        -------
+        dict of np.ndarray
+            Final ``population`` columns of the dropped tracks, sorted by
+            track id
+        """
+        rows = self.rows(sorted(t for t in set(track_ids) if t in self._rows))
+        final = self._columns(rows)
+
+        self.intensity.remove(rows)
+        self.path_length = np.delete(self.path_length, rows)
+        self.last_x = np.delete(self.last_x, rows)
+        self.last_y = np.delete(self.last_y, rows)
+        self.track_ids = np.delete(self.track_ids, rows)
+        self.n_rows -= len(rows)
+        self._rows = {
+            t: r for r, t in enumerate(self.track_ids[: self.n_rows].tolist())
+        }
+
+        return final
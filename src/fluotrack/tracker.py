@@ -7,15 +7,50 @@ brightness in microscopy images or screen captures.
 
 import cv2
 import numpy as np
-from PIL import ImageGrab
 import logging
-from typing import Tuple, Optional, Dict
-from datetime import datetime
+from typing import Tuple, Optional, Dict, Union
+
+from .bleaching import OnlineBleachingEstimator
+from .capture import LiveCaptureMixin
+from .clock import AcquisitionClock, resolve_clock
 
 logger = logging.getLogger(__name__)
 
 
-class BrightnessTracker:
+def _otsu_threshold(frame: np.ndarray, n_bins: int = 1024) -> float:
+    """
+    Otsu threshold for frames cv2.THRESH_OTSU does not accept.
+
+    Integer frames are binned per intensity level; float frames use
+    ``n_bins`` equal bins between the frame minimum and maximum.
+    """
+    if np.issubdtype(frame.dtype, np.integer):
+        hist = np.bincount(frame.ravel(), minlength=int(frame.max()) + 1)
+        levels = np.arange(len(hist), dtype=np.float64)
+    else:
+        hist, edges = np.histogram(frame, bins=n_bins)
+        levels = edges[:-1]
+
+    weight = np.cumsum(hist, dtype=np.float64)
+    total = weight[-1]
+    cumulative_mean = np.cumsum(hist * levels)
+
+    # Between-class variance for every split "<= level | > level"
+    background = weight[:-1]
+    foreground = total - background
+    with np.errstate(divide="ignore", invalid="ignore"):
+        variance = (
+            cumulative_mean[-1] * background - cumulative_mean[:-1] * total
+        ) ** 2
+        variance /= background * foreground
+    variance[~np.isfinite(variance)] = -1.0
+
+    if len(variance) == 0:
+        return float(levels[0])
+    return float(levels[np.argmax(variance)])
+
+
+class BrightnessTracker(LiveCaptureMixin):
     """
     Real-time brightness tracking for fluorescent proteins.
 
@@ -31,6 +66,20 @@ class BrightnessTracker:
         Whether to apply Gaussian denoising
     kernel_size : int, default=5
         Kernel size for Gaussian blur (must be odd)
+    clock : {'wall', 'monotonic'} or AcquisitionClock, default='wall'
+        Timestamp source for results: ISO strings ('wall') or int64
+        nanoseconds from a monotonic acquisition clock
+    bleach_stop_fraction : float, optional
+        Request a stop (see ``should_stop``) once the fitted brightness
+        drops below this fraction of its initial value, e.g. 0.5
+    bleaching_forgetting : float, default=1.0
+        Forgetting factor of the online bleaching fit
+    capture_backend : str, default='auto'
+        Screen capture backend for ``capture_frame`` ('mss', 'pil' or
+        'auto', see ``fluotrack.capture``)
+    grayscale_capture : bool, default=False
+        Capture grayscale frames, which ``preprocess_frame`` then uses
+        without another conversion
 
     Attributes
     ----------
@@ -38,6 +87,11 @@ class BrightnessTracker:
         Number of frames processed
     fps : float
         Current frames per second
+    bleaching : OnlineBleachingEstimator
+        Running bleaching fit of the ROI brightness against frame number
+    last_capture : CapturedFrame or None
+        Sequence number and capture time of the latest frame from the
+        capture thread (see ``start_capture``)
     """
 
     def __init__(
@@ -45,13 +99,24 @@ class BrightnessTracker:
         bbox: Tuple[int, int, int, int],
         denoising: bool = True,
         kernel_size: int = 5,
+        clock: Union[str, AcquisitionClock] = "wall",
+        bleach_stop_fraction: Optional[float] = None,
+        bleaching_forgetting: float = 1.0,
+        capture_backend: str = "auto",
+        grayscale_capture: bool = False,
     ):
         self.bbox = bbox
         self.denoising = denoising
         self.kernel_size = kernel_size
+        self._now = resolve_clock(clock)
+        self.bleach_stop_fraction = bleach_stop_fraction
         self.frame_count = 0
         self.fps = 0.0
         self._validate_params()
+        self._init_capture(capture_backend, grayscale_capture)
+
+        self.bleaching = OnlineBleachingEstimator(bleaching_forgetting)
+        self.bleaching.add(1)
 
     def _validate_params(self):
         """Validate initialization parameters"""
@@ -61,19 +126,10 @@ class BrightnessTracker:
             raise ValueError("kernel_size must be odd")
         if self.kernel_size < 3:
             raise ValueError("kernel_size must be at least 3")
-
-    def capture_frame(self) -> np.ndarray:
-        """
-        Capture a frame from the screen region.
-
-        Returns
-        -------
-        np.ndarray
-            Captured frame as numpy array in BGR format
-        """
-        screen = ImageGrab.grab(bbox=self.bbox)
-        frame = np.array(screen)
-        return cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+        if self.bleach_stop_fraction is not None and not (
+            0.0 < self.bleach_stop_fraction < 1.0
+        ):
+            raise ValueError("bleach_stop_fraction must be in (0, 1)")
 
     def preprocess_frame(self, frame: np.ndarray) -> np.ndarray:
         """
@@ -82,14 +138,18 @@ class BrightnessTracker:
         Parameters
         ----------
         frame : np.ndarray
-            Input frame in BGR format
+            Input frame in BGR format, or an already grayscale frame
+            (uint8, uint16 or float32), which is used without conversion
 
         Returns
         -------
         np.ndarray
-            Preprocessed grayscale frame
+            Preprocessed grayscale frame in the input dtype
         """
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        if frame.ndim == 2:
+            gray = frame
+        else:
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
 
         if self.denoising:
             gray = cv2.GaussianBlur(gray, (self.kernel_size, self.kernel_size), 0)
@@ -110,19 +170,22 @@ class BrightnessTracker:
         dict
             Dictionary containing:
             - 'location': (x, y) coordinates of brightest point
-            - 'intensity': brightness value (0-255)
+            - 'intensity': brightness value in the frame's units
+              (0-255 for uint8, 0-65535 for uint16)
             - 'frame_number': current frame count
-            - 'timestamp': ISO format timestamp
+            - 'timestamp': ISO format timestamp, or int64 nanoseconds
+              with the monotonic clock
         """
         min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(frame)
 
         self.frame_count += 1
+        self.bleaching.update([0], [max_val], self.frame_count)
 
         return {
             "location": max_loc,
             "intensity": float(max_val),
             "frame_number": self.frame_count,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._now(),
         }
 
     def find_bright_regions(
@@ -150,7 +213,12 @@ class BrightnessTracker:
             - 'area': contour area
         """
         # Use Otsu's thresholding for better multi-region detection
-        _, thresh = cv2.threshold(frame, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        if frame.dtype == np.uint8:
+            _, thresh = cv2.threshold(
+                frame, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU
+            )
+        else:
+            thresh = cv2.compare(frame, _otsu_threshold(frame), cv2.CMP_GT)
 
         # Morphological operations to clean up
         kernel = np.ones((3, 3), np.uint8)
@@ -211,6 +279,24 @@ class BrightnessTracker:
             self.fps = num_frames / elapsed_time
         return self.fps
 
+    def bleaching_status(self) -> Dict[str, float]:
+        """
+        Live bleaching estimates of the ROI brightness.
+
+        Returns
+        -------
+        dict
+            OnlineBleachingEstimator.summary, with slope, rate and
+            half-life in frames
+        """
+        return self.bleaching.summary(0)
+
+    def should_stop(self) -> bool:
+        """True once the ROI has bleached below ``bleach_stop_fraction``"""
+        if self.bleach_stop_fraction is None:
+            return False
+        return bool(self.bleaching.is_bleached(self.bleach_stop_fraction)[0])
+
 
 class RegionSelector:
     """
@@ -10,13 +10,40 @@ This module implements advanced tracking with:
 
 import cv2
 import numpy as np
-from typing import Tuple, Optional, Dict, List
-from datetime import datetime
+from typing import Tuple, Optional, Dict, List, Union
 import logging
 
+from .bleaching import OnlineBleachingEstimator
+from .capture import LiveCaptureMixin
+from .clock import AcquisitionClock, resolve_clock
+
 logger = logging.getLogger(__name__)
 
 
+def full_scale(dtype: np.dtype, bit_depth: Optional[int] = None) -> float:
+    """
+    Full-scale intensity of a frame dtype.
+
+    Parameters
+    ----------
+    dtype : np.dtype
+        Frame dtype
+    bit_depth : int, optional
+        Sensor bit depth, e.g. 12 for 12-bit data stored as uint16
+
+    Returns
+    -------
+    float
+        2**bit_depth - 1 if given, else the integer dtype maximum;
+        1.0 for float frames
+    """
+    if bit_depth is not None:
+        return float(2**bit_depth - 1)
+    if np.issubdtype(dtype, np.integer):
+        return float(np.iinfo(dtype).max)
+    return 1.0
+
+
 class KalmanTracker:
     """
     Kalman filter for smooth trajectory tracking.
@@ -53,13 +80,153 @@ class KalmanTracker:
     def predict(self) -> Tuple[float, float]:
         """Predict next position"""
         pred = self.kf.predict()
-        return float(pred[0]), float(pred[1])
+        return float(pred[0, 0]), float(pred[1, 0])
 
     def update(self, x: float, y: float) -> Tuple[float, float]:
         """Update with new measurement"""
         measurement = np.array([x, y], dtype=np.float32).reshape(-1, 1)
         corrected = self.kf.correct(measurement)
-        return float(corrected[0]), float(corrected[1])
+        return float(corrected[0, 0]), float(corrected[1, 0])
+
+
+class BatchKalmanFilter:
+    """
+    Constant-velocity Kalman filter for many objects at once.
+
+    Holds the states and covariances of all tracked objects as stacked
+    arrays, so predicting or correcting every object takes a few batched
+    matrix operations instead of one filter object per track.
+
+    Parameters
+    ----------
+    process_noise : float, default=0.03
+        Process noise variance (same default as KalmanTracker)
+    measurement_noise : float, default=1.0
+        Measurement noise variance in pixels^2
+    initial_velocity_variance : float, default=10.0
+        Velocity variance for newly added objects, whose velocity is unknown
+    dt : float, default=1.0
+        Time step between frames
+
+    Attributes
+    ----------
+    state : np.ndarray
+        Array of shape (n, 4) with [x, y, vx, vy] per object
+    covariance : np.ndarray
+        Array of shape (n, 4, 4) with the state covariance per object
+    """
+
+    def __init__(
+        self,
+        process_noise: float = 0.03,
+        measurement_noise: float = 1.0,
+        initial_velocity_variance: float = 10.0,
+        dt: float = 1.0,
+    ):
+        self.transition = np.array(
+            [[1, 0, dt, 0], [0, 1, 0, dt], [0, 0, 1, 0], [0, 0, 0, 1]],
+            dtype=np.float64,
+        )
+        self.process_cov = np.eye(4) * process_noise
+        self.measurement_cov = np.eye(2) * measurement_noise
+        self.initial_cov = np.diag(
+            [
+                measurement_noise,
+                measurement_noise,
+                initial_velocity_variance,
+                initial_velocity_variance,
+            ]
+        )
+
+        self.state = np.empty((0, 4), dtype=np.float64)
+        self.covariance = np.empty((0, 4, 4), dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.state)
+
+    @property
+    def positions(self) -> np.ndarray:
+        """Current (x, y) estimates, shape (n, 2)"""
+        return self.state[:, :2]
+
+    def add(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Start filtering new objects at rest at the given positions.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            Array of shape (k, 2) with initial (x, y) measurements
+
+        Returns
+        -------
+        np.ndarray
+            Row indices of the new objects
+        """
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        start = len(self.state)
+
+        new_state = np.zeros((len(positions), 4))
+        new_state[:, :2] = positions
+        new_cov = np.broadcast_to(self.initial_cov, (len(positions), 4, 4))
+
+        self.state = np.concatenate([self.state, new_state])
+        self.covariance = np.concatenate([self.covariance, new_cov])
+
+        return np.arange(start, len(self.state))
+
+    def remove(self, indices: np.ndarray):
+        """Stop filtering the objects at the given row indices"""
+        self.state = np.delete(self.state, indices, axis=0)
+        self.covariance = np.delete(self.covariance, indices, axis=0)
+
+    def predict(self) -> np.ndarray:
+        """
+        Advance every object by one time step.
+
+        Returns
+        -------
+        np.ndarray
+            Predicted (x, y) positions, shape (n, 2)
+        """
+        F = self.transition
+        self.state = self.state @ F.T
+        self.covariance = F @ self.covariance @ F.T + self.process_cov
+        return self.positions
+
+    def update(self, indices: np.ndarray, measurements: np.ndarray) -> np.ndarray:
+        """
+        Correct a subset of objects with new position measurements.
+
+        Parameters
+        ----------
+        indices : np.ndarray
+            Row indices of the measured objects
+        measurements : np.ndarray
+            Array of shape (k, 2) with measured (x, y) positions
+
+        Returns
+        -------
+        np.ndarray
+            Corrected (x, y) positions of the measured objects
+        """
+        indices = np.asarray(indices, dtype=np.intp)
+        if len(indices) == 0:
+            return np.empty((0, 2))
+
+        z = np.asarray(measurements, dtype=np.float64).reshape(-1, 2)
+        x = self.state[indices]
+        P = self.covariance[indices]
+
+        # Measurement selects position, so H P = P[:, :2, :]
+        S = P[:, :2, :2] + self.measurement_cov
+        K = P[:, :, :2] @ np.linalg.inv(S)
+        innovation = z - x[:, :2]
+
+        self.state[indices] = x + (K @ innovation[:, :, None])[:, :, 0]
+        self.covariance[indices] = P - K @ P[:, :2, :]
+
+        return self.state[indices, :2]
 
 
 class AdaptiveBackgroundModel:
@@ -70,16 +237,19 @@ class AdaptiveBackgroundModel:
     distinguish true signals from background fluctuations.
     """
 
-    def __init__(self, learning_rate: float = 0.01):
+    def __init__(self, learning_rate: float = 0.01, bit_depth: Optional[int] = None):
         self.learning_rate = learning_rate
+        self.bit_depth = bit_depth
         self.mean = None
         self.std = None
 
     def update(self, frame: np.ndarray):
         """Update background model"""
         if self.mean is None:
+            # Initial spread of 10 grey levels at 8 bits, scaled to the data
+            initial_std = 10.0 * full_scale(frame.dtype, self.bit_depth) / 255.0
             self.mean = frame.astype(np.float32)
-            self.std = np.ones_like(frame, dtype=np.float32) * 10.0
+            self.std = np.full(frame.shape, initial_std, dtype=np.float32)
         else:
             # Running average
             self.mean = (
@@ -118,7 +288,7 @@ class AdaptiveBackgroundModel:
         return mask
 
 
-class EnhancedBrightnessTracker:
+class EnhancedBrightnessTracker(LiveCaptureMixin):
     """
     Enhanced brightness tracker with adaptive algorithms.
 
@@ -140,6 +310,26 @@ class EnhancedBrightnessTracker:
         Enable Gaussian denoising
     kernel_size : int, default=5
         Kernel size for Gaussian blur
+    bit_depth : int, optional
+        Sensor bit depth (e.g. 12). Defaults to the full range of the
+        frame dtype. Frames are processed in their own dtype (uint8,
+        uint16 or float32) without conversion.
+    min_intensity : float, optional
+        Minimum peak intensity for ``find_multiple_spots``. Defaults to
+        50/255 of full scale.
+    clock : {'wall', 'monotonic'} or AcquisitionClock, default='wall'
+        Timestamp source for results: ISO strings ('wall') or int64
+        nanoseconds from a monotonic acquisition clock
+    bleach_stop_fraction : float, optional
+        Request a stop (see ``should_stop``) once the fitted brightness
+        drops below this fraction of its initial value
+    bleaching_forgetting : float, default=1.0
+        Forgetting factor of the online bleaching fit
+    capture_backend : str, default='auto'
+        Screen capture backend for ``capture_frame`` ('mss', 'pil' or
+        'auto', see ``fluotrack.capture``)
+    grayscale_capture : bool, default=True
+        Capture grayscale frames, the input ``find_brightest_point`` expects
     """
 
     def __init__(
@@ -149,6 +339,13 @@ class EnhancedBrightnessTracker:
         use_adaptive_bg: bool = True,
         denoising: bool = True,
         kernel_size: int = 5,
+        bit_depth: Optional[int] = None,
+        min_intensity: Optional[float] = None,
+        clock: Union[str, AcquisitionClock] = "wall",
+        bleach_stop_fraction: Optional[float] = None,
+        bleaching_forgetting: float = 1.0,
+        capture_backend: str = "auto",
+        grayscale_capture: bool = True,
     ):
 
         self.bbox = bbox
@@ -156,6 +353,10 @@ class EnhancedBrightnessTracker:
         self.use_adaptive_bg = use_adaptive_bg
         self.denoising = denoising
         self.kernel_size = kernel_size
+        self.bit_depth = bit_depth
+        self.min_intensity = min_intensity
+        self._now = resolve_clock(clock)
+        self._init_capture(capture_backend, grayscale_capture)
 
         # Initialize Kalman filter
         if self.use_kalman:
@@ -163,7 +364,16 @@ class EnhancedBrightnessTracker:
 
         # Initialize background model
         if self.use_adaptive_bg:
-            self.bg_model = AdaptiveBackgroundModel(learning_rate=0.01)
+            self.bg_model = AdaptiveBackgroundModel(
+                learning_rate=0.01, bit_depth=bit_depth
+            )
+
+        # Online bleaching fit of the peak brightness per frame
+        if bleach_stop_fraction is not None and not 0.0 < bleach_stop_fraction < 1.0:
+            raise ValueError("bleach_stop_fraction must be in (0, 1)")
+        self.bleach_stop_fraction = bleach_stop_fraction
+        self.bleaching = OnlineBleachingEstimator(bleaching_forgetting)
+        self.bleaching.add(1)
 
         self.frame_count = 0
         self.fps = 0.0
@@ -299,6 +509,8 @@ class EnhancedBrightnessTracker:
         else:
             smoothed_loc = max_loc
 
+        self.bleaching.update([0], [max_val], self.frame_count)
+
         # Compute signal quality
         quality = self.compute_signal_quality(frame, max_loc, max_val)
 
@@ -307,7 +519,7 @@ class EnhancedBrightnessTracker:
             "raw_location": max_loc,
             "intensity": float(max_val),
             "frame_number": self.frame_count,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._now(),
             "snr": quality["snr"],
             "contrast": quality["contrast"],
             "confidence": quality["confidence"],
@@ -336,6 +548,10 @@ class EnhancedBrightnessTracker:
         # Preprocess
         processed = self.preprocess_frame(frame)
 
+        min_intensity = self.min_intensity
+        if min_intensity is None:
+            min_intensity = 50.0 * full_scale(frame.dtype, self.bit_depth) / 255.0
+
         spots = []
         mask = processed.copy()
 
@@ -343,7 +559,7 @@ class EnhancedBrightnessTracker:
             # Find brightest remaining point
             min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(mask)
 
-            if max_val < 50:  # Minimum intensity threshold
+            if max_val < min_intensity:  # Minimum intensity threshold
                 break
 
             # Compute quality
@@ -373,6 +589,16 @@ class EnhancedBrightnessTracker:
             self.fps = num_frames / elapsed_time
         return self.fps
 
+    def bleaching_status(self) -> Dict[str, float]:
+        """Live bleaching estimates of the peak brightness (per frame)"""
+        return self.bleaching.summary(0)
+
+    def should_stop(self) -> bool:
+        """True once the ROI has bleached below ``bleach_stop_fraction``"""
+        if self.bleach_stop_fraction is None:
+            return False
+        return bool(self.bleaching.is_bleached(self.bleach_stop_fraction)[0])
+
 
 # Backward compatibility: keep original class name
 class BrightnessTracker(EnhancedBrightnessTracker):
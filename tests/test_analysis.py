@@ -7,7 +7,13 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 import tempfile
-from fluotrack.analysis import DataLogger, BrightnessAnalyzer
+from fluotrack.analysis import (
+    DataLogger,
+    BrightnessAnalyzer,
+    StreamingBrightnessAnalyzer,
+    decimate_minmax,
+    fit_photobleaching,
+)
 
 
 class TestDataLogger:
@@ -93,6 +99,148 @@ class TestDataLogger:
             assert len(df) == 3
             assert all(df['notes'].str.startswith('region_'))
 
+    def test_buffered_flush_by_rows(self):
+        """Test that buffered rows are written once flush_rows is reached"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = DataLogger(output_dir=tmpdir, mode='buffered',
+                                flush_rows=5, flush_interval=3600)
+            data = {'timestamp': 't', 'frame_number': 1,
+                    'location': (1, 2), 'intensity': 100.0}
+
+            for _ in range(4):
+                logger.log_point(data)
+            assert len(pd.read_csv(logger.filename)) == 0
+
+            logger.log_point(data)
+            assert len(pd.read_csv(logger.filename)) == 5
+
+            logger.log_point(data)
+            logger.flush()
+            assert len(pd.read_csv(logger.filename)) == 6
+            logger.close()
+
+    def test_buffered_context_manager(self):
+        """Test that leaving the context writes pending rows and closes"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            regions = [{'location': (i, i), 'intensity': 10.0 * i}
+                       for i in range(50)]
+
+            with DataLogger(output_dir=tmpdir, mode='buffered') as logger:
+                for frame in range(20):
+                    logger.log_regions(regions, frame_number=frame)
+
+            df = pd.read_csv(logger.filename)
+            assert len(df) == 1000
+            assert df['frame_number'].tolist() == sorted(df['frame_number'])
+
+            with pytest.raises(ValueError):
+                logger.log_regions(regions, frame_number=21)
+
+    def test_async_writes_all_rows(self):
+        """Test that the async writer writes every queued row"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with DataLogger(output_dir=tmpdir, mode='async',
+                            flush_rows=7) as logger:
+                for frame in range(100):
+                    logger.log_point({'timestamp': 't', 'frame_number': frame,
+                                      'location': (1, 2), 'intensity': 1.0})
+                logger.flush()
+                assert len(pd.read_csv(logger.filename)) == 100
+                assert logger.queue_depth == 0
+
+            df = pd.read_csv(logger.filename)
+            assert df['frame_number'].tolist() == list(range(100))
+            assert logger.dropped_records == 0
+
+    @pytest.mark.parametrize('policy', ['drop_oldest', 'spill'])
+    def test_async_backpressure(self, policy):
+        """Test drop-oldest and spill policies while the writer is stalled"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = DataLogger(output_dir=tmpdir, mode='async', queue_size=2,
+                                backpressure=policy)
+
+            # Holding the file lock stalls the writer thread
+            with logger._lock:
+                for frame in range(10):
+                    logger.log_point({'timestamp': 't', 'frame_number': frame,
+                                      'location': (1, 2), 'intensity': 1.0})
+                assert logger.queue_depth == 2
+            logger.close()
+
+            frames = pd.read_csv(logger.filename)['frame_number'].tolist()
+            if policy == 'drop_oldest':
+                assert logger.dropped_records >= 7
+                assert len(frames) + logger.dropped_records == 10
+                assert frames[-2:] == [8, 9]
+            else:
+                assert logger.spilled_records >= 7
+                assert sorted(frames) == list(range(10))
+                assert not logger.spill_filename.exists()
+
+    @pytest.mark.parametrize('mode', ['buffered', 'async'])
+    def test_parquet_row_groups(self, mode):
+        """Test typed Parquet output written in row groups"""
+        pq = pytest.importorskip('pyarrow.parquet')
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with DataLogger(output_dir=tmpdir, mode=mode, file_format='parquet',
+                            flush_rows=10) as logger:
+                for frame in range(35):
+                    logger.log_point({
+                        'timestamp': f'2025-01-17T12:00:{frame:02d}',
+                        'frame_number': frame,
+                        'location': (frame, 2 * frame),
+                        'intensity': 100.0 - frame,
+                    })
+
+            assert logger.filename.suffix == '.parquet'
+            metadata = pq.ParquetFile(logger.filename).metadata
+            assert metadata.num_rows == 35
+            assert metadata.num_row_groups == 4
+
+            analyzer = BrightnessAnalyzer(logger.filename)
+            assert str(analyzer.data['timestamp'].dtype).startswith('datetime64')
+            stats = analyzer.compute_statistics()
+            assert stats['total_frames'] == 34
+            assert stats['duration_seconds'] == 34.0
+
+    def test_parquet_needs_persistent_mode(self):
+        """Test that the Parquet format is rejected in direct mode"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(ValueError):
+                DataLogger(output_dir=tmpdir, file_format='parquet')
+
+    def test_integer_timestamps(self):
+        """Test logging and analyzing monotonic integer timestamps"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with DataLogger(output_dir=tmpdir, mode='buffered',
+                            clock='monotonic') as logger:
+                logger.log_regions([{'location': (1, 2), 'intensity': 5.0}], 1)
+                for frame in range(10):
+                    logger.log_point({'timestamp': 10**18 + frame * 250_000_000,
+                                      'frame_number': frame,
+                                      'location': (1, 2), 'intensity': 1.0})
+
+            df = pd.read_csv(logger.filename)
+            assert df['timestamp'].dtype == np.int64
+
+            analyzer = BrightnessAnalyzer(logger.filename)
+            analyzer.data = analyzer.data.iloc[1:]
+            stats = analyzer.compute_statistics()
+            assert stats['duration_seconds'] == pytest.approx(2.25)
+
+            report = Path(tmpdir) / 'report.xlsx'
+            analyzer.generate_report(str(report))
+            raw = pd.read_excel(report, sheet_name='Raw Data')
+            assert str(raw['timestamp'].dtype).startswith('datetime64')
+
+    def test_invalid_mode(self):
+        """Test that an unknown logging mode is rejected"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(ValueError):
+                DataLogger(output_dir=tmpdir, mode='memory')
+            with pytest.raises(ValueError):
+                DataLogger(output_dir=tmpdir, mode='async', backpressure='wait')
+
 
 class TestBrightnessAnalyzer:
     """Tests for BrightnessAnalyzer class"""
@@ -129,6 +277,28 @@ class TestBrightnessAnalyzer:
         assert len(analyzer.data) == 100
         assert 'brightness' in analyzer.data.columns
         
+    def test_column_projection(self, sample_data_file):
+        """Test loading only selected columns"""
+        analyzer = BrightnessAnalyzer(sample_data_file,
+                                      columns=['frame_number', 'brightness'])
+
+        assert list(analyzer.data.columns) == ['frame_number', 'brightness']
+        assert len(analyzer.data) == 100
+
+    def test_statistics_after_projection(self, sample_data_file):
+        """Test that statistics skip columns that were not loaded"""
+        full = BrightnessAnalyzer(sample_data_file).compute_statistics()
+        analyzer = BrightnessAnalyzer(sample_data_file,
+                                      columns=['brightness', 'frame_number'])
+
+        stats = analyzer.compute_statistics()
+
+        assert 'duration_seconds' not in stats
+        assert 'average_fps' not in stats
+        assert stats == {key: value for key, value in full.items()
+                         if key in stats}
+        assert set(stats) == set(full) - {'duration_seconds', 'average_fps'}
+
     def test_compute_statistics(self, sample_data_file):
         """Test statistics computation"""
         analyzer = BrightnessAnalyzer(sample_data_file)
@@ -179,6 +349,35 @@ class TestBrightnessAnalyzer:
         assert trajectory['confinement_radius'] < 20
         assert len(trajectory['center']) == 2
         
+    def test_decimate_minmax(self):
+        """Test that decimation keeps bucket extremes in order"""
+        rng = np.random.default_rng(4)
+        x = np.arange(100_003)
+        y = rng.normal(0, 1, len(x))
+        y[[10, 5000, 99_999]] = [50.0, -40.0, 30.0]
+
+        xd, yd = decimate_minmax(x, y, 500)
+
+        assert len(xd) <= 1000
+        assert np.all(np.diff(xd) >= 0)
+        assert {10, 5000, 99_999} <= set(xd.tolist())
+        assert yd.max() == 50.0 and yd.min() == -40.0
+        np.testing.assert_array_equal(decimate_minmax(x[:50], y[:50], 500)[1], y[:50])
+
+    def test_plots_saved_headless(self, sample_data_file, tmp_path):
+        """Test that saved plots render without pyplot figures"""
+        import matplotlib.pyplot as plt
+
+        analyzer = BrightnessAnalyzer(sample_data_file)
+        open_figures = plt.get_fignums()
+
+        analyzer.plot_brightness_trend(tmp_path / 'trend.png', dpi=50)
+        analyzer.plot_trajectory(tmp_path / 'trajectory.png', dpi=50)
+
+        assert (tmp_path / 'trend.png').stat().st_size > 0
+        assert (tmp_path / 'trajectory.png').stat().st_size > 0
+        assert plt.get_fignums() == open_figures
+
     def test_generate_report(self, sample_data_file):
         """Test report generation"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -202,6 +401,115 @@ class TestBrightnessAnalyzer:
             excel_file.close()
 
 
+class TestStreamingBrightnessAnalyzer:
+    """Tests for StreamingBrightnessAnalyzer class"""
+
+    @pytest.fixture
+    def log_file(self, tmp_path):
+        """Create a bleaching, diffusing log of 5000 rows"""
+        rng = np.random.default_rng(0)
+        n = 5000
+        path = tmp_path / 'log.csv'
+        pd.DataFrame({
+            'timestamp': 10**18 + np.arange(n) * 33_000_000,
+            'frame_number': np.arange(1, n + 1),
+            'x': 250 + np.cumsum(rng.integers(-2, 3, n)),
+            'y': 250 + np.cumsum(rng.integers(-2, 3, n)),
+            'brightness': 200 * np.exp(-np.arange(n) / 2000) + rng.normal(0, 3, n),
+            'notes': '',
+        }).to_csv(path, index=False)
+        return path
+
+    def test_matches_in_memory_analyzer(self, log_file):
+        """Test that chunked results equal the in-memory ones"""
+        expected = BrightnessAnalyzer(log_file)
+        streaming = StreamingBrightnessAnalyzer(log_file, chunksize=333)
+
+        for method in ('compute_statistics', 'analyze_trajectory'):
+            result = getattr(streaming, method)()
+            for key, value in getattr(expected, method)().items():
+                assert result[key] == pytest.approx(value, rel=1e-9), key
+
+        result = streaming.detect_photobleaching(window_size=50)
+        bleaching = expected.detect_photobleaching(window_size=50)
+        assert result['slope'] == pytest.approx(bleaching['slope'], rel=1e-9)
+        assert result['half_life_frames'] == bleaching['half_life_frames']
+        assert result['is_bleaching']
+
+    def test_record_count(self, log_file):
+        """Test the row count with and without a previous pass"""
+        streaming = StreamingBrightnessAnalyzer(log_file, chunksize=999)
+        streaming.detect_photobleaching(window_size=50)
+
+        assert streaming.n_records == 5000
+        # Counted from the cached pass, without reading the log again
+        assert list(streaming._results) == [50]
+        assert StreamingBrightnessAnalyzer(log_file).n_records == 5000
+
+    def test_chunks_shorter_than_window(self, log_file):
+        """Test the moving average when chunks are smaller than the window"""
+        expected = BrightnessAnalyzer(log_file).detect_photobleaching(200)
+        streaming = StreamingBrightnessAnalyzer(log_file, chunksize=64)
+
+        result = streaming.detect_photobleaching(200)
+
+        assert result['slope'] == pytest.approx(expected['slope'], rel=1e-9)
+
+    @pytest.mark.parametrize('chunksize', [120, 150, 180])
+    def test_window_tail_regression(self, tmp_path, chunksize):
+        """Test the carried tail when a chunk holds less than one window"""
+        # With a chunk between half and one window long, the tail slice
+        # start was negative and dropped the first rows of the window
+        n = 450
+        path = tmp_path / 'short.csv'
+        pd.DataFrame({
+            'timestamp': np.arange(n) * 33_000_000,
+            'frame_number': np.arange(1, n + 1),
+            'x': np.zeros(n, dtype=int),
+            'y': np.zeros(n, dtype=int),
+            'brightness': 200.0 - 0.1 * np.arange(n) ** 1.2,
+            'notes': '',
+        }).to_csv(path, index=False)
+        expected = BrightnessAnalyzer(path).detect_photobleaching(200)
+        streaming = StreamingBrightnessAnalyzer(path, chunksize=chunksize)
+
+        result = streaming.detect_photobleaching(200)
+
+        assert result['slope'] == pytest.approx(expected['slope'], rel=1e-9)
+        assert result['half_life_frames'] == expected['half_life_frames']
+        assert streaming.detect_photobleaching(n + 1) == {}
+
+    def test_sampled_quantiles(self, log_file):
+        """Test that quantiles from a row sample stay close"""
+        expected = BrightnessAnalyzer(log_file).compute_statistics()
+        streaming = StreamingBrightnessAnalyzer(log_file, chunksize=500,
+                                                sample_size=1000)
+
+        stats = streaming.compute_statistics()
+
+        assert stats['mean_brightness'] == pytest.approx(
+            expected['mean_brightness'])
+        assert stats['median_brightness'] == pytest.approx(
+            expected['median_brightness'], rel=0.05)
+
+    def test_parquet_chunks(self, tmp_path):
+        """Test reading Parquet logs batch by batch"""
+        pytest.importorskip('pyarrow')
+        with DataLogger(output_dir=tmp_path, mode='buffered',
+                        file_format='parquet') as logger:
+            for frame in range(300):
+                logger.log_point({'timestamp': 10**18 + frame * 10**9,
+                                  'frame_number': frame, 'location': (1, 1),
+                                  'intensity': float(frame)})
+
+        streaming = StreamingBrightnessAnalyzer(logger.filename, chunksize=64)
+        stats = streaming.compute_statistics()
+
+        assert stats['mean_brightness'] == pytest.approx(149.5)
+        assert stats['duration_seconds'] == pytest.approx(299.0)
+        assert stats['median_brightness'] == pytest.approx(149.5)
+
+
 def test_end_to_end_workflow():
     """Integration test: log data then analyze"""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -229,5 +537,79 @@ def test_end_to_end_workflow():
         assert bleaching['is_bleaching'] is True
 
 
+class TestFitPhotobleaching:
+    """Tests for batch exponential bleaching fits"""
+
+    def test_mono_exponential_batch(self):
+        """Test recovery of per-series amplitude, rate and plateau"""
+        rng = np.random.default_rng(1)
+        t = np.arange(200)
+        amplitude = rng.uniform(100, 1000, 500)
+        rate = rng.uniform(0.005, 0.05, 500)
+        plateau = rng.uniform(10, 100, 500)
+        values = amplitude[:, None] * np.exp(-rate[:, None] * t) + plateau[:, None]
+
+        fit = fit_photobleaching(values)
+
+        assert fit['converged'].all()
+        np.testing.assert_allclose(fit['rate'], rate, rtol=1e-6)
+        np.testing.assert_allclose(fit['amplitude'], amplitude, rtol=1e-6)
+        np.testing.assert_allclose(fit['plateau'], plateau, rtol=1e-4)
+        np.testing.assert_allclose(fit['half_life'], np.log(2) / rate, rtol=1e-6)
+        assert fit['r_squared'] == pytest.approx(np.ones(500))
+
+    def test_ragged_series_and_times(self):
+        """Test ragged input with per-series times and too-short series"""
+        times = [np.arange(10, 60, 2), np.arange(0, 100), np.array([0.0, 1.0])]
+        series = [800 * np.exp(-0.03 * (t - t[0])) + 20 for t in times]
+
+        fit = fit_photobleaching(series, times)
+
+        assert fit['n_points'].tolist() == [25, 100, 2]
+        assert fit['start_time'].tolist() == [10.0, 0.0, 0.0]
+        np.testing.assert_allclose(fit['rate'][:2], 0.03, rtol=1e-6)
+        assert np.isnan(fit['rate'][2])
+        assert not fit['converged'][2]
+
+    def test_matches_curve_fit_on_noisy_data(self):
+        """Test agreement with scipy curve_fit on noisy series"""
+        from scipy.optimize import curve_fit
+
+        def exp_decay(t, A, k, C):
+            return A * np.exp(-k * t) + C
+
+        rng = np.random.default_rng(2)
+        t = np.arange(150.0)
+        values = 500 * np.exp(-0.02 * t) + 80 + rng.normal(0, 10, (20, 150))
+
+        fit = fit_photobleaching(values)
+
+        for row, fitted_rate in zip(values, fit['rate']):
+            popt, _ = curve_fit(exp_decay, t, row, p0=[400, 0.01, 100])
+            assert fitted_rate == pytest.approx(popt[1], rel=1e-4)
+
+    def test_bi_exponential(self):
+        """Test recovery of fast and slow components"""
+        t = np.arange(300.0)
+        values = (
+            600 * np.exp(-0.1 * t) + 300 * np.exp(-0.005 * t) + 50
+        )[None, :].repeat(3, axis=0)
+
+        fit = fit_photobleaching(values, model='bi')
+
+        assert fit['rate'].shape == (3, 2)
+        np.testing.assert_allclose(fit['rate'], [[0.1, 0.005]] * 3, rtol=1e-4)
+        np.testing.assert_allclose(
+            fit['amplitude'], [[600, 300]] * 3, rtol=1e-4
+        )
+        np.testing.assert_allclose(fit['plateau'], 50, rtol=1e-3)
+
+    def test_invalid_model(self):
+        """Test that unknown models are rejected"""
+        with pytest.raises(ValueError):
+            fit_photobleaching(np.ones((2, 10)), model='triple')
+
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
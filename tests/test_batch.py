@@ -0,0 +1,138 @@
+"""
+Unit tests for FluoTrack batch analysis.
+"""
+
+import os
+import pytest
+import numpy as np
+import pandas as pd
+from fluotrack.analysis import BrightnessAnalyzer
+from fluotrack.batch import analyze_batch, analyze_file, find_logs, main
+
+
+def write_log(path, n=300, decay=500.0, seed=0):
+    """Write a synthetic bleaching brightness log"""
+    rng = np.random.default_rng(seed)
+    pd.DataFrame({
+        'timestamp': 10**18 + np.arange(n) * 33_000_000,
+        'frame_number': np.arange(1, n + 1),
+        'x': 100 + rng.integers(-3, 4, n),
+        'y': 100 + rng.integers(-3, 4, n),
+        'brightness': 200 * np.exp(-np.arange(n) / decay),
+        'notes': '',
+    }).to_csv(path, index=False)
+    return path
+
+
+class TestBatchAnalysis:
+    """Tests for analyze_batch and helpers"""
+
+    @pytest.fixture
+    def log_dir(self, tmp_path):
+        """Directory with three logs and one unrelated file"""
+        for i in range(3):
+            write_log(tmp_path / f'brightness_log_{i}.csv', seed=i)
+        (tmp_path / 'notes.txt').write_text('not a log')
+        return tmp_path
+
+    def test_find_logs(self, log_dir):
+        """Test directory and glob inputs"""
+        from_dir = find_logs(log_dir)
+        from_glob = find_logs(str(log_dir / 'brightness_log_[01].csv'))
+
+        assert [p.name for p in from_dir] == [
+            'brightness_log_0.csv', 'brightness_log_1.csv', 'brightness_log_2.csv'
+        ]
+        assert [p.name for p in from_glob] == [
+            'brightness_log_0.csv', 'brightness_log_1.csv'
+        ]
+
+    def test_row_matches_analyzer(self, log_dir):
+        """Test that a summary row holds the analyzer results"""
+        path = log_dir / 'brightness_log_0.csv'
+        analyzer = BrightnessAnalyzer(path)
+
+        row = analyze_file(path)
+
+        assert row['status'] == 'ok'
+        assert row['n_records'] == 300
+        assert row['mean_brightness'] == analyzer.compute_statistics()[
+            'mean_brightness'
+        ]
+        assert row['bleaching_slope'] == analyzer.detect_photobleaching()['slope']
+        assert row['center_x'] == analyzer.analyze_trajectory()['center'][0]
+
+    def test_streaming_row(self, log_dir):
+        """Test that chunked analysis gives the same statistics"""
+        path = log_dir / 'brightness_log_1.csv'
+
+        full = analyze_file(path)
+        streamed = analyze_file(path, chunksize=64)
+
+        assert streamed['n_records'] == 300
+        assert streamed['mean_brightness'] == pytest.approx(full['mean_brightness'])
+        assert streamed['bleaching_slope'] == pytest.approx(full['bleaching_slope'])
+
+    def test_parallel_summary(self, log_dir, tmp_path):
+        """Test process-pool analysis into one summary table"""
+        summary_file = tmp_path / 'summary.csv'
+        calls = []
+
+        summary = analyze_batch(
+            log_dir, summary_file, n_workers=2,
+            progress=lambda done, total, row: calls.append((done, total)),
+        )
+
+        assert len(summary) == 3
+        assert (summary['status'] == 'ok').all()
+        assert sorted(calls) == [(1, 3), (2, 3), (3, 3)]
+        assert pd.read_csv(summary_file)['file'].tolist() == summary['file'].tolist()
+
+    def test_unchanged_files_skipped(self, log_dir, tmp_path):
+        """Test that only new or modified files are analyzed again"""
+        summary_file = tmp_path / 'summary.csv'
+        analyze_batch(log_dir, summary_file, n_workers=1, progress=None)
+
+        write_log(log_dir / 'brightness_log_3.csv')
+        changed = write_log(log_dir / 'brightness_log_0.csv', n=200)
+        os.utime(changed, ns=(0, 10**18))
+
+        analyzed = []
+        summary = analyze_batch(
+            log_dir, summary_file, n_workers=1,
+            progress=lambda done, total, row: analyzed.append(row['file']),
+        )
+
+        assert sorted(os.path.basename(f) for f in analyzed) == [
+            'brightness_log_0.csv', 'brightness_log_3.csv'
+        ]
+        assert len(summary) == 4
+        assert summary.loc[0, 'n_records'] == 200
+
+    def test_errors_are_recorded(self, tmp_path):
+        """Test that unreadable files get an error row instead of raising"""
+        (tmp_path / 'brightness_log_bad.csv').write_text('a,b\n1,2\n')
+
+        summary = analyze_batch(
+            tmp_path, tmp_path / 'summary.csv', n_workers=1, progress=None
+        )
+
+        assert summary.loc[0, 'status'] == 'error'
+        assert 'KeyError' in summary.loc[0, 'error']
+
+    def test_missing_file_is_recorded(self, tmp_path):
+        """Test that a file removed before analysis gets an error row"""
+        row = analyze_file(tmp_path / 'brightness_log_gone.csv')
+
+        assert row['status'] == 'error'
+        assert 'FileNotFoundError' in row['error']
+        assert row['size'] is None
+
+    def test_command_line(self, log_dir, tmp_path):
+        """Test the command-line entry point"""
+        summary_file = tmp_path / 'out.csv'
+
+        status = main([str(log_dir), '-o', str(summary_file), '-j', '1'])
+
+        assert status == 0
+        assert len(pd.read_csv(summary_file)) == 3
@@ -0,0 +1,130 @@
+"""
+Unit tests for FluoTrack online photobleaching estimation.
+"""
+
+import pytest
+import numpy as np
+from fluotrack.bleaching import OnlineBleachingEstimator
+from fluotrack.enhanced_tracker import MultiTargetTracker
+from fluotrack.tracker import BrightnessTracker
+from fluotrack.tracker_enhanced import EnhancedBrightnessTracker
+
+
+class TestOnlineBleachingEstimator:
+    """Tests for OnlineBleachingEstimator class"""
+
+    def test_slope_matches_polyfit(self):
+        """Test that the running linear trend equals a full refit"""
+        rng = np.random.default_rng(0)
+        series = 1000.0 - 2.5 * np.arange(500) + rng.normal(0, 20, (3, 500))
+
+        estimator = OnlineBleachingEstimator()
+        rows = estimator.add(3)
+        for column in series.T:
+            estimator.update(rows, column)
+
+        expected = [np.polyfit(np.arange(500), s, 1)[0] for s in series]
+        np.testing.assert_allclose(estimator.slope, expected, rtol=1e-10)
+        np.testing.assert_allclose(estimator.mean_intensity, series.mean(axis=1))
+
+    def test_exponential_rate_and_half_life(self):
+        """Test recovery of a mono-exponential decay"""
+        frames = np.arange(1, 201)
+        estimator = OnlineBleachingEstimator()
+        estimator.add(1)
+        for t in frames:
+            estimator.update([0], [800.0 * np.exp(-0.01 * t)], t)
+
+        assert estimator.rate[0] == pytest.approx(0.01)
+        assert estimator.half_life[0] == pytest.approx(np.log(2) / 0.01)
+        assert estimator.remaining_fraction[0] == pytest.approx(np.exp(-1.99))
+
+    def test_forgetting_follows_rate_change(self):
+        """Test that a forgetting factor tracks a change in bleaching rate"""
+        estimator = OnlineBleachingEstimator(forgetting_factor=0.9)
+        estimator.add(1)
+        intensity = 1000.0
+        for t in range(400):
+            intensity *= np.exp(-0.001 if t < 200 else -0.02)
+            estimator.update([0], [intensity], t)
+
+        assert estimator.rate[0] == pytest.approx(0.02)
+
+    def test_undetermined_and_not_dimming(self):
+        """Test NaN before two points and infinite half-life for flat signals"""
+        estimator = OnlineBleachingEstimator(min_observations=3)
+        estimator.add(2)
+        estimator.update([0, 1], [100.0, 100.0])
+
+        assert np.isnan(estimator.slope).all()
+        assert np.isnan(estimator.half_life).all()
+
+        estimator.update([0, 1], [100.0, 40.0])
+        estimator.update([0, 1], [100.0, 10.0])
+
+        assert estimator.half_life[0] == np.inf
+        assert estimator.is_bleached(0.5).tolist() == [False, True]
+
+    def test_remove_keeps_rows_aligned(self):
+        """Test that removing rows keeps the statistics of the others"""
+        estimator = OnlineBleachingEstimator()
+        estimator.add(3)
+        for t in range(5):
+            estimator.update([0, 1, 2], [10.0 - t, 20.0, 30.0 + 2 * t])
+
+        estimator.remove([1])
+
+        assert len(estimator) == 2
+        np.testing.assert_allclose(estimator.slope, [-1.0, 2.0])
+
+    def test_invalid_forgetting_factor(self):
+        """Test that an out-of-range forgetting factor is rejected"""
+        with pytest.raises(ValueError):
+            OnlineBleachingEstimator(forgetting_factor=1.5)
+
+
+class TestLiveBleaching:
+    """Tests for bleaching estimates inside the trackers"""
+
+    def test_track_statistics_use_running_fit(self):
+        """Test that live track trends equal the refit of the history"""
+        tracker = MultiTargetTracker(max_distance=20.0)
+        for t in range(30):
+            spots = [
+                {'location': (10, 10), 'intensity': 200.0 - 3 * t, 'area': 20},
+                {'location': (80, 80), 'intensity': 150.0, 'area': 20},
+            ]
+            tracker.update(spots, f't{t}')
+
+        stats = tracker.get_track_statistics(0)
+        track = tracker.track_history[0]
+        expected = np.polyfit(np.arange(len(track)), track.intensity, 1)[0]
+
+        assert stats['intensity_trend'] == pytest.approx(expected)
+        assert stats['is_photobleaching']
+        assert tracker.bleached_tracks(0.7) == [0]
+        assert tracker.get_bleaching(1)['rate'] == pytest.approx(0.0)
+
+    def test_brightness_tracker_requests_stop(self):
+        """Test that the ROI tracker asks to stop once bleached"""
+        tracker = BrightnessTracker((0, 0, 32, 32), bleach_stop_fraction=0.5)
+        stopped_at = None
+        for t in range(200):
+            frame = np.full((32, 32), 4000.0 * np.exp(-0.02 * t), np.float32)
+            tracker.find_brightest_point(frame)
+            if tracker.should_stop():
+                stopped_at = t
+                break
+
+        # exp(-0.02 t) < 0.5 once t > ln(2) / 0.02 = 34.7 frames
+        assert stopped_at == 35
+        assert tracker.bleaching_status()['half_life'] == pytest.approx(34.66, 1e-3)
+
+    @pytest.mark.parametrize('tracker_class', [
+        BrightnessTracker, EnhancedBrightnessTracker
+    ])
+    @pytest.mark.parametrize('fraction', [0.0, 1.0, 50.0])
+    def test_invalid_stop_fraction(self, tracker_class, fraction):
+        """Test that stop fractions outside (0, 1) are rejected"""
+        with pytest.raises(ValueError, match='bleach_stop_fraction'):
+            tracker_class((0, 0, 32, 32), bleach_stop_fraction=fraction)
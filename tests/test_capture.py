@@ -0,0 +1,275 @@
+"""
+Unit tests for FluoTrack screen capture backends.
+"""
+
+import time
+import pytest
+import numpy as np
+import cv2
+from PIL import Image, ImageGrab
+import fluotrack.capture as capture
+from fluotrack.capture import (
+    CaptureRing, MssCapture, PILCapture, ScreenCapture, open_capture
+)
+from fluotrack.clock import AcquisitionClock
+from fluotrack.tracker import BrightnessTracker
+from fluotrack.tracker_enhanced import EnhancedBrightnessTracker
+
+
+class CountingCapture(ScreenCapture):
+    """Fake backend filling every frame with its grab count"""
+
+    def __init__(self, delay=0.0, fail_after=None):
+        super().__init__((0, 0, 16, 8), grayscale=True)
+        self.delay = delay
+        self.fail_after = fail_after
+        self.count = 0
+
+    def _grab_into(self, out):
+        if self.fail_after is not None and self.count >= self.fail_after:
+            raise OSError('display lost')
+        out[:8] = self.count % 256
+        time.sleep(self.delay)
+        out[8:] = self.count % 256
+        self.count += 1
+
+
+@pytest.fixture
+def screen(monkeypatch):
+    """Fake RGB screen behind PIL.ImageGrab.grab"""
+    rng = np.random.default_rng(0)
+    pixels = rng.integers(0, 256, (120, 160, 3), dtype=np.uint8)
+
+    def grab(bbox=None):
+        x1, y1, x2, y2 = bbox
+        return Image.fromarray(pixels[y1:y2, x1:x2])
+
+    monkeypatch.setattr(ImageGrab, 'grab', grab)
+    return pixels
+
+
+class TestPILCapture:
+    """Tests for PILCapture class"""
+
+    def test_bgr_into_reused_buffer(self, screen):
+        """Test that frames are BGR and written into the same buffer"""
+        grabber = PILCapture((10, 20, 50, 60))
+
+        first = grabber.grab()
+        second = grabber.grab()
+
+        assert first is second is grabber.buffer
+        assert first.shape == (40, 40, 3)
+        np.testing.assert_array_equal(first, screen[20:60, 10:50, ::-1])
+
+    def test_grayscale(self, screen):
+        """Test direct grayscale capture"""
+        grabber = PILCapture((0, 0, 160, 120), grayscale=True)
+
+        frame = grabber.grab()
+
+        assert frame.shape == (120, 160)
+        np.testing.assert_array_equal(
+            frame, cv2.cvtColor(screen, cv2.COLOR_RGB2GRAY)
+        )
+
+    def test_caller_buffer(self, screen):
+        """Test capturing into a caller-provided buffer"""
+        grabber = PILCapture((0, 0, 32, 16))
+        out = grabber.allocate()
+
+        assert grabber.grab(out) is out
+        with pytest.raises(ValueError):
+            grabber.grab(np.empty((16, 32), np.uint8))
+
+
+class TestMssCapture:
+    """Tests for MssCapture class"""
+
+    def test_bgra_conversion(self):
+        """Test conversion of an MSS BGRA screenshot"""
+        pytest.importorskip('mss')
+
+        class Shot:
+            width, height = 8, 4
+            raw = bytearray(np.arange(8 * 4 * 4, dtype=np.uint8).tobytes())
+
+        class Grabber:
+            def grab(self, monitor):
+                return Shot()
+
+            def close(self):
+                pass
+
+        grabber = MssCapture((0, 0, 8, 4))
+        grabber._local.grabber = Grabber()
+
+        frame = grabber.grab()
+
+        bgra = np.frombuffer(Shot.raw, np.uint8).reshape(4, 8, 4)
+        np.testing.assert_array_equal(frame, bgra[..., :3])
+
+
+class TestOpenCapture:
+    """Tests for backend selection"""
+
+    def test_auto_falls_back_to_pil(self, monkeypatch):
+        """Test that 'auto' uses PIL when mss is not installed"""
+        def missing():
+            raise ImportError('no mss')
+
+        monkeypatch.setattr(capture, '_import_mss', missing)
+
+        assert isinstance(open_capture((0, 0, 10, 10)), PILCapture)
+        with pytest.raises(ImportError):
+            open_capture((0, 0, 10, 10), backend='mss')
+
+    def test_invalid_arguments(self):
+        """Test that unknown backends and empty regions are rejected"""
+        with pytest.raises(ValueError):
+            open_capture((0, 0, 10, 10), backend='x11')
+        with pytest.raises(ValueError):
+            open_capture((10, 0, 10, 10), backend='pil')
+        with pytest.raises(ValueError):
+            BrightnessTracker((0, 0, 10, 10), capture_backend='x11')
+
+    def test_tracker_grayscale_capture(self, screen):
+        """Test that grayscale frames go through the tracker unconverted"""
+        tracker = BrightnessTracker(
+            (0, 0, 64, 48), capture_backend='pil', grayscale_capture=True
+        )
+
+        frame = tracker.capture_frame()
+        result = tracker.find_brightest_point(tracker.preprocess_frame(frame))
+
+        assert frame.shape == (48, 64)
+        assert tracker.capture.name == 'pil'
+        assert 0 <= result['intensity'] <= 255
+
+
+class TestCaptureRing:
+    """Tests for CaptureRing class"""
+
+    def test_next_policy_keeps_order(self):
+        """Test that a fast consumer gets every frame in order"""
+        with CaptureRing(CountingCapture(), size=4, policy='next', max_fps=500) as ring:
+            frames = [ring.read(timeout=1.0) for _ in range(20)]
+            assert ring.dropped == 0
+
+        assert [f.sequence for f in frames] == list(range(20))
+        for f in frames:
+            assert (f.data == f.sequence % 256).all()
+
+    def test_newest_policy_counts_drops(self):
+        """Test that a slow consumer skips to the newest frame"""
+        with CaptureRing(CountingCapture(delay=0.001), size=3) as ring:
+            frames = []
+            for _ in range(10):
+                frames.append(ring.read(timeout=1.0))
+                time.sleep(0.01)
+            dropped = ring.dropped
+
+        sequences = [f.sequence for f in frames]
+        assert sequences == sorted(set(sequences))
+        assert dropped == sequences[-1] + 1 - len(frames) > 0
+        # Frames are never torn by the capture thread
+        for f in frames:
+            assert (f.data == f.sequence % 256).all()
+
+    def test_stats(self):
+        """Test latency and rate statistics"""
+        with CaptureRing(CountingCapture(), max_fps=200) as ring:
+            for _ in range(10):
+                ring.read(timeout=1.0)
+            time.sleep(0.05)
+        stats = ring.stats()
+
+        assert stats['delivered'] == 10
+        assert stats['captured'] >= 10
+        assert 50 < stats['capture_fps'] < 220
+        assert 0 <= stats['latency_ms'] <= stats['max_latency_ms']
+        assert stats['jitter_ms'] >= 0
+
+    def test_timeout_and_stop(self):
+        """Test waiting for frames and reading after stop"""
+        ring = CaptureRing(CountingCapture(), max_fps=2).start()
+        ring.read(timeout=1.0)
+        with pytest.raises(TimeoutError):
+            ring.read(timeout=0.05)
+        ring.stop()
+
+        with pytest.raises(RuntimeError):
+            ring.read(timeout=0.05)
+
+    def test_stop_counts_unread_frames(self):
+        """Test that frames never read by stop time count as dropped"""
+        ring = CaptureRing(CountingCapture(), policy='next', max_fps=200).start()
+        ring.read(timeout=1.0)
+        time.sleep(0.05)
+        ring.stop()
+        stats = ring.stats()
+
+        assert stats['captured'] > 1
+        assert stats['delivered'] == 1
+        assert stats['dropped'] == stats['captured'] - 1
+        assert stats['drop_rate'] == pytest.approx(1 - 1 / stats['captured'])
+        with pytest.raises(RuntimeError):
+            ring.read(timeout=0.05)
+        # Stopping again does not count the same frames twice
+        ring.stop()
+        assert ring.dropped == stats['dropped']
+
+    def test_capture_error(self):
+        """Test that backend failures reach the consumer"""
+        with CaptureRing(CountingCapture(fail_after=0)) as ring:
+            with pytest.raises(RuntimeError, match='capture failed'):
+                ring.read(timeout=1.0)
+
+    def test_invalid_arguments(self):
+        """Test that invalid sizes, policies and rates are rejected"""
+        with pytest.raises(ValueError):
+            CaptureRing(CountingCapture(), size=1)
+        with pytest.raises(ValueError):
+            CaptureRing(CountingCapture(), policy='oldest')
+        with pytest.raises(ValueError):
+            CaptureRing(CountingCapture(), max_fps=0)
+
+
+class TestLiveCapture:
+    """Tests for threaded capture in the trackers"""
+
+    @pytest.mark.parametrize('tracker_class', [
+        BrightnessTracker, EnhancedBrightnessTracker
+    ])
+    def test_tracker_capture_thread(self, screen, tracker_class):
+        """Test frames and counters from the tracker's capture thread"""
+        tracker = tracker_class((0, 0, 64, 48), capture_backend='pil')
+        tracker.start_capture(policy='next', max_fps=200)
+        try:
+            first = tracker.capture_frame()
+            second = tracker.capture_frame()
+            assert tracker.dropped_frames == 0
+        finally:
+            tracker.stop_capture()
+
+        assert first is not second
+        assert tracker.last_capture.sequence == 1
+        stats = tracker.capture_stats()
+        assert stats['delivered'] == 2
+        assert stats['delivered'] + stats['dropped'] == stats['captured']
+        # After stopping, frames are grabbed directly again
+        assert tracker.capture_frame().shape == first.shape
+
+    @pytest.mark.parametrize('tracker_class', [
+        BrightnessTracker, EnhancedBrightnessTracker
+    ])
+    def test_ring_shares_tracker_clock(self, screen, tracker_class):
+        """Test that the capture ring stamps frames with the tracker's clock"""
+        clock = AcquisitionClock()
+        tracker = tracker_class((0, 0, 64, 48), capture_backend='pil',
+                                clock=clock)
+        ring = tracker.start_capture(max_fps=200)
+        tracker.stop_capture()
+
+        assert ring.clock is clock
+        assert tracker_class((0, 0, 64, 48), capture_backend='pil').clock is None
@@ -0,0 +1,135 @@
+"""
+Unit tests for the FluoTrack command-line interface.
+"""
+
+import subprocess
+import sys
+import time
+import pytest
+import numpy as np
+import pandas as pd
+from fluotrack.analysis import BrightnessAnalyzer
+from fluotrack.cli import benchmark, main, make_tracker, track_file, track_files
+from fluotrack.sources import SyntheticSource
+
+
+@pytest.fixture
+def image_dir(tmp_path):
+    """Directory of 16-bit frames from a synthetic movie"""
+    cv2 = pytest.importorskip('cv2')
+    directory = tmp_path / 'frames'
+    directory.mkdir()
+    for frame in SyntheticSource(n_frames=20, shape=(64, 64), n_spots=3, seed=0):
+        cv2.imwrite(str(directory / f'frame_{frame.index:03d}.tif'), frame.data)
+    return directory
+
+
+class TestTrack:
+    """Tests for the track command"""
+
+    def test_brightest_point_log(self, image_dir, tmp_path):
+        """Test that every frame is logged with its frame time"""
+        row = track_file(image_dir, tmp_path / 'out', frame_interval=0.5)
+
+        assert row['status'] == 'ok'
+        assert row['frames'] == row['rows'] == 20
+        data = pd.read_csv(row['output'])
+        assert data['frame_number'].tolist() == list(range(1, 21))
+        assert data['timestamp'].diff().iloc[1] == 500_000_000
+        assert 'brightness_log_frames' in row['output']
+
+    def test_timestamps_are_anchored(self):
+        """Test that frame times are offset from the acquisition start"""
+        frames = list(SyntheticSource(n_frames=2, shape=(32, 32), seed=0))
+        start = time.time_ns()
+
+        step = make_tracker('basic', (32, 32))
+        anchored = make_tracker('basic', (32, 32), epoch_ns=10**18)
+
+        assert step(frames[0])[0][0]['timestamp'] >= start
+        assert (anchored(frames[1])[0][0]['timestamp']
+                == 10**18 + round(frames[1].timestamp * 1e9))
+
+    @pytest.mark.parametrize('tracker', ['enhanced', 'multi'])
+    def test_other_trackers(self, image_dir, tmp_path, tracker):
+        """Test the enhanced and multi-target trackers"""
+        row = track_file(image_dir, tmp_path, tracker=tracker, prefetch=0)
+
+        assert row['status'] == 'ok'
+        assert row['rows'] >= 20
+        if tracker == 'multi':
+            notes = pd.read_csv(row['output'])['notes']
+            assert notes.str.startswith('track_').all()
+
+    def test_logs_are_analyzable(self, image_dir, tmp_path):
+        """Test that tracked logs load in BrightnessAnalyzer"""
+        pytest.importorskip('pyarrow')
+        row = track_file(image_dir, tmp_path, file_format='parquet')
+
+        analyzer = BrightnessAnalyzer(row['output'])
+
+        assert analyzer.compute_statistics()['total_frames'] == 20
+
+    def test_errors_are_reported(self, tmp_path):
+        """Test that an unreadable input gives an error row"""
+        row = track_file(tmp_path / 'missing.avi', tmp_path)
+
+        assert row['status'] == 'error'
+        assert row['frames'] == 0
+
+    def test_parallel_inputs(self, image_dir, tmp_path):
+        """Test that results come back in input order with worker processes"""
+        rows = track_files(
+            [image_dir, tmp_path / 'missing.avi'], n_workers=2, progress=False,
+            output_dir=tmp_path / 'out',
+        )
+
+        assert [r['status'] for r in rows] == ['ok', 'error']
+
+    def test_invalid_tracker(self):
+        """Test that unknown trackers are rejected"""
+        with pytest.raises(ValueError):
+            make_tracker('fancy', (64, 64))
+
+
+class TestCommands:
+    """Tests for the fluotrack entry point"""
+
+    def test_track_command(self, image_dir, tmp_path):
+        """Test the track subcommand"""
+        status = main(['track', str(image_dir), '-o', str(tmp_path), '-q'])
+
+        assert status == 0
+        assert len(list(tmp_path.glob('brightness_log_frames_*.csv'))) == 1
+
+    def test_missing_input(self, tmp_path):
+        """Test that missing inputs fail before tracking"""
+        assert main(['track', str(tmp_path / 'missing.tif')]) == 2
+
+    def test_analyze_command(self, image_dir, tmp_path):
+        """Test that analyze runs the batch analysis on tracked logs"""
+        main(['track', str(image_dir), '-o', str(tmp_path), '-q'])
+        summary_file = tmp_path / 'summary.csv'
+
+        status = main(['analyze', str(tmp_path), '-o', str(summary_file), '-j', '1'])
+
+        assert status == 0
+        assert pd.read_csv(summary_file)['n_records'].tolist() == [20]
+
+    def test_benchmark(self):
+        """Test that the benchmark reports every stage"""
+        results = benchmark(['basic', 'multi'], n_frames=5, shape=(64, 64))
+
+        assert [r['tracker'] for r in results] == ['basic', 'multi']
+        assert all(np.isfinite(r['track_fps']) for r in results)
+        assert main(['bench', '-t', 'basic', '-n', '3', '--size', '32', '32']) == 0
+
+    def test_no_tkinter(self):
+        """Test that the headless interface never imports tkinter"""
+        code = (
+            'import sys, fluotrack, fluotrack.cli; '
+            'sys.exit("tkinter" in sys.modules)'
+        )
+        result = subprocess.run([sys.executable, '-c', code])
+
+        assert result.returncode == 0
@@ -0,0 +1,45 @@
+"""
+Unit tests for FluoTrack acquisition clock.
+"""
+
+import pytest
+import numpy as np
+from datetime import datetime
+from fluotrack.clock import (
+    AcquisitionClock,
+    resolve_clock,
+    to_datetime,
+    to_isoformat,
+)
+
+
+class TestAcquisitionClock:
+    """Tests for AcquisitionClock and timestamp conversion"""
+
+    def test_monotonic_integer_nanoseconds(self):
+        """Test that timestamps are increasing epoch nanoseconds"""
+        clock = AcquisitionClock()
+
+        stamps = [clock.now() for _ in range(100)]
+
+        assert all(isinstance(t, int) for t in stamps)
+        assert stamps == sorted(stamps)
+        assert abs(stamps[0] / 1e9 - datetime.now().timestamp()) < 5
+
+    def test_isoformat_round_trip(self):
+        """Test conversion to local datetimes at export"""
+        moment = datetime(2025, 1, 17, 12, 30, 15, 250000)
+        ns = int(moment.timestamp()) * 1_000_000_000 + 250_000_000
+
+        assert to_isoformat(ns) == '2025-01-17T12:30:15.250000'
+        assert to_datetime(np.array([ns]))[0] == np.datetime64(moment, 'ns')
+
+    def test_resolve_clock(self):
+        """Test clock option resolution"""
+        clock = AcquisitionClock()
+
+        assert isinstance(resolve_clock('wall')(), str)
+        assert isinstance(resolve_clock('monotonic')(), int)
+        assert resolve_clock(clock) == clock.now
+        with pytest.raises(ValueError):
+            resolve_clock('utc')
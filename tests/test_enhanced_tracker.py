@@ -0,0 +1,595 @@
+"""
+Unit tests for FluoTrack multi-target tracking module.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+import numpy as np
+from fluotrack.enhanced_tracker import (
+    AdaptiveSpotDetector,
+    EnhancedFluoTracker,
+    MultiTargetTracker,
+)
+from fluotrack.matching import connected_components, gated_assignment
+from fluotrack.track_store import FluorescentSpot, TrackAccumulators, TrackStore
+from fluotrack.tracker_enhanced import BatchKalmanFilter, EnhancedBrightnessTracker
+
+
+def make_spots(locations, intensity=200.0, area=20):
+    """Build detector-style spot dicts from a list of (x, y) locations"""
+    return [
+        {'location': loc, 'intensity': intensity, 'area': area}
+        for loc in locations
+    ]
+
+
+def history_statistics(track):
+    """Recompute track statistics from a TrackView of its whole history"""
+    if len(track) < 2:
+        return {
+            'duration': 1,
+            'mean_intensity': float(track.intensity[0]),
+            'intensity_trend': 0.0,
+            'total_displacement': 0.0,
+            'mean_velocity': 0.0,
+            'is_photobleaching': False,
+        }
+
+    trend = np.polyfit(np.arange(len(track)), track.intensity, 1)[0]
+    distances = np.hypot(np.diff(track.x), np.diff(track.y))
+    return {
+        'duration': len(track),
+        'mean_intensity': float(np.mean(track.intensity)),
+        'intensity_trend': float(trend),
+        'total_displacement': float(np.sum(distances)),
+        'mean_velocity': float(np.mean(distances)),
+        'is_photobleaching': trend < -0.5,
+    }
+
+
+def make_frame(locations, size=128, background=20, value=200, radius=3):
+    """Build a uint8 frame with square spots centred on (x, y) locations"""
+    frame = np.full((size, size), background, dtype=np.uint8)
+    for x, y in locations:
+        frame[y - radius:y + radius + 1, x - radius:x + radius + 1] = value
+        frame[y, x] = value + 40
+    return frame
+
+
+class TestAdaptiveSpotDetector:
+    """Tests for AdaptiveSpotDetector engines"""
+
+    def test_engines_agree(self):
+        """Test that both engines find the same spots and peaks"""
+        frame = make_frame([(20, 30), (60, 90), (100, 40)])
+
+        contours = AdaptiveSpotDetector(min_spot_area=10, denoising=False)
+        components = AdaptiveSpotDetector(min_spot_area=10, denoising=False,
+                                          engine='components')
+        expected = sorted(contours.detect_spots(frame), key=lambda s: s['location'])
+        found = sorted(components.detect_spots(frame), key=lambda s: s['location'])
+
+        assert len(found) == len(expected) == 3
+        for a, b in zip(expected, found):
+            assert a['location'] == b['location']
+            assert a['max_intensity'] == b['max_intensity']
+            assert a['bbox'] == b['bbox']
+            assert a['intensity'] == pytest.approx(b['intensity'])
+
+    def test_components_area_filter(self):
+        """Test that the components engine filters by pixel count"""
+        # Opening trims the corners of a 7x7 square to 45 pixels
+        frame = make_frame([(20, 30), (60, 90)])
+        frame[100:103, 100:103] = 240
+
+        detector = AdaptiveSpotDetector(min_spot_area=20, denoising=False,
+                                        engine='components')
+        spots = detector.detect_spots(frame)
+
+        assert sorted(s['location'] for s in spots) == [(20, 30), (60, 90)]
+        assert all(s['area'] == 45 for s in spots)
+
+    def test_native_dtypes(self):
+        """Test that uint16 and float32 frames are detected without conversion"""
+        frame = make_frame([(20, 30), (60, 90), (100, 40)])
+
+        for engine in ('contours', 'components'):
+            detector = AdaptiveSpotDetector(min_spot_area=10, engine=engine)
+            expected = sorted(s['location'] for s in detector.detect_spots(frame))
+
+            for native in (frame.astype(np.uint16) * 16,
+                           frame.astype(np.float32) / 255):
+                spots = detector.detect_spots(native)
+                assert sorted(s['location'] for s in spots) == expected
+
+    def test_histogram_threshold_matches_median(self):
+        """Test that the histogram threshold equals the np.median one"""
+        rng = np.random.default_rng(0)
+        detector = AdaptiveSpotDetector(sensitivity=2.0)
+
+        for dtype in (np.uint8, np.uint16):
+            for shape in ((1, 1), (4, 5), (64, 64), (99, 101)):
+                frame = rng.poisson(30, size=shape).astype(dtype)
+                median = np.median(frame)
+                mad = np.median(np.abs(frame - median))
+
+                expected = median + 2.0 * 1.4826 * mad
+                assert detector._calculate_adaptive_threshold(frame) == expected
+
+    def test_threshold_reuse(self):
+        """Test that a stable background reuses the previous threshold"""
+        rng = np.random.default_rng(1)
+        detector = AdaptiveSpotDetector(threshold_reuse_tolerance=0.5)
+
+        first = detector._calculate_adaptive_threshold(
+            rng.poisson(100, size=(256, 256)).astype(np.uint16))
+        second = detector._calculate_adaptive_threshold(
+            rng.poisson(100, size=(256, 256)).astype(np.uint16))
+        brighter = detector._calculate_adaptive_threshold(
+            rng.poisson(300, size=(256, 256)).astype(np.uint16))
+
+        assert second == first
+        assert brighter > first + 100
+
+    def test_invalid_engine(self):
+        """Test that an unknown engine is rejected"""
+        with pytest.raises(ValueError):
+            AdaptiveSpotDetector(engine='blobs')
+
+
+class TestGatedAssignment:
+    """Tests for gated track-to-spot assignment"""
+
+    def test_matches_nearest_spots(self):
+        """Test that each track is assigned to its nearest spot"""
+        tracks = np.array([[10, 10], [100, 100], [200, 50]], dtype=float)
+        spots = np.array([[201, 52], [12, 9], [98, 103]], dtype=float)
+
+        rows, cols = gated_assignment(tracks, spots, max_distance=10.0)
+
+        assert dict(zip(rows.tolist(), cols.tolist())) == {0: 1, 1: 2, 2: 0}
+
+    def test_rejects_pairs_beyond_gate(self):
+        """Test that pairs farther than max_distance are never matched"""
+        tracks = np.array([[0, 0]], dtype=float)
+        spots = np.array([[30, 40]], dtype=float)
+
+        rows, cols = gated_assignment(tracks, spots, max_distance=49.0)
+        assert len(rows) == 0
+
+        rows, cols = gated_assignment(tracks, spots, max_distance=50.0)
+        assert rows.tolist() == [0]
+        assert cols.tolist() == [0]
+
+    def test_keeps_feasible_matches(self):
+        """Test that a far pair cannot block a feasible match"""
+        # A dense solve pairs track 0 with spot 1 and track 1 with spot 0
+        # (40 + 46 < 4 + 90), which leaves both pairs out of range.
+        tracks = np.array([[0, 0], [50, 0]], dtype=float)
+        spots = np.array([[4, 0], [-40, 0]], dtype=float)
+
+        rows, cols = gated_assignment(tracks, spots, max_distance=10.0)
+
+        assert rows.tolist() == [0]
+        assert cols.tolist() == [0]
+
+    def test_connected_components(self):
+        """Test that candidate pairs split into independent components"""
+        rows = np.array([0, 0, 1, 5])
+        cols = np.array([3, 4, 4, 9])
+
+        labels, _, _ = connected_components(rows, cols)
+
+        assert labels[0] == labels[1] == labels[2]
+        assert labels[3] != labels[0]
+
+    def test_thread_pool_matches_serial(self):
+        """Test that solving components on a thread pool gives the same result"""
+        rng = np.random.default_rng(0)
+        tracks = rng.uniform(0, 500, size=(300, 2))
+        spots = tracks + rng.normal(0, 3, size=tracks.shape)
+
+        serial = gated_assignment(tracks, spots, max_distance=15.0)
+        threaded = gated_assignment(tracks, spots, max_distance=15.0, n_workers=4)
+
+        assert np.array_equal(serial[0], threaded[0])
+        assert np.array_equal(serial[1], threaded[1])
+        assert len(serial[0]) == 300
+
+    def test_empty_inputs(self):
+        """Test assignment with no tracks or no spots"""
+        rows, cols = gated_assignment(
+            np.empty((0, 2)), np.array([[1.0, 2.0]]), max_distance=10.0
+        )
+        assert len(rows) == 0 and len(cols) == 0
+
+
+class TestTrackStore:
+    """Tests for columnar TrackStore"""
+
+    def test_append_across_chunks(self):
+        """Test that appends spanning several chunks keep every row"""
+        store = TrackStore(chunk_size=4)
+
+        store.append([0, 1, 0], [1, 1, 2], [1, 2, 3], [4, 5, 6],
+                     [10.0, 20.0, 30.0], [5, 6, 7])
+        store.append([1, 0, 1, 0, 1], [2, 3, 3, 4, 4], [7, 8, 9, 10, 11],
+                     [0, 0, 0, 0, 0], [1.0, 2.0, 3.0, 4.0, 5.0], [1, 1, 1, 1, 1])
+
+        assert len(store) == 8
+        assert store.column('x').tolist() == [1, 2, 3, 7, 8, 9, 10, 11]
+        assert store.track_ids().tolist() == [0, 1]
+
+    def test_track_view_columns(self):
+        """Test that per-track views keep frame order"""
+        store = TrackStore(chunk_size=2)
+        store.append([0, 1, 0, 0], [1, 1, 2, 3], [1, 2, 3, 4], [0, 0, 0, 0],
+                     [10.0, 20.0, 30.0, 40.0], [5, 5, 5, 5])
+
+        track = store.get_track(0)
+
+        assert len(track) == 3
+        assert track.frame.tolist() == [1, 2, 3]
+        assert track.intensity.tolist() == [10.0, 30.0, 40.0]
+        assert track.locations.tolist() == [[1, 0], [3, 0], [4, 0]]
+        assert store.get_track(5) is None
+
+    def test_padded_export(self):
+        """Test the NaN-padded per-track export"""
+        store = TrackStore(chunk_size=2)
+        store.append([1, 0, 1, 1], [1, 1, 2, 3], [1, 2, 3, 4], [0, 0, 0, 0],
+                     [10.0, 20.0, 30.0, 40.0], [5, 5, 5, 5])
+
+        ids, frames, values = store.padded('intensity')
+
+        assert ids.tolist() == [0, 1]
+        np.testing.assert_array_equal(
+            frames, [[1, np.nan, np.nan], [1, 2, 3]]
+        )
+        np.testing.assert_array_equal(
+            values, [[20.0, np.nan, np.nan], [10.0, 30.0, 40.0]]
+        )
+
+    def test_view_yields_spots(self):
+        """Test that views lazily build FluorescentSpot objects"""
+        store = TrackStore()
+        store.set_timestamp(1, 't1')
+        store.append([7], [1], [12], [34], [99.5], [15])
+
+        spots = list(store.get_track(7))
+
+        assert spots == [FluorescentSpot(id=7, location=(12, 34), intensity=99.5,
+                                         area=15, frame_number=1, timestamp='t1')]
+
+    def test_view_slicing(self):
+        """Test that slicing a view returns a list of spots"""
+        store = TrackStore()
+        store.append([0, 0, 0], [1, 2, 3], [1, 2, 3], [0, 0, 0],
+                     [10.0, 20.0, 30.0], [5, 5, 5])
+        track = store.get_track(0)
+
+        assert [spot.frame_number for spot in track[:2]] == [1, 2]
+        assert [spot.intensity for spot in track[::-2]] == [30.0, 10.0]
+        assert track[-1].frame_number == 3
+        assert track[5:] == []
+
+
+class TestTrackAccumulators:
+    """Tests for running per-track statistics"""
+
+    def test_statistics_match_history(self):
+        """Test that running statistics equal a recomputation from history"""
+        rng = np.random.default_rng(3)
+        store = TrackStore()
+        accumulators = TrackAccumulators()
+        for frame in range(40):
+            ids = rng.choice(100, size=30, replace=False)
+            x = rng.integers(0, 500, 30)
+            y = rng.integers(0, 500, 30)
+            intensity = rng.uniform(50, 250, 30)
+            store.append(ids, np.full(30, frame), x, y, intensity, np.ones(30))
+            accumulators.update(ids, x, y, intensity)
+
+        for track in store.iter_tracks():
+            expected = history_statistics(track)
+            stats = accumulators.statistics(track.track_id)
+            assert stats.keys() == expected.keys()
+            for key, value in expected.items():
+                assert stats[key] == pytest.approx(value, rel=1e-9, abs=1e-9)
+
+    def test_release(self):
+        """Test that released tracks free their rows and keep the rest"""
+        accumulators = TrackAccumulators()
+        accumulators.update([5, 2, 9], [0, 0, 0], [0, 0, 0], [10.0, 20.0, 30.0])
+        accumulators.update([5, 9], [3, 0], [4, 0], [12.0, 30.0])
+        expected = accumulators.statistics(9)
+
+        final = accumulators.release([5, 2, 7])
+
+        assert final['track_id'].tolist() == [2, 5]
+        assert final['total_displacement'].tolist() == [0.0, 5.0]
+        assert len(accumulators) == 1
+        assert 5 not in accumulators
+        assert accumulators.statistics(9) == expected
+        accumulators.update([9, 4], [0, 1], [0, 1], [30.0, 40.0])
+        assert accumulators.population()['track_id'].tolist() == [4, 9]
+
+    def test_population_columns(self):
+        """Test per-track columns over observed ids only"""
+        accumulators = TrackAccumulators()
+        accumulators.update([0, 3], [0, 10], [0, 10], [100.0, 50.0])
+        accumulators.update([0], [3], [4], [90.0])
+
+        population = accumulators.population()
+
+        assert population['track_id'].tolist() == [0, 3]
+        assert population['duration'].tolist() == [2, 1]
+        assert population['mean_velocity'].tolist() == [5.0, 0.0]
+        assert population['intensity_trend'].tolist() == [-10.0, 0.0]
+        assert 1 not in accumulators
+        assert accumulators.statistics(1) == {}
+
+
+class TestBatchKalmanFilter:
+    """Tests for BatchKalmanFilter class"""
+
+    def test_predicts_constant_velocity(self):
+        """Test that predictions converge to constant-velocity motion"""
+        kf = BatchKalmanFilter()
+        kf.add([[0, 0], [100, 100]])
+
+        for i in range(1, 20):
+            kf.predict()
+            kf.update([0, 1], [[3 * i, 0], [100, 100 - 2 * i]])
+
+        predicted = kf.predict()
+
+        assert predicted[0] == pytest.approx([60, 0], abs=0.5)
+        assert predicted[1] == pytest.approx([100, 60], abs=0.5)
+
+    def test_add_and_remove_rows(self):
+        """Test adding and removing filtered objects"""
+        kf = BatchKalmanFilter()
+
+        assert kf.add([[1, 2], [3, 4]]).tolist() == [0, 1]
+        assert kf.add([[5, 6]]).tolist() == [2]
+
+        kf.remove([1])
+
+        assert len(kf) == 2
+        assert kf.positions.tolist() == [[1, 2], [5, 6]]
+
+
+class TestEnhancedBrightnessTracker:
+    """Tests for EnhancedBrightnessTracker with high bit-depth frames"""
+
+    def test_min_intensity_follows_bit_depth(self):
+        """Test that the spot cutoff scales with the sensor bit depth"""
+        frame = make_frame([(20, 30), (60, 90)]).astype(np.uint16) * 16
+
+        tracker = EnhancedBrightnessTracker(
+            (0, 0, 128, 128), use_kalman=False, use_adaptive_bg=False,
+            denoising=False, bit_depth=12)
+        spots = tracker.find_multiple_spots(frame)
+
+        assert sorted(s['location'] for s in spots) == [(20, 30), (60, 90)]
+        assert spots[0]['intensity'] == 240 * 16
+
+        # Against the 16-bit range, 12-bit spots fall below 50/255 of scale
+        tracker = EnhancedBrightnessTracker(
+            (0, 0, 128, 128), use_kalman=False, use_adaptive_bg=False)
+        assert tracker.find_multiple_spots(frame) == []
+
+
+class TestMultiTargetTracker:
+    """Tests for MultiTargetTracker class"""
+
+    def test_first_frame_creates_tracks(self):
+        """Test that every spot in the first frame gets a new ID"""
+        tracker = MultiTargetTracker(max_distance=20.0)
+
+        tracked = tracker.update(make_spots([(10, 10), (50, 50)]), 't0')
+
+        assert [s.id for s in tracked] == [0, 1]
+        assert tracker.next_id == 2
+
+    def test_ids_follow_moving_spots(self):
+        """Test that IDs stay with spots as they move"""
+        tracker = MultiTargetTracker(max_distance=20.0)
+
+        tracker.update(make_spots([(10, 10), (100, 100)]), 't0')
+        tracked = tracker.update(make_spots([(103, 98), (14, 12)]), 't1')
+
+        ids = {s.location: s.id for s in tracked}
+        assert ids == {(14, 12): 0, (103, 98): 1}
+
+    def test_new_spot_gets_new_id(self):
+        """Test that an unmatched spot starts a new track"""
+        tracker = MultiTargetTracker(max_distance=20.0)
+
+        tracker.update(make_spots([(10, 10)]), 't0')
+        tracked = tracker.update(make_spots([(11, 10), (200, 200)]), 't1')
+
+        ids = {s.location: s.id for s in tracked}
+        assert ids == {(11, 10): 0, (200, 200): 1}
+
+    def test_stale_tracks_removed(self):
+        """Test that tracks unseen for more than 5 frames are dropped"""
+        tracker = MultiTargetTracker(max_distance=20.0)
+
+        tracker.update(make_spots([(10, 10), (100, 100)]), 't0')
+        for i in range(6):
+            tracker.update(make_spots([(10, 10)]), f't{i + 1}')
+
+        assert list(tracker.active_tracks) == [0]
+        assert len(tracker.track_history[1]) == 1
+
+    def test_track_statistics(self):
+        """Test per-track statistics for a bleaching, moving spot"""
+        tracker = MultiTargetTracker(max_distance=20.0)
+
+        for i in range(10):
+            spots = make_spots([(10 + 3 * i, 10 + 4 * i)], intensity=200.0 - 2 * i)
+            tracker.update(spots, f't{i}')
+
+        stats = tracker.get_track_statistics(0)
+
+        assert stats['duration'] == 10
+        assert stats['intensity_trend'] == pytest.approx(-2.0)
+        assert stats['total_displacement'] == pytest.approx(45.0)
+        assert stats['mean_velocity'] == pytest.approx(5.0)
+        assert stats['is_photobleaching']
+
+    def test_kalman_prediction_keeps_id(self):
+        """Test that motion prediction avoids an ID switch to a trailing spot"""
+        results = {}
+        for use_kalman in (False, True):
+            tracker = MultiTargetTracker(max_distance=8.0, use_kalman=use_kalman)
+            for i in range(12):
+                # Spot moving 6 px/frame; from frame 8 a second spot
+                # trails one pixel ahead of its previous position
+                locations = [(10 + 6 * i, 50)]
+                if i >= 8:
+                    locations.append((5 + 6 * i, 50))
+                tracked = tracker.update(make_spots(locations), f't{i}')
+            results[use_kalman] = {s.location: s.id for s in tracked}
+
+        assert results[False][(76, 50)] != 0
+        assert results[True][(76, 50)] == 0
+
+    def test_track_history_view(self):
+        """Test that track history reads back from the columnar store"""
+        tracker = MultiTargetTracker(max_distance=20.0)
+
+        tracker.update(make_spots([(10, 10), (50, 50)]), 't0')
+        tracker.update(make_spots([(12, 10)]), 't1')
+
+        history = tracker.track_history
+
+        assert sorted(history) == [0, 1]
+        assert [s.location for s in history[0]] == [(10, 10), (12, 10)]
+        assert [s.timestamp for s in history[0]] == ['t0', 't1']
+        assert 5 not in history
+
+    def test_spill_finished_tracks(self, tmp_path):
+        """Test that finished tracks move to disk and stay readable"""
+        bounded = MultiTargetTracker(
+            max_distance=5.0, memory_budget=20, spill_dir=str(tmp_path)
+        )
+        unbounded = MultiTargetTracker(max_distance=5.0)
+
+        # A new, short-lived spot appears every 3 frames
+        for i in range(60):
+            locations = [(20 * (i // 3) + 50, 50)]
+            for tracker in (bounded, unbounded):
+                tracker.update(make_spots(locations, intensity=100.0 + i), f't{i}')
+
+        # Budget plus rows of tracks that are still active
+        assert len(bounded.tracks) <= 20 + 9
+        assert len(bounded.spill) > 0
+        assert list(tmp_path.glob('tracks_*.npz'))
+
+        # Running statistics of spilled tracks are written out with them
+        assert len(bounded.track_stats) < len(unbounded.track_stats) == 20
+        population = bounded.track_population()
+        order = np.argsort(population['track_id'])
+        for name, column in unbounded.track_population().items():
+            np.testing.assert_array_equal(population[name][order], column)
+
+        assert sorted(bounded.track_history) == sorted(unbounded.track_history)
+        for track_id in unbounded.track_history:
+            assert (bounded.get_track_statistics(track_id)
+                    == unbounded.get_track_statistics(track_id))
+            assert (list(bounded.track_history[track_id])
+                    == list(unbounded.track_history[track_id]))
+
+        # The padded export fills in spilled chunks one at a time
+        for expected, actual in zip(unbounded.track_history.padded(),
+                                    bounded.track_history.padded()):
+            np.testing.assert_array_equal(actual, expected)
+
+    def test_spill_in_batches(self, tmp_path):
+        """Test that long active tracks do not cause a spill every frame"""
+        tracker = MultiTargetTracker(
+            max_distance=5.0, memory_budget=40, spill_dir=str(tmp_path)
+        )
+        # Three persistent spots outgrow the budget; a short-lived
+        # spot finishes every 3 frames
+        for i in range(200):
+            locations = [(10, 10), (10, 30), (10, 50), (20 * (i // 3) + 50, 90)]
+            tracker.update(make_spots(locations), f't{i}')
+
+        # At most one chunk per half budget of new rows
+        assert 0 < len(list(tmp_path.glob('tracks_*.npz'))) <= 800 // 20
+        assert len(tracker.spill) + len(tracker.tracks) == 800
+
+    def test_spill_datetime_timestamps(self, tmp_path):
+        """Test that spilled tracks keep datetime timestamps"""
+        tracker = EnhancedFluoTracker(
+            max_tracking_distance=5.0, memory_budget=5, spill_dir=str(tmp_path)
+        )
+        start = datetime(2024, 5, 1, 12, 0, 0)
+        times = [start + timedelta(milliseconds=50 * i) for i in range(60)]
+        for i, time in enumerate(times):
+            locations = [(20 * (i // 3) + 20, 60)]
+            tracker.process_frame(make_frame(locations, size=448), time)
+
+        spill = tracker.tracker.spill
+        track_id = int(spill.track_ids()[0])
+        track = spill.get_track(track_id)
+
+        assert len(spill) > 0
+        assert all(isinstance(s.timestamp, datetime) for s in track)
+        assert [s.timestamp for s in track] == times[3 * track_id:3 * track_id + 3]
+
+    def test_fit_bleaching_all_tracks(self, tmp_path):
+        """Test batch bleaching fits over spilled and in-memory tracks"""
+        tracker = MultiTargetTracker(
+            max_distance=5.0, memory_budget=20, spill_dir=str(tmp_path)
+        )
+        # Consecutive spots bleaching at 0.05 per frame, each seen 20 frames
+        for i in range(100):
+            age = i % 20
+            location = (20 * (i // 20) + 50, 50)
+            intensity = 400.0 * np.exp(-0.05 * age) + 50.0
+            tracker.update(make_spots([location], intensity=intensity), f't{i}')
+
+        fit = tracker.fit_bleaching()
+
+        assert len(tracker.spill) > 0
+        assert fit['track_id'].tolist() == [0, 1, 2, 3, 4]
+        np.testing.assert_allclose(fit['rate'], 0.05, rtol=1e-6)
+        np.testing.assert_allclose(fit['plateau'], 50.0, rtol=1e-6)
+        np.testing.assert_allclose(fit['start_time'], [1, 21, 41, 61, 81])
+
+
+class TestEnhancedFluoTracker:
+    """Tests for EnhancedFluoTracker class"""
+
+    def test_population_statistics(self):
+        """Test population statistics against per-track recomputation"""
+        tracker = EnhancedFluoTracker(max_tracking_distance=5.0)
+        for i in range(30):
+            locations = [(20, 20 + i), (80, 80), (20 * (i // 10) + 40, 120)]
+            spots = make_spots(locations)
+            spots[0]['intensity'] = 250.0 - 2 * i
+            tracker.tracker.update(spots, f't{i}')
+
+        stats = tracker.get_population_statistics()
+        expected = [
+            history_statistics(track)
+            for track in tracker.tracker.track_history.iter_tracks()
+        ]
+
+        assert stats['total_tracks'] == 5
+        assert stats['mean_intensity'] == pytest.approx(
+            np.mean([s['mean_intensity'] for s in expected])
+        )
+        assert stats['mean_velocity'] == pytest.approx(
+            np.mean([s['mean_velocity'] for s in expected])
+        )
+        assert stats['photobleaching_fraction'] == pytest.approx(1 / 5)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,95 @@
+"""
+Import-time tests: the package namespace is lazy and the trackers do not
+load the GUI, plotting or table libraries.
+"""
+
+import os
+import subprocess
+import sys
+import pytest
+import fluotrack
+
+HEAVY_MODULES = ['tkinter', 'matplotlib', 'pandas', 'scipy', 'openpyxl', 'PIL']
+
+
+def run_python(code, *options):
+    """Run code in a fresh interpreter and return its stdout and stderr"""
+    result = subprocess.run(
+        [sys.executable, *options, '-c', code],
+        capture_output=True, text=True, check=True,
+    )
+    return result.stdout, result.stderr
+
+
+def import_times(statement):
+    """Cumulative import time (us) per module from ``python -X importtime``"""
+    _, stderr = run_python(statement, '-X', 'importtime')
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestLazyImports:
+    """Tests for deferred imports"""
+
+    @pytest.mark.parametrize('module', [
+        'fluotrack', 'fluotrack.enhanced_tracker', 'fluotrack.tracker',
+        'fluotrack.tracker_enhanced', 'fluotrack.analysis', 'fluotrack.cli',
+        'fluotrack.batch', 'fluotrack.capture',
+    ])
+    def test_no_heavy_dependencies(self, module):
+        """Test that importing a module loads none of the heavy libraries"""
+        stdout, _ = run_python(
+            f'import sys, {module}; '
+            f'print(" ".join(m for m in {HEAVY_MODULES!r} if m in sys.modules))'
+        )
+
+        assert stdout.split() == []
+
+    @pytest.mark.skipif(
+        not os.environ.get('FLUOTRACK_BENCHMARK'),
+        reason='benchmark; set FLUOTRACK_BENCHMARK=1 to run',
+    )
+    def test_import_time_benchmark(self):
+        """Test that fluotrack's own import time is measured"""
+        # With numpy and OpenCV imported first, the cumulative time of the
+        # tracker module is what fluotrack itself adds
+        times = import_times('import numpy, cv2, fluotrack.enhanced_tracker')
+
+        assert times['fluotrack.enhanced_tracker'] > 0
+
+    def test_public_names(self):
+        """Test that public names and submodules resolve on access"""
+        from fluotrack.analysis import DataLogger
+        from fluotrack.enhanced_tracker import EnhancedFluoTracker
+
+        assert fluotrack.DataLogger is DataLogger
+        assert fluotrack.enhanced_tracker.EnhancedFluoTracker is EnhancedFluoTracker
+        assert 'BrightnessAnalyzer' in dir(fluotrack)
+        with pytest.raises(AttributeError):
+            fluotrack.missing_name
+
+        # Checked in a fresh interpreter, where no submodule is imported yet
+        stdout, _ = run_python(
+            'import fluotrack; '
+            'print(fluotrack.capture.__name__, fluotrack.sources.__name__)'
+        )
+        assert stdout.split() == ['fluotrack.capture', 'fluotrack.sources']
+
+    def test_heavy_dependencies_load_on_use(self, tmp_path):
+        """Test that analysis still works once its libraries are needed"""
+        from fluotrack.analysis import BrightnessAnalyzer
+
+        log = tmp_path / 'log.csv'
+        log.write_text(
+            'timestamp,frame_number,x,y,brightness,notes\n'
+            '0,1,5,5,100.0,\n1000000000,2,6,5,90.0,\n'
+        )
+
+        stats = BrightnessAnalyzer(log).compute_statistics()
+
+        assert stats['duration_seconds'] == 1.0
@@ -0,0 +1,140 @@
+"""
+Unit tests for the FluoTrack acquisition pipeline.
+"""
+
+import time
+import pytest
+from fluotrack.pipeline import AcquisitionPipeline
+
+
+def counter():
+    """Capture callable returning 0, 1, 2, ..."""
+    state = {'n': 0}
+
+    def capture():
+        state['n'] += 1
+        return state['n'] - 1
+
+    return capture
+
+
+class TestAcquisitionPipeline:
+    """Tests for AcquisitionPipeline class"""
+
+    def test_results_logged_in_order(self):
+        """Test that every captured frame is processed and logged in order"""
+        logged = []
+        pipeline = AcquisitionPipeline(
+            counter(), lambda frame: frame * 2, logged.append, max_frames=50
+        )
+
+        pipeline.run()
+
+        assert logged == [2 * i for i in range(50)]
+        assert pipeline.stats()['processed'] == 50
+
+    def test_stages_overlap(self):
+        """Test that throughput is bounded by the slowest stage, not the sum"""
+        delay = 0.01
+        capture = counter()
+
+        def slow_capture():
+            time.sleep(delay)
+            return capture()
+
+        def slow_process(frame):
+            time.sleep(delay)
+            return frame
+
+        def slow_log(result):
+            time.sleep(delay)
+
+        pipeline = AcquisitionPipeline(
+            slow_capture, slow_process, slow_log, max_frames=30
+        )
+        start = time.perf_counter()
+        pipeline.run()
+        elapsed = time.perf_counter() - start
+
+        # Sequential execution would take 3 * 30 * delay = 0.9 s
+        assert elapsed < 0.65
+        assert pipeline.logged == 30
+
+    def test_slow_display_does_not_block_tracking(self):
+        """Test that the display only sees the newest frames"""
+        shown = []
+
+        def display(frame, result):
+            time.sleep(0.02)
+            shown.append(frame)
+            return True
+
+        pipeline = AcquisitionPipeline(
+            counter(), lambda frame: frame, max_frames=2000, display_fps=1000
+        )
+        pipeline.run(display)
+
+        assert pipeline.processed == 2000
+        assert len(shown) < 2000
+        assert shown == sorted(shown)
+
+    def test_low_display_rate_is_capped(self):
+        """Test that refreshes stay under display_fps at low rates"""
+        capture = counter()
+
+        def slow_capture():
+            time.sleep(0.005)
+            return capture()
+
+        pipeline = AcquisitionPipeline(
+            slow_capture, lambda frame: frame, max_frames=100, display_fps=5
+        )
+        start = time.perf_counter()
+        pipeline.run(lambda frame, result: True)
+        elapsed = time.perf_counter() - start
+
+        assert pipeline.processed == 100
+        assert 1 <= pipeline.displayed <= elapsed * 5 + 1
+
+    def test_display_stops_acquisition(self):
+        """Test that a display returning False stops after draining"""
+        logged = []
+        pipeline = AcquisitionPipeline(
+            counter(), lambda frame: frame, logged.append, queue_size=2
+        )
+
+        pipeline.run(lambda frame, result: result < 5)
+
+        assert pipeline.captured >= 6
+        assert logged == list(range(pipeline.processed))
+
+    def test_stop_when(self):
+        """Test that the stop condition ends acquisition after logging"""
+        logged = []
+        pipeline = AcquisitionPipeline(
+            counter(), lambda frame: frame, logged.append,
+            stop_when=lambda result: result == 10,
+        )
+
+        pipeline.run()
+
+        assert logged[:11] == list(range(11))
+
+    def test_stage_error_is_raised(self):
+        """Test that a failing stage stops the pipeline and re-raises"""
+        def process(frame):
+            if frame == 3:
+                raise RuntimeError('detector failed')
+            return frame
+
+        pipeline = AcquisitionPipeline(counter(), process, lambda result: None)
+
+        with pytest.raises(RuntimeError, match='detector failed'):
+            pipeline.run(lambda frame, result: True)
+
+    def test_invalid_parameters(self):
+        """Test that invalid queue sizes and rates are rejected"""
+        with pytest.raises(ValueError):
+            AcquisitionPipeline(counter(), abs, queue_size=0)
+        with pytest.raises(ValueError):
+            AcquisitionPipeline(counter(), abs, display_fps=0)
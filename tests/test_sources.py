@@ -0,0 +1,157 @@
+"""
+Unit tests for FluoTrack frame sources.
+"""
+
+import pytest
+import numpy as np
+import cv2
+from fluotrack.sources import (
+    Frame,
+    ImageDirectorySource,
+    PrefetchingSource,
+    SyntheticSource,
+    TiffSource,
+    VideoSource,
+)
+
+
+class TestSyntheticSource:
+    """Tests for SyntheticSource class"""
+
+    def test_yields_frames_lazily(self):
+        """Test that iteration yields indexed, timestamped frames"""
+        source = SyntheticSource(n_frames=4, shape=(64, 80), seed=0,
+                                 frame_interval=0.5)
+
+        frames = list(source)
+
+        assert len(source) == 4
+        assert [f.index for f in frames] == [0, 1, 2, 3]
+        assert [f.timestamp for f in frames] == [0.0, 0.5, 1.0, 1.5]
+        assert frames[0].data.shape == (64, 80)
+        assert frames[0].data.dtype == np.uint16
+
+    def test_random_access_is_reproducible(self):
+        """Test that a frame is the same however it is reached"""
+        source = SyntheticSource(n_frames=10, seed=3)
+
+        frames = list(source)
+
+        assert np.array_equal(source.read(7).data, frames[7].data)
+        assert np.array_equal(source.read(-1).data, frames[9].data)
+        with pytest.raises(IndexError):
+            source.read(10)
+
+
+class TestImageDirectorySource:
+    """Tests for ImageDirectorySource class"""
+
+    def test_reads_16bit_files_in_order(self, tmp_path):
+        """Test that files are read in name order at native bit depth"""
+        for i in (2, 0, 1):
+            image = np.full((16, 24), 1000 * (i + 1), dtype=np.uint16)
+            cv2.imwrite(str(tmp_path / f'frame_{i:03d}.png'), image)
+
+        with ImageDirectorySource(tmp_path, pattern='*.png') as source:
+            frames = list(source)
+
+        assert len(frames) == 3
+        assert [int(f.data[0, 0]) for f in frames] == [1000, 2000, 3000]
+        assert frames[0].data.dtype == np.uint16
+
+    def test_unreadable_file(self, tmp_path):
+        """Test that a corrupt file raises IOError"""
+        (tmp_path / 'broken.tif').write_bytes(b'not an image')
+
+        source = ImageDirectorySource(tmp_path)
+
+        with pytest.raises(IOError):
+            source.read(0)
+
+
+class TestVideoSource:
+    """Tests for VideoSource class"""
+
+    def test_reads_grayscale_frames(self, tmp_path):
+        """Test sequential decoding with container timestamps"""
+        path = str(tmp_path / 'movie.avi')
+        writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'MJPG'), 10.0,
+                                 (32, 24), False)
+        if not writer.isOpened():
+            pytest.skip('MJPG writer not available')
+        for i in range(5):
+            writer.write(np.full((24, 32), 40 * i, dtype=np.uint8))
+        writer.release()
+
+        with VideoSource(path) as source:
+            frames = list(source)
+            seeked = source.read(3)
+
+        assert len(frames) == 5
+        assert frames[0].data.shape == (24, 32)
+        assert frames[2].timestamp == pytest.approx(0.2)
+        assert abs(int(frames[3].data.mean()) - 120) <= 2
+        assert np.array_equal(seeked.data, frames[3].data)
+
+    def test_missing_file(self, tmp_path):
+        """Test that a missing video raises IOError"""
+        with pytest.raises(IOError):
+            VideoSource(tmp_path / 'missing.avi')
+
+
+class TestPrefetchingSource:
+    """Tests for PrefetchingSource class"""
+
+    def test_keeps_frame_order(self):
+        """Test that prefetched frames arrive in order and unchanged"""
+        source = SyntheticSource(n_frames=25, shape=(32, 32), seed=5)
+
+        frames = list(PrefetchingSource(source, n_workers=4, depth=3))
+
+        assert [f.index for f in frames] == list(range(25))
+        for frame in frames:
+            assert np.array_equal(frame.data, source.read(frame.index).data)
+
+    def test_sequential_source(self):
+        """Test read-ahead of a source that cannot be read out of order"""
+        source = SyntheticSource(n_frames=10, shape=(16, 16), seed=1)
+        source.random_access = False
+
+        frames = list(PrefetchingSource(source, depth=2))
+
+        assert [f.index for f in frames] == list(range(10))
+
+    def test_propagates_read_errors(self, tmp_path):
+        """Test that a failed read is raised to the consumer"""
+        cv2.imwrite(str(tmp_path / 'a.tif'), np.zeros((8, 8), dtype=np.uint8))
+        (tmp_path / 'b.tif').write_bytes(b'not an image')
+
+        frames = iter(PrefetchingSource(ImageDirectorySource(tmp_path)))
+
+        assert next(frames).index == 0
+        with pytest.raises(IOError):
+            next(frames)
+
+    def test_invalid_depth(self):
+        """Test that a non-positive read-ahead depth is rejected"""
+        with pytest.raises(ValueError):
+            PrefetchingSource(SyntheticSource(n_frames=1), depth=0)
+
+
+class TestTiffSource:
+    """Tests for TiffSource class"""
+
+    def test_memory_mapped_stack(self, tmp_path):
+        """Test lazy reading of a (t, z, y, x) stack with z projection"""
+        tifffile = pytest.importorskip('tifffile')
+        stack = np.random.randint(0, 4096, (3, 2, 16, 16)).astype(np.uint16)
+        path = tmp_path / 'stack.tif'
+        tifffile.imwrite(str(path), stack)
+
+        with TiffSource(path, frame_interval=2.0) as source:
+            frames = list(source)
+
+        assert len(frames) == 3
+        assert isinstance(frames[1], Frame)
+        assert frames[1].timestamp == 2.0
+        assert np.array_equal(frames[1].data, stack[1].max(axis=0))
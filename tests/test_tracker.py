@@ -127,6 +127,45 @@ class TestBrightnessTracker:
             assert 'bbox' in region
             assert 'area' in region
             
+    def test_preprocess_keeps_uint16(self):
+        """Test that grayscale uint16 frames are not converted"""
+        tracker = BrightnessTracker((0, 0, 100, 100), denoising=False)
+        frame = np.random.randint(0, 4096, (100, 100), dtype=np.uint16)
+
+        gray = tracker.preprocess_frame(frame)
+
+        assert gray.dtype == np.uint16
+        assert np.array_equal(gray, frame)
+
+    def test_find_bright_regions_native_dtypes(self):
+        """Test that uint16 and float32 frames give the uint8 regions"""
+        tracker = BrightnessTracker((0, 0, 200, 200))
+
+        frame = np.zeros((200, 200), dtype=np.uint8)
+        frame[30:40, 30:40] = 200
+        frame[35, 35] = 255
+        frame[100:110, 100:110] = 150
+        frame[105, 105] = 180
+
+        expected = tracker.find_bright_regions(frame, min_area=50)
+        for native in (frame.astype(np.uint16) * 257, frame.astype(np.float32)):
+            regions = tracker.find_bright_regions(native, min_area=50)
+
+            assert ([r['location'] for r in regions]
+                    == [r['location'] for r in expected])
+            assert [r['bbox'] for r in regions] == [r['bbox'] for r in expected]
+
+    def test_monotonic_clock(self):
+        """Test integer nanosecond timestamps from the monotonic clock"""
+        tracker = BrightnessTracker((0, 0, 100, 100), clock='monotonic')
+        frame = np.zeros((100, 100), dtype=np.uint8)
+
+        first = tracker.find_brightest_point(frame)['timestamp']
+        second = tracker.find_brightest_point(frame)['timestamp']
+
+        assert isinstance(first, int)
+        assert second >= first
+
     def test_calculate_fps(self):
         """Test FPS calculation"""
         bbox = (0, 0, 100, 100)